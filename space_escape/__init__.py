@@ -0,0 +1,20 @@
+##############################################################
+###      S P A C E     E S C A P E  —  subsistemas         ###
+##############################################################
+# O jogo inteiro, em módulos que podem ser importados sem abrir
+# janela nem inicializar o PyGame:
+#   config       constantes (tela, fases, assets, velocidades)
+#   state        GameState e TickInput (só dados)
+#   simulation   regras do jogo, um tick por vez (e o modo headless)
+#   rules        troca de nível e vitória por pontuação; pacotes de fases
+#   sweep        colisão contínua (swept AABB) com tempo de impacto
+#   masks        colisão por pixel: máscaras dos sprites, só nos pares do sweep
+#   assets       imagens sob demanda, com cache em disco
+#   audio        efeitos pré-decodificados, canais por som, música em stream
+#   render       desenho da partida (GameView) e dirty_render
+#   background   fundos das fases em camadas (parallax), com limite de memória
+#   persistence  jogo salvo; leaderboard: high scores em SQLite
+#   menus        telas de início, introdução e fim de jogo
+#   env          API reset/step para bots (N ambientes juntos, obs sem cópia)
+#   telemetry    estado da partida em NDJSON por TCP (asyncio, em outra thread)
+#   game         main(): o jogo com janela (spaceScape.py chama ele)
@@ -0,0 +1,138 @@
+# ----------------------------------------------------------
+# 🖼️ ASSETS (carregamento sob demanda + cache em disco)
+# ----------------------------------------------------------
+# (os sons ficam em audio.py, com um cache equivalente de PCM)
+#
+# Cada imagem só é decodificada na primeira vez que alguém pede
+# (telas finais só no fim de jogo, fundo de uma fase só quando ela
+# começa) e fica guardada em memória depois disso.
+#
+# Além disso, a imagem já redimensionada é gravada em CACHE_DIR como
+# pixels crus (RGBA, ou RGB para imagens opacas). A chave inclui o
+# caminho, o mtime e o tamanho do arquivo original, o tamanho pedido e
+# se a imagem tem transparência, então trocar o PNG ou o tamanho
+# invalida o cache sozinho.
+#
+# alpha=False (fundos opacos) usa convert() em vez de convert_alpha():
+# a superfície fica no formato da tela, sem canal alfa, e o blit dela
+# vira uma cópia direta em vez de uma mistura pixel a pixel.
+# keep=False não guarda a imagem em memória (só no disco): quem pediu
+# decide quando ela some (ver background.py). Nas próximas execuções não é
+# preciso decodificar o PNG nem escalar: é só ler os bytes.
+#
+# `timings` registra quanto tempo cada asset levou e de onde veio,
+# e report() imprime esse resumo.
+
+import hashlib
+import os
+import struct
+import time
+
+import pygame
+
+from space_escape.config import ASSET_DIR, asset_path
+
+# junto dos assets, e não no diretório de onde o jogo foi chamado
+CACHE_DIR = os.path.join(ASSET_DIR, ".asset_cache")
+# mude quando o formato dos arquivos de cache mudar
+CACHE_VERSION = 1
+_HEADER = struct.Struct("<4sII")
+_MAGIC = b"SEIC"
+
+
+def write_bytes_atomic(path, data):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _convert(img, alpha):
+    # sem janela (headless, lote, replay, máscaras de colisão) não há
+    # formato de tela para converter: a imagem fica como foi lida
+    if pygame.display.get_surface() is None:
+        return img
+    return img.convert_alpha() if alpha else img.convert()
+
+
+class AssetManager:
+    def __init__(self, cache_dir=CACHE_DIR, use_cache=True):
+        self.cache_dir = cache_dir
+        self.use_cache = use_cache
+        self.images = {}
+        # (nome, tamanho, origem, milissegundos)
+        self.timings = []
+
+    # ------------------------------------------------------
+    # Imagens
+    # ------------------------------------------------------
+    def image(self, filename, fallback_color, size=None, alpha=True, keep=True):
+        key = (filename, size, alpha)
+        img = self.images.get(key)
+        if img is None:
+            start = time.perf_counter_ns()
+            img, source = self._load_image(filename, fallback_color, size, alpha)
+            self.timings.append((filename, size, source, (time.perf_counter_ns() - start) / 1e6))
+            if keep:
+                self.images[key] = img
+        return img
+
+    def _cache_path(self, filename, size, alpha, st):
+        ident = f"{CACHE_VERSION}|{os.path.abspath(filename)}|{st.st_mtime_ns}|{st.st_size}|{size}|{alpha}"
+        ext = ".rgba" if alpha else ".rgb"
+        return os.path.join(self.cache_dir, hashlib.sha1(ident.encode()).hexdigest() + ext)
+
+    def _load_image(self, filename, fallback_color, size, alpha):
+        filename = asset_path(filename)
+        if not os.path.exists(filename):
+            # Gera uma superfície simples colorida se a imagem não existir
+            surf = pygame.Surface(size or (50, 50))
+            surf.fill(fallback_color)
+            return surf, "fallback"
+
+        cache_path = None
+        if self.use_cache:
+            cache_path = self._cache_path(filename, size, alpha, os.stat(filename))
+            img = self._read_cache(cache_path, alpha)
+            if img is not None:
+                return img, "cache"
+
+        img = _convert(pygame.image.load(filename), alpha)
+        if size:
+            img = pygame.transform.scale(img, size)
+        if cache_path is not None:
+            self._write_cache(cache_path, img, alpha)
+        return img, "arquivo"
+
+    def _read_cache(self, path, alpha):
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        if len(data) < _HEADER.size:
+            return None
+        magic, w, h = _HEADER.unpack_from(data)
+        if magic != _MAGIC or len(data) != _HEADER.size + w * h * (4 if alpha else 3):
+            return None
+        return _convert(pygame.image.frombytes(data[_HEADER.size:], (w, h), "RGBA" if alpha else "RGB"), alpha)
+
+    def _write_cache(self, path, img, alpha):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            w, h = img.get_size()
+            pixels = pygame.image.tobytes(img, "RGBA" if alpha else "RGB")
+            write_bytes_atomic(path, _HEADER.pack(_MAGIC, w, h) + pixels)
+        except OSError:
+            # sem cache não é erro: só fica mais lento na próxima vez
+            pass
+
+    # ------------------------------------------------------
+    # Relatório de tempos
+    # ------------------------------------------------------
+    def report(self, title="Assets"):
+        total = sum(t[3] for t in self.timings)
+        print(f"{title}: {len(self.timings)} carregados em {total:.1f} ms")
+        for name, size, source, ms in self.timings:
+            dims = f" {size[0]}x{size[1]}" if size else ""
+            print(f"  {ms:8.1f} ms  {source:<8} {name}{dims}")
@@ -0,0 +1,132 @@
+# ----------------------------------------------------------
+# 🌀 ATLAS DE ROTAÇÃO DOS METEOROS
+# ----------------------------------------------------------
+# RotationAtlas gira o sprite N vezes uma única vez no carregamento
+# e cola todos os frames lado a lado numa só superfície. Para cada
+# frame guardamos o retângulo dele dentro do atlas e o deslocamento
+# que centraliza o frame girado (que é maior) sobre o rect de 40x40.
+#
+# SpriteBatch monta a lista que vai para Surface.blits() e a
+# reaproveita de um frame para o outro: cada item é
+# [atlas, rect de destino, área no atlas] e só os números são
+# atualizados, sem criar Rect novo por meteoro por frame.
+# Com `phases=True` cada meteoro começa a animação num frame
+# diferente, o que deixa muitos meteoros com cara menos uniforme.
+
+import pygame
+
+
+def swing_angles(frames, amplitude):
+    # onda triangular de -amplitude a +amplitude e de volta, com `frames`
+    # passos (8 frames de 10° dão [-10, -5, 0, 5, 10, 5, 0, -5])
+    if frames <= 1 or not amplitude:
+        return [0]
+    angles = []
+    for k in range(frames):
+        t = k / frames
+        if t <= 0.5:
+            angles.append(-amplitude + 4 * amplitude * t)
+        else:
+            angles.append(3 * amplitude - 4 * amplitude * t)
+    return angles
+
+
+def frame_phase(i, count, phases):
+    # deslocamento fixo da entidade i na animação, espalhado pelos frames
+    return (i * 5) % count if phases else 0
+
+
+class RotationAtlas:
+    def __init__(self, image, angles):
+        frames = [pygame.transform.rotate(image, ang) for ang in angles]
+        base_w, base_h = image.get_size()
+        cell_w = max(f.get_width() for f in frames)
+        cell_h = max(f.get_height() for f in frames)
+
+        self.surface = pygame.Surface((cell_w * len(frames), cell_h), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+        self.surface.fill((0, 0, 0, 0))
+        self.areas = []
+        self.offsets = []
+        for i, frame in enumerate(frames):
+            area = frame.get_rect(topleft=(i * cell_w, 0))
+            # BLEND_RGBA_MAX sobre o atlas zerado copia os pixels como estão
+            # (um blit normal misturaria a transparência com o preto)
+            self.surface.blit(frame, area, special_flags=pygame.BLEND_RGBA_MAX)
+            self.areas.append(area)
+            # centraliza o frame no rect (porque a imagem rotacionada pode ficar maior)
+            self.offsets.append((base_w // 2 - area.width // 2, base_h // 2 - area.height // 2))
+        self.count = len(frames)
+
+    def frame(self, index):
+        # frame isolado (subsurface do atlas), para quem precisar da Surface
+        return self.surface.subsurface(self.areas[index % self.count])
+
+
+class SpriteBatch:
+    def __init__(self, atlas, phases=False):
+        self.atlas = atlas
+        self.phases = phases
+        self.items = []
+        # fase de cada item (fica fora do item: blits() leria como special_flags)
+        self.item_phases = []
+
+    def _phase(self, i):
+        return frame_phase(i, self.atlas.count, self.phases)
+
+    def update(self, entities, anim_index, dy=0):
+        # devolve a lista de blits para `entities` (lista de Rect ou EntityStore),
+        # com todos deslocados `dy` pixels na vertical (interpolação). Sem
+        # isinstance(EntityStore): importar entities.py puxaria o NumPy
+        if not isinstance(entities, list):
+            return self._update_arrays(entities, anim_index, dy)
+
+        atlas = self.atlas
+        items = self.items
+        n = len(entities)
+        phases = self.item_phases
+        while len(items) < n:
+            phases.append(self._phase(len(items)))
+            items.append([atlas.surface, pygame.Rect(0, 0, 0, 0), atlas.areas[0]])
+        if len(items) > n:
+            del items[n:]
+            del phases[n:]
+
+        count = atlas.count
+        areas, offsets = atlas.areas, atlas.offsets
+        for item, phase, rect in zip(items, phases, entities):
+            k = (anim_index + phase) % count
+            item[2] = areas[k]
+            ox, oy = offsets[k]
+            dest = item[1]
+            dest.x = rect.x + ox
+            dest.y = rect.y + oy + dy
+        return items
+
+    def _update_arrays(self, store, anim_index, dy=0):
+        # EntityStore (NumPy): calcula tudo em lote e monta a lista no fim
+        import numpy as np
+        atlas = self.atlas
+        n = store.count
+        idx = np.arange(n)
+        if self.phases:
+            k = (anim_index + frame_phase(idx, atlas.count, True)) % atlas.count
+        else:
+            k = np.full(n, anim_index % atlas.count)
+        offsets = np.asarray(atlas.offsets)
+        xs = (store.x[:n] + offsets[k, 0]).tolist()
+        ys = (store.y[:n] + offsets[k, 1] + dy).tolist()
+        # mesma lista reaproveitada do caminho com Rects: só os números mudam
+        items = self.items
+        while len(items) < n:
+            items.append([atlas.surface, pygame.Rect(0, 0, 0, 0), atlas.areas[0]])
+        if len(items) > n:
+            del items[n:]
+        areas = atlas.areas
+        for item, x, y, j in zip(items, xs, ys, k.tolist()):
+            item[2] = areas[j]
+            dest = item[1]
+            dest.x = x
+            dest.y = y
+        return items
@@ -0,0 +1,224 @@
+# ----------------------------------------------------------
+# 🔊 ÁUDIO (efeitos pré-decodificados, canais próprios, música em stream)
+# ----------------------------------------------------------
+# Efeitos (config.SOUNDS):
+#   - cada arquivo é decodificado (MP3 -> PCM) uma vez só, em load(),
+#     antes da partida começar. O PCM cru, já no formato do mixer, vai
+#     para CACHE_DIR; nas próximas execuções o som é montado direto dos
+#     bytes (pygame.mixer.Sound(buffer=...)), sem decodificar o MP3. A
+#     chave inclui o arquivo (caminho, mtime, tamanho) e o formato do
+#     mixer (frequência, bits, canais), então mudar qualquer um invalida
+#     o cache sozinho.
+#   - cada efeito tem `voices` canais reservados só para ele: uma chuva
+#     de pontos não rouba o canal do som de colisão. Com todos ocupados
+#     o som novo é descartado ou corta o mais antigo ("steal").
+#   - dois disparos do mesmo efeito com menos de `min_interval_ms` viram
+#     um só (vários meteoros destruídos no mesmo tick não somam volume).
+#
+# Música: pygame.mixer.music lê e decodifica o arquivo aos poucos
+# enquanto toca (stream), então ela nunca fica inteira na memória.
+#
+# Sem mixer (sem placa de som, mixer_initialized falso, ou
+# enabled=False) tudo aqui vira no-op e o jogo segue mudo. Com
+# SDL_AUDIODRIVER=dummy o mixer funciona sem dispositivo, o que permite
+# testar canais e limites sem som de verdade.
+
+import hashlib
+import os
+import struct
+import time
+
+import pygame
+
+from space_escape.assets import CACHE_DIR, write_bytes_atomic
+from space_escape.config import SOUNDS, MUSIC_VOLUME, asset_path
+
+# mude quando o formato dos arquivos de cache mudar
+CACHE_VERSION = 1
+_HEADER = struct.Struct("<4siiiI")
+_MAGIC = b"SEPC"
+
+
+_mixer_failed = False
+
+
+def ensure_mixer():
+    # inicia o mixer só quando o primeiro som/música é pedido; em alguns
+    # ambientes ele falha (sem dispositivo de áudio) e o jogo segue sem som
+    global _mixer_failed
+    if pygame.mixer.get_init():
+        return True
+    if _mixer_failed:
+        return False
+    try:
+        pygame.mixer.init()
+        return True
+    except pygame.error:
+        _mixer_failed = True
+        return False
+
+
+class _Effect:
+    def __init__(self, name, sound, channels, min_interval_ms, steal):
+        self.name = name
+        self.sound = sound
+        self.channels = channels
+        # quando cada canal começou a tocar (para achar o mais antigo)
+        self.started = [0.0] * len(channels)
+        self.min_interval = min_interval_ms / 1000
+        self.steal = steal
+        self.last = float("-inf")
+        self.played = 0
+        self.rate_limited = 0
+        self.voice_limited = 0
+        self.stolen = 0
+
+
+class AudioManager:
+    def __init__(self, sounds=SOUNDS, cache_dir=CACHE_DIR, use_cache=True, enabled=True, timings=None):
+        self.sounds = sounds
+        self.cache_dir = cache_dir
+        self.use_cache = use_cache
+        # enabled=False nunca inicia o mixer (bench, testes sem som)
+        self.enabled = enabled
+        # lista de AssetManager.timings, para os sons entrarem no relatório
+        self.timings = timings if timings is not None else []
+        self.effects = {}
+        self.loaded = False
+
+    @property
+    def available(self):
+        return self.enabled and ensure_mixer()
+
+    # ------------------------------------------------------
+    # Efeitos
+    # ------------------------------------------------------
+    def load(self):
+        # decodifica (ou lê do cache) todos os efeitos e reserva os canais
+        if self.loaded or not self.available:
+            return
+        self.loaded = True
+        total = sum(spec["voices"] for spec in self.sounds.values())
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        # canais reservados não são usados por Sound.play()/find_channel()
+        pygame.mixer.set_reserved(total)
+        first = 0
+        for name, spec in self.sounds.items():
+            sound = self._load_sound(spec["file"])
+            if sound is None:
+                continue
+            sound.set_volume(spec.get("volume", 1.0))
+            channels = [pygame.mixer.Channel(i) for i in range(first, first + spec["voices"])]
+            first += spec["voices"]
+            self.effects[name] = _Effect(name, sound, channels, spec.get("min_interval_ms", 0),
+                                         spec.get("steal", False))
+
+    def play(self, name):
+        # True se o som começou a tocar
+        effect = self.effects.get(name)
+        if effect is None:
+            return False
+        now = time.perf_counter()
+        if now - effect.last < effect.min_interval:
+            effect.rate_limited += 1
+            return False
+        for i, channel in enumerate(effect.channels):
+            if not channel.get_busy():
+                break
+        else:
+            if not effect.steal:
+                effect.voice_limited += 1
+                return False
+            # todos ocupados: corta o que está tocando há mais tempo
+            i = effect.started.index(min(effect.started))
+            effect.stolen += 1
+        effect.channels[i].play(effect.sound)
+        effect.started[i] = now
+        effect.last = now
+        effect.played += 1
+        return True
+
+    def _cache_path(self, filename, st):
+        fmt = pygame.mixer.get_init()
+        ident = f"{CACHE_VERSION}|{os.path.abspath(filename)}|{st.st_mtime_ns}|{st.st_size}|{fmt}"
+        return os.path.join(self.cache_dir, hashlib.sha1(ident.encode()).hexdigest() + ".pcm")
+
+    def _load_sound(self, filename):
+        start = time.perf_counter_ns()
+        sound, source = self._decode(filename)
+        self.timings.append((filename, None, source, (time.perf_counter_ns() - start) / 1e6))
+        return sound
+
+    def _decode(self, filename):
+        filename = asset_path(filename)
+        if not os.path.exists(filename):
+            return None, "ausente"
+        cache_path = None
+        if self.use_cache:
+            cache_path = self._cache_path(filename, os.stat(filename))
+            sound = self._read_cache(cache_path)
+            if sound is not None:
+                return sound, "cache"
+        try:
+            sound = pygame.mixer.Sound(filename)
+        except pygame.error:
+            return None, "inválido"
+        if cache_path is not None:
+            self._write_cache(cache_path, sound)
+        return sound, "arquivo"
+
+    def _read_cache(self, path):
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        if len(data) < _HEADER.size:
+            return None
+        magic, freq, size, channels, length = _HEADER.unpack_from(data)
+        if (magic != _MAGIC or (freq, size, channels) != pygame.mixer.get_init()
+                or len(data) != _HEADER.size + length):
+            return None
+        return pygame.mixer.Sound(buffer=data[_HEADER.size:])
+
+    def _write_cache(self, path, sound):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            raw = sound.get_raw()
+            freq, size, channels = pygame.mixer.get_init()
+            write_bytes_atomic(path, _HEADER.pack(_MAGIC, freq, size, channels, len(raw)) + raw)
+        except OSError:
+            # sem cache não é erro: só fica mais lento na próxima vez
+            pass
+
+    # ------------------------------------------------------
+    # Música (stream)
+    # ------------------------------------------------------
+    def start_music(self, filename, volume=MUSIC_VOLUME):
+        filename = asset_path(filename)
+        if not os.path.exists(filename) or not self.available:
+            return False
+        try:
+            pygame.mixer.music.load(filename)
+            pygame.mixer.music.set_volume(volume)
+            pygame.mixer.music.play(-1)  # loop infinito
+        except pygame.error:
+            # Se por algum motivo a música falhar ao carregar, ignoramos
+            return False
+        return True
+
+    def stop_music(self):
+        if self.enabled and pygame.mixer.get_init():
+            try:
+                pygame.mixer.music.stop()
+            except pygame.error:
+                pass
+
+    # ------------------------------------------------------
+    # Relatório
+    # ------------------------------------------------------
+    def summary_lines(self):
+        return [f"Som {e.name}: {e.played} tocados, {e.rate_limited} juntados (intervalo), "
+                f"{e.voice_limited} sem canal livre, {e.stolen} cortaram outro"
+                for e in self.effects.values() if e.played or e.rate_limited or e.voice_limited]
@@ -0,0 +1,163 @@
+# ----------------------------------------------------------
+# 🌌 FUNDOS DAS FASES (camadas, parallax e orçamento de memória)
+# ----------------------------------------------------------
+# Um Background é uma pilha de camadas (Layer), desenhadas de baixo
+# para cima a cada frame pelo renderer (dirty_render.py):
+#   - a primeira camada é opaca: carregada com convert() (formato da
+#     tela, sem alfa), o blit de tela cheia é uma cópia direta;
+#   - as de cima têm transparência (convert_alpha) e podem ser um tile
+#     pequeno repetido que rola (parallax). O tile é repetido uma vez só,
+#     numa faixa do tamanho da tela + 1 tile; cada frame é um blit dessa
+#     faixa com a janela deslocada (sem laço de tiles por frame).
+#   - camadas quase vazias (estrelas) usam colorkey com RLEACCEL em vez
+#     de alfa: o blit pula os trechos transparentes em vez de misturar
+#     800x600 pixels, o que custa uma fração de uma camada com alfa.
+#
+# BackgroundStore carrega o fundo de uma fase só quando ela começa e
+# guarda os últimos usados até BACKGROUND_BUDGET_BYTES; passando disso,
+# descarta o usado há mais tempo (LRU). As imagens vêm do AssetManager
+# com keep=False, então o que sai daqui sai da memória de verdade, e
+# voltar a uma fase relê os pixels do cache em disco.
+
+import random
+from collections import OrderedDict
+
+import pygame
+
+from space_escape.config import WIDTH, HEIGHT, ASSETS, LEVELS, WHITE, BACKGROUND_BUDGET_BYTES
+
+STAR_TILE_SIZE = (200, 200)
+STAR_COLORKEY = (0, 0, 0)
+
+
+def star_tile(size, count, seed=0):
+    # tile com estrelas de brilho variado; o preto é transparente (colorkey)
+    rng = random.Random(seed)
+    tile = pygame.Surface(size).convert()
+    tile.fill(STAR_COLORKEY)
+    w, h = size
+    for _ in range(count):
+        bright = rng.randint(90, 255)
+        pos = (rng.randrange(w), rng.randrange(h))
+        if rng.random() < 0.2:
+            pygame.draw.circle(tile, (bright, bright, bright), pos, 1)
+        else:
+            tile.set_at(pos, (bright, bright, bright))
+    tile.set_colorkey(STAR_COLORKEY, pygame.RLEACCEL)
+    return tile
+
+
+class Layer:
+    def __init__(self, surface, speed=(0, 0), tiled=False, screen_size=(WIDTH, HEIGHT)):
+        self.speed = speed
+        self.tiled = tiled
+        self.size = screen_size
+        self.offset = (0, 0)
+        if tiled:
+            tw, th = self.tile_size = surface.get_size()
+            w, h = screen_size
+            alpha = surface.get_flags() & pygame.SRCALPHA
+            colorkey = surface.get_colorkey()
+            strip = pygame.Surface((w + tw, h + th), pygame.SRCALPHA if alpha else 0)
+            strip = strip.convert_alpha() if alpha else strip.convert()
+            # BLEND_RGBA_MAX sobre a faixa zerada copia o tile sem misturar o alfa
+            flags = pygame.BLEND_RGBA_MAX if alpha else 0
+            strip.fill(colorkey or (0, 0, 0, 0))
+            for y in range(0, h + th, th):
+                for x in range(0, w + tw, tw):
+                    strip.blit(surface, (x, y), special_flags=flags)
+            if colorkey is not None:
+                strip.set_colorkey(colorkey, pygame.RLEACCEL)
+            self.surface = strip
+        else:
+            self.surface = surface
+
+    @property
+    def moving(self):
+        return self.tiled and self.speed != (0, 0)
+
+    @property
+    def nbytes(self):
+        return self.surface.get_pitch() * self.surface.get_height()
+
+    def scroll(self, t):
+        # t em ticks (pode ser fracionário: frame entre dois ticks)
+        if self.moving:
+            tw, th = self.tile_size
+            self.offset = (int(-self.speed[0] * t) % tw, int(-self.speed[1] * t) % th)
+
+    def draw(self, screen, area=None):
+        ox, oy = self.offset
+        if area is None:
+            if self.tiled:
+                screen.blit(self.surface, (0, 0), (ox, oy, self.size[0], self.size[1]))
+            else:
+                screen.blit(self.surface, (0, 0))
+        else:
+            screen.blit(self.surface, area, area.move(ox, oy))
+
+
+class Background:
+    def __init__(self, layers):
+        self.layers = layers
+        # algum tile rolando: a tela toda muda a cada frame
+        self.animated = any(layer.moving for layer in layers)
+        self.nbytes = sum(layer.nbytes for layer in layers)
+
+    def scroll(self, t):
+        if self.animated:
+            for layer in self.layers:
+                layer.scroll(t)
+
+    def draw(self, screen, area=None):
+        for layer in self.layers:
+            layer.draw(screen, area)
+
+
+class BackgroundStore:
+    def __init__(self, assets, levels=LEVELS, budget=BACKGROUND_BUDGET_BYTES, size=(WIDTH, HEIGHT)):
+        self.assets = assets
+        self.levels = levels
+        self.budget = budget
+        self.size = size
+        # índice da fase -> Background, do usado há mais tempo ao mais recente
+        self.loaded = OrderedDict()
+        self.loads = 0
+        self.hits = 0
+        self.evictions = 0
+
+    def get(self, idx):
+        bg = self.loaded.get(idx)
+        if bg is not None:
+            self.loaded.move_to_end(idx)
+            self.hits += 1
+            return bg
+        bg = self.build(self.levels[idx])
+        self.loads += 1
+        self.loaded[idx] = bg
+        # o fundo que acabou de ser pedido fica, mesmo sozinho acima do limite
+        while len(self.loaded) > 1 and self.memory() > self.budget:
+            self.loaded.popitem(last=False)
+            self.evictions += 1
+        return bg
+
+    def memory(self):
+        return sum(bg.nbytes for bg in self.loaded.values())
+
+    def build(self, level):
+        specs = level.get("layers") or [{"file": level.get("bg", ASSETS["background"])}]
+        layers = []
+        for i, spec in enumerate(specs):
+            tiled = spec.get("tile", False) or "stars" in spec
+            if "stars" in spec:
+                surf = star_tile(spec.get("tile_size", STAR_TILE_SIZE), spec["stars"], spec.get("seed", i))
+            else:
+                # a camada de baixo é opaca; tiles usam o tamanho do arquivo
+                surf = self.assets.image(spec["file"], WHITE, None if tiled else self.size,
+                                         alpha=i > 0, keep=False)
+            layers.append(Layer(surf, tuple(spec.get("speed", (0, 0))), tiled, self.size))
+        return Background(layers)
+
+    def stats(self):
+        return {"loaded": len(self.loaded), "bytes": self.memory(), "loads": self.loads,
+                "hits": self.hits, "evictions": self.evictions}
@@ -0,0 +1,270 @@
+# ----------------------------------------------------------
+# 🧪 SIMULAÇÃO EM LOTE (balanceamento de fases)
+# ----------------------------------------------------------
+# Roda muitas partidas sem janela, em paralelo em todos os núcleos
+# (ProcessPoolExecutor), para cada combinação de parâmetros de fase:
+#
+#     python -m space_escape.batch --games 200 --policy dodge \
+#         --win-score 20 30 40 --life-meteors 1 2 3 \
+#         --speed-scale 0.8 1 1.2 --count-scale 1 1.5 \
+#         --output partidas.csv --summary resumo.csv
+#
+# Cada combinação (o produto cartesiano das listas) é uma "config".
+# As escalas multiplicam meteor_count, meteor_speed e threshold de
+# todas as fases de LEVELS (ou do pacote de --levels, ver rules.py). Toda config joga as mesmas sementes
+# (seed, seed+1, ...), então as diferenças entre configs não são sorte.
+#
+# As partidas saem em `--output` (uma linha por partida, gravada
+# conforme os processos terminam) e o resumo por config — taxa de
+# vitória, tempo de sobrevivência e distribuição de pontos — em
+# `--summary` e na tela. .csv ou .parquet (precisa do pyarrow).
+#
+# O bot é qualquer policy de simulation.POLICIES ou "modulo:funcao",
+# onde funcao(seed) devolve um chamável state -> TickInput.
+
+import argparse
+import csv
+import importlib
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from space_escape import config, simulation
+from space_escape.profiler import percentile
+from space_escape.rules import load_level_pack
+
+DEFAULT_CHUNK = 25
+
+RUN_COLUMNS = ("config", "seed", "result", "ticks", "score", "level", "lives")
+PARAM_COLUMNS = ("win_score", "life_meteors", "speed_scale", "count_scale", "threshold_scale")
+SUMMARY_COLUMNS = ("config",) + PARAM_COLUMNS + (
+    "games", "win_rate", "defeat_rate", "timeout_rate", "survival_s_mean", "survival_s_p50",
+    "score_mean", "score_p10", "score_p50", "score_p90", "level_mean")
+
+
+def load_policy(name):
+    # nome de simulation.POLICIES ou "modulo:funcao"
+    if name in simulation.POLICIES:
+        return simulation.POLICIES[name]
+    if ":" in name:
+        module, attr = name.split(":", 1)
+        return getattr(importlib.import_module(module), attr)
+    raise ValueError(f"policy desconhecida: {name}")
+
+
+def scaled_levels(params, levels=config.LEVELS):
+    return [dict(lvl,
+                 meteor_count=max(1, round(lvl["meteor_count"] * params["count_scale"])),
+                 meteor_speed=max(1, round(lvl["meteor_speed"] * params["speed_scale"])),
+                 threshold=round(lvl["threshold"] * params["threshold_scale"]))
+            for lvl in levels]
+
+
+def run_chunk(task):
+    # roda num processo filho: algumas partidas de uma config
+    config_id, params, seeds, policy_name, max_ticks, base_levels = task
+    factory = load_policy(policy_name)
+    levels = scaled_levels(params, base_levels)
+    rows = []
+    for seed in seeds:
+        sim = simulation.run_game(seed, factory(seed), max_ticks, levels=levels,
+                                  win_score=params["win_score"], life_meteor_count=params["life_meteors"])
+        st = sim.state
+        rows.append((config_id, seed, st.game_over_reason or "timeout", st.tick, st.score,
+                     st.level_idx + 1, st.lives))
+    return rows
+
+
+# ----------------------------------------------------------
+# Saída (CSV ou Parquet)
+# ----------------------------------------------------------
+def require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise RuntimeError("saída .parquet precisa do pyarrow (pip install pyarrow)") from None
+    return pyarrow
+
+
+class CsvSink:
+    def __init__(self, path, columns):
+        self.file = open(path, "w", newline="")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(columns)
+
+    def write(self, rows):
+        self.writer.writerows(rows)
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetSink:
+    # cada write() vira um row group, então o arquivo cresce aos poucos
+    def __init__(self, path, columns):
+        self.pa = require_pyarrow()
+        self.path = path
+        self.columns = columns
+        self.writer = None
+
+    def write(self, rows):
+        if not rows:
+            return
+        table = self.pa.table({c: [r[i] for r in rows] for i, c in enumerate(self.columns)})
+        if self.writer is None:
+            self.writer = self.pa.parquet.ParquetWriter(self.path, table.schema)
+        self.writer.write_table(table)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def open_sink(path, columns):
+    if path.endswith(".parquet"):
+        return ParquetSink(path, columns)
+    return CsvSink(path, columns)
+
+
+# ----------------------------------------------------------
+# Agregação
+# ----------------------------------------------------------
+def summarize(config_id, params, rows):
+    games = len(rows)
+    results = [r[2] for r in rows]
+    survival = sorted(r[3] / config.TICK_RATE for r in rows)
+    scores = sorted(r[4] for r in rows)
+    return (config_id,) + tuple(params[c] for c in PARAM_COLUMNS) + (
+        games,
+        round(results.count("victory") / games, 4),
+        round(results.count("defeat") / games, 4),
+        round(results.count("timeout") / games, 4),
+        round(sum(survival) / games, 2),
+        round(percentile(survival, 50), 2),
+        round(sum(scores) / games, 2),
+        percentile(scores, 10),
+        percentile(scores, 50),
+        percentile(scores, 90),
+        round(sum(r[5] for r in rows) / games, 2),
+    )
+
+
+def make_configs(args):
+    combos = itertools.product(args.win_score, args.life_meteors, args.speed_scale,
+                               args.count_scale, args.threshold_scale)
+    return [dict(zip(PARAM_COLUMNS, combo)) for combo in combos]
+
+
+def make_tasks(configs, args):
+    seeds = [args.seed + g for g in range(args.games)]
+    for config_id, params in enumerate(configs):
+        for i in range(0, len(seeds), args.chunk):
+            yield (config_id, params, seeds[i:i + args.chunk], args.policy, args.ticks, args.base_levels)
+
+
+def run_batch(args):
+    configs = make_configs(args)
+    tasks = list(make_tasks(configs, args))
+    per_config = {i: [] for i in range(len(configs))}
+    sink = open_sink(args.output, RUN_COLUMNS) if args.output else None
+
+    def collect(rows):
+        per_config[rows[0][0]].extend(rows)
+        if sink:
+            sink.write(rows)
+
+    start = time.perf_counter()
+    try:
+        if args.workers == 1:
+            # sem processos filhos (mais fácil de depurar)
+            for task in tasks:
+                collect(run_chunk(task))
+        else:
+            with ProcessPoolExecutor(max_workers=args.workers) as pool:
+                for future in as_completed([pool.submit(run_chunk, t) for t in tasks]):
+                    collect(future.result())
+    finally:
+        if sink:
+            sink.close()
+    elapsed = time.perf_counter() - start
+
+    summary = [summarize(i, configs[i], sorted(per_config[i], key=lambda r: r[1])) for i in per_config]
+    if args.summary:
+        out = open_sink(args.summary, SUMMARY_COLUMNS)
+        out.write(summary)
+        out.close()
+
+    total_games = sum(len(r) for r in per_config.values())
+    total_ticks = sum(r[3] for rows in per_config.values() for r in rows)
+    return summary, total_games, total_ticks, elapsed
+
+
+def print_summary(summary, limit):
+    print(f"{'cfg':>4} {'win':>4} {'vidas':>5} {'vel':>5} {'qtd':>5} {'lim':>5} {'partidas':>8} "
+          f"{'vitória':>8} {'sobrev.(s)':>10} {'pontos p10/p50/p90':>20} {'nível':>6}")
+    for row in summary[:limit]:
+        (cid, win, lives, speed, count, thr, games, win_rate, _, _, surv, _,
+         _, p10, p50, p90, level) = row
+        print(f"{cid:>4} {win:>4} {lives:>5} {speed:>5} {count:>5} {thr:>5} {games:>8} "
+              f"{win_rate:>8.1%} {surv:>10.1f} {f'{p10}/{p50}/{p90}':>20} {level:>6.2f}")
+    if len(summary) > limit:
+        print(f"... mais {len(summary) - limit} configs (veja --summary)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Space Escape — simulação em lote para balancear as fases")
+    parser.add_argument("--games", type=int, default=100, help="partidas por config")
+    parser.add_argument("--seed", type=int, default=0, help="semente da primeira partida de cada config")
+    parser.add_argument("--ticks", type=int, default=20000, help="máximo de ticks por partida")
+    parser.add_argument("--policy", default="dodge",
+                        help=f"bot: {', '.join(sorted(simulation.POLICIES))} ou modulo:funcao")
+    parser.add_argument("--levels", metavar="ARQUIVO", help="pacote de fases base (.json ou .toml)")
+    parser.add_argument("--win-score", type=int, nargs="+", help="padrão: o do pacote (ou WIN_SCORE)")
+    parser.add_argument("--life-meteors", type=int, nargs="+", help="padrão: o do pacote (ou LIFE_METEOR_COUNT)")
+    parser.add_argument("--speed-scale", type=float, nargs="+", default=[1.0],
+                        help="multiplica meteor_speed de todas as fases")
+    parser.add_argument("--count-scale", type=float, nargs="+", default=[1.0],
+                        help="multiplica meteor_count de todas as fases")
+    parser.add_argument("--threshold-scale", type=float, nargs="+", default=[1.0],
+                        help="multiplica o threshold de todas as fases")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="processos (1 = sem pool)")
+    parser.add_argument("--chunk", type=int, default=DEFAULT_CHUNK, help="partidas por tarefa")
+    parser.add_argument("--output", metavar="ARQUIVO", help="uma linha por partida (.csv ou .parquet)")
+    parser.add_argument("--summary", metavar="ARQUIVO", help="resumo por config (.csv ou .parquet)")
+    parser.add_argument("--show", type=int, default=30, help="configs mostradas na tela")
+    args = parser.parse_args(argv)
+    # o resumo é por partida (divide por --games) e as tarefas andam de
+    # --chunk em --chunk; a quantidade de meteoros de vida pode ser 0
+    for name in ("games", "workers", "chunk"):
+        if getattr(args, name) < 1:
+            parser.error(f"--{name} precisa ser pelo menos 1")
+    if any(n < 0 for n in args.life_meteors or ()):
+        parser.error("--life-meteors não pode ser negativo")
+
+    # erros de configuração aparecem antes de começar a rodar
+    try:
+        load_policy(args.policy)
+        if any(p and p.endswith(".parquet") for p in (args.output, args.summary)):
+            require_pyarrow()
+        pack = load_level_pack(args.levels) if args.levels else None
+    except (ValueError, ImportError, AttributeError, RuntimeError, OSError) as e:
+        parser.error(str(e))
+    args.base_levels = pack.levels if pack else config.LEVELS
+    if args.win_score is None:
+        args.win_score = [pack.win_score if pack else config.WIN_SCORE]
+    if args.life_meteors is None:
+        args.life_meteors = [pack.life_meteor_count if pack else config.LIFE_METEOR_COUNT]
+    summary, games, ticks, elapsed = run_batch(args)
+    print_summary(summary, args.show)
+    if elapsed > 0:
+        print(f"{len(summary)} configs, {games} partidas, {ticks} ticks em {elapsed:.2f}s "
+              f"({games / elapsed:.0f} partidas/s, {ticks / elapsed:.0f} ticks/s, {args.workers} processos)",
+              file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,322 @@
+# ----------------------------------------------------------
+# 📊 BENCHMARK DO LOOP DO JOGO
+# ----------------------------------------------------------
+# Roda cenários fixos (com semente) pelo mesmo caminho do jogo:
+# Simulation.step() + GameView.draw() + renderer.end_frame(), numa
+# janela do driver "dummy" do SDL (não abre nada na tela nem toca som).
+#
+# Para cada cenário mede:
+#   - ticks por segundo e tempo de frame (p50/p95/p99), sem o clock.tick;
+#   - bytes alocados por tick, numa segunda passada com tracemalloc
+#     (tracemalloc deixa tudo mais lento, então não mede tempo junto).
+#
+# Uso:
+#     python -m space_escape.bench                        # todos os cenários
+#     python -m space_escape.bench meteors_1k rapid_fire  # só alguns
+#     python -m space_escape.bench --output resultados.json
+#     python -m space_escape.bench --save-baseline bench_baseline.json
+#     python -m space_escape.bench --baseline bench_baseline.json
+#
+# Com --baseline o resultado é comparado com uma execução anterior e o
+# processo sai com código 1 se algum cenário ficou mais lento (ou
+# alocando mais) que a tolerância. Uma baseline medida com outro
+# renderer, outra semente ou com/sem --vectorized é recusada (erro de
+# linha de comando dizendo qual campo mudou).
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+# precisa estar definido antes do pygame criar a janela
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from space_escape import config, simulation
+from space_escape.assets import AssetManager
+from space_escape.background import BackgroundStore
+from space_escape.dirty_render import DirtyRenderer, FullRenderer
+from space_escape.profiler import percentile
+from space_escape.render import GameView
+from space_escape.text_cache import TextCache
+
+DEFAULT_TICKS = 600
+DEFAULT_ALLOC_TICKS = 200
+# primeiros ticks ficam fora das medições (caches, atlas, listas crescendo)
+WARMUP_TICKS = 60
+DEFAULT_SEED = 1234
+# quanto pior que a baseline ainda é aceito (0.15 = 15%)
+DEFAULT_TOLERANCE = 0.15
+# folga absoluta nas alocações: cenários que alocam quase nada
+# oscilam algumas centenas de bytes de uma execução para outra
+ALLOC_SLACK_BYTES = 2048
+# campos de "meta" que precisam ser iguais aos da baseline: com outro
+# renderer, entidades em arrays ou outra semente os números medem
+# outra coisa e a comparação não quer dizer nada
+COMPARABLE_META = ("renderer", "vectorized", "seed")
+# projéteis mantidos na tela no cenário "bullet_screen"
+BULLET_FILL = 500
+# partidas do benchmark não terminam: nem vitória nem derrota
+ENDLESS = 10 ** 9
+
+
+def fill_bullets(sim, rng, target=BULLET_FILL):
+    # completa os projéteis até `target`, espalhados pela tela toda
+    bullets = sim.state.bullets
+    while len(bullets) < target:
+        sim.spawn_bullet(rng.randrange(config.WIDTH - config.BULLET_SIZE[0]), rng.randrange(config.HEIGHT))
+
+
+# fases com fundo em camadas: o de sempre + duas camadas de estrelas
+# rolando em velocidades diferentes (parallax)
+PARALLAX_LEVELS = [
+    dict(lvl, layers=[{"file": lvl.get("bg", config.ASSETS["background"])},
+                      {"stars": 40, "speed": (0, 1), "seed": 1},
+                      {"stars": 15, "speed": (0, 3), "seed": 2}])
+    for lvl in config.LEVELS
+]
+
+
+# nome -> parâmetros do cenário
+#   meteors:     meteoros em todas as fases (None = o que está em LEVELS)
+#   policy:      quem joga (ver simulation.POLICIES)
+#   sim:         argumentos extras para a Simulation
+#   before_tick: chamado antes de cada tick com (sim, rng)
+SCENARIOS = {
+    "levels": {"meteors": None, "policy": "random"},
+    "meteors_100": {"meteors": 100, "policy": "random"},
+    "meteors_1k": {"meteors": 1000, "policy": "random"},
+    "meteors_10k": {"meteors": 10000, "policy": "random"},
+    "rapid_fire": {"meteors": None, "policy": "idle", "sim": {"fire_cooldown_ms": 0}},
+    "bullet_screen": {"meteors": None, "policy": "random", "before_tick": fill_bullets},
+    "parallax": {"meteors": None, "policy": "random", "sim": {"levels": PARALLAX_LEVELS}},
+}
+
+
+def state_hash(state):
+    # resumo do estado final: a mesma semente tem que dar o mesmo hash,
+    # senão a comparação com a baseline não é entre execuções iguais
+    h = hashlib.sha1()
+    h.update(f"{state.tick}|{state.score}|{state.lives}|{state.level_idx}".encode())
+    for group in (state.meteors, state.life_meteors, state.bullets):
+        for r in group:
+            h.update(f"{r.x},{r.y};".encode())
+    return h.hexdigest()[:16]
+
+
+class Bench:
+    def __init__(self, dirty_rects=False, vectorized=False):
+        pygame.init()
+        self.screen = pygame.display.set_mode((config.WIDTH, config.HEIGHT))
+        self.assets = AssetManager()
+        self.text_cache = TextCache()
+        self.renderer_cls = DirtyRenderer if dirty_rects else FullRenderer
+        self.vectorized = vectorized
+
+    def background(self, idx):
+        return self.backgrounds.get(idx)
+
+    def setup(self, name, seed):
+        spec = SCENARIOS[name]
+        sim = simulation.make_simulation(seed=seed, vectorized=self.vectorized, meteors=spec["meteors"],
+                                         win_score=ENDLESS, **spec.get("sim", {}))
+        sim.state.lives = ENDLESS
+        self.backgrounds = BackgroundStore(self.assets, sim.levels)
+        renderer = self.renderer_cls(self.screen, self.background(0))
+        view = GameView(renderer, self.assets, self.text_cache, levels=sim.levels)
+        policy = simulation.POLICIES[spec["policy"]](seed)
+        return sim, renderer, view, policy, spec.get("before_tick"), random.Random(seed)
+
+    def tick(self, sim, renderer, view, policy, before_tick, rng):
+        if before_tick:
+            before_tick(sim, rng)
+        for ev in sim.step(policy(sim.state)):
+            if ev == "level":
+                renderer.set_background(self.background(sim.state.level_idx))
+        view.draw(sim.state)
+        renderer.end_frame()
+
+    def run(self, name, seed, ticks, alloc_ticks):
+        # 1ª passada: tempo
+        ctx = self.setup(name, seed)
+        sim = ctx[0]
+        for _ in range(WARMUP_TICKS):
+            self.tick(*ctx)
+        times = []
+        bullets = 0
+        perf = time.perf_counter_ns
+        start = perf()
+        for _ in range(ticks):
+            t0 = perf()
+            self.tick(*ctx)
+            times.append(perf() - t0)
+            bullets += len(sim.state.bullets)
+        elapsed = (perf() - start) / 1e9
+        times.sort()
+        result = {
+            "ticks": ticks,
+            "ticks_per_s": round(ticks / elapsed, 1) if elapsed else 0.0,
+            "frame_ms": {
+                "mean": round(sum(times) / len(times) / 1e6, 4),
+                "p50": round(percentile(times, 50) / 1e6, 4),
+                "p95": round(percentile(times, 95) / 1e6, 4),
+                "p99": round(percentile(times, 99) / 1e6, 4),
+            },
+            "meteors": len(sim.state.meteors),
+            "bullets_mean": round(bullets / ticks, 1),
+            "score": sim.state.score,
+            "state_hash": state_hash(sim.state),
+            "pools": sim.pool_stats(),
+            "hits": sim.hit_stats(),
+            "backgrounds": self.backgrounds.stats(),
+        }
+
+        # 2ª passada: alocações (mesma semente, do zero)
+        if alloc_ticks:
+            ctx = self.setup(name, seed)
+            for _ in range(WARMUP_TICKS):
+                self.tick(*ctx)
+            tracemalloc.start()
+            allocated = 0
+            retained_start = tracemalloc.get_traced_memory()[0]
+            for _ in range(alloc_ticks):
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                self.tick(*ctx)
+                allocated += tracemalloc.get_traced_memory()[1] - before
+            retained = tracemalloc.get_traced_memory()[0] - retained_start
+            tracemalloc.stop()
+            # pico acima do início do tick (o que o tick alocou de uma vez)
+            # e quanto ficou retido no fim, em média por tick
+            result["alloc_bytes_per_tick"] = round(allocated / alloc_ticks, 1)
+            result["retained_bytes_per_tick"] = round(retained / alloc_ticks, 1)
+        return result
+
+
+# ----------------------------------------------------------
+# Comparação com a baseline
+# ----------------------------------------------------------
+class BaselineError(ValueError):
+    pass
+
+
+def compare(results, baseline, tolerance):
+    # devolve (linhas do relatório, quantidade de regressões); recusa
+    # (BaselineError) uma baseline medida em outra configuração
+    cur_meta = results["meta"]
+    old_meta = baseline.get("meta", {})
+    differs = [f"{key} (baseline: {old_meta.get(key)!r}, agora: {cur_meta.get(key)!r})"
+               for key in COMPARABLE_META if old_meta.get(key) != cur_meta.get(key)]
+    if differs:
+        raise BaselineError("baseline não comparável, muda " + ", ".join(differs))
+    lines = []
+    regressions = 0
+    for name, cur in results["scenarios"].items():
+        old = baseline.get("scenarios", {}).get(name)
+        if old is None:
+            lines.append(f"{name:<14} sem baseline")
+            continue
+        checks = [
+            ("ticks/s", old["ticks_per_s"], cur["ticks_per_s"], cur["ticks_per_s"] < old["ticks_per_s"] * (1 - tolerance)),
+            ("p95 ms", old["frame_ms"]["p95"], cur["frame_ms"]["p95"], cur["frame_ms"]["p95"] > old["frame_ms"]["p95"] * (1 + tolerance)),
+            ("p99 ms", old["frame_ms"]["p99"], cur["frame_ms"]["p99"], cur["frame_ms"]["p99"] > old["frame_ms"]["p99"] * (1 + tolerance)),
+        ]
+        if "alloc_bytes_per_tick" in cur and "alloc_bytes_per_tick" in old:
+            limit = old["alloc_bytes_per_tick"] * (1 + tolerance) + ALLOC_SLACK_BYTES
+            checks.append(("B/tick", old["alloc_bytes_per_tick"], cur["alloc_bytes_per_tick"],
+                           cur["alloc_bytes_per_tick"] > limit))
+        for label, before, after, worse in checks:
+            change = (after - before) / before * 100 if before else 0.0
+            flag = "REGRESSÃO" if worse else "ok"
+            lines.append(f"{name:<14} {label:<8} {before:>12.2f} -> {after:>12.2f} ({change:+6.1f}%) {flag}")
+            regressions += worse
+        if old.get("ticks") == cur["ticks"] and old.get("state_hash") != cur["state_hash"]:
+            lines.append(f"{name:<14} aviso: estado final diferente da baseline (mudou a simulação ou a semente?)")
+    return lines, regressions
+
+
+def print_results(results):
+    print(f"{'cenário':<14} {'ticks/s':>9} {'p50':>7} {'p95':>7} {'p99':>7} {'B/tick':>10} {'meteoros':>9} {'projéteis':>9} "
+          f"{'pares rect':>10} {'máscara':>8}")
+    for name, r in results["scenarios"].items():
+        fm = r["frame_ms"]
+        alloc = r.get("alloc_bytes_per_tick", float("nan"))
+        print(f"{name:<14} {r['ticks_per_s']:>9.0f} {fm['p50']:>7.2f} {fm['p95']:>7.2f} {fm['p99']:>7.2f} "
+              f"{alloc:>10.0f} {r['meteors']:>9} {r['bullets_mean']:>9.1f} "
+              f"{r['hits']['rect']:>10} {'-' if r['hits']['mask'] is None else r['hits']['mask']:>8}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Space Escape — benchmark do loop do jogo")
+    parser.add_argument("scenarios", nargs="*", metavar="cenário",
+                        help=f"cenários a rodar (padrão: todos — {', '.join(SCENARIOS)})")
+    parser.add_argument("--ticks", type=int, default=DEFAULT_TICKS, help="ticks medidos por cenário")
+    parser.add_argument("--alloc-ticks", type=int, default=DEFAULT_ALLOC_TICKS,
+                        help="ticks da passada com tracemalloc (0 desliga)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="semente de todos os cenários")
+    parser.add_argument("--dirty-rects", action="store_true", help="usa o DirtyRenderer")
+    parser.add_argument("--vectorized", action="store_true", help="usa as entidades em arrays do NumPy "
+                        "(outro gerador aleatório: a mesma semente dá outra partida)")
+    parser.add_argument("--output", help="grava os resultados em JSON neste arquivo")
+    parser.add_argument("--save-baseline", metavar="ARQUIVO", help="grava os resultados como nova baseline")
+    parser.add_argument("--baseline", metavar="ARQUIVO", help="compara com uma baseline gravada antes")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="piora aceita em relação à baseline (0.15 = 15%%)")
+    args = parser.parse_args(argv)
+    # as médias dividem por --ticks e por --alloc-ticks (0 desliga a passada)
+    if args.ticks < 1:
+        parser.error("--ticks precisa ser pelo menos 1")
+    if args.alloc_ticks < 0:
+        parser.error("--alloc-ticks não pode ser negativo")
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(f"cenário desconhecido: {', '.join(unknown)}")
+
+    bench = Bench(dirty_rects=args.dirty_rects, vectorized=args.vectorized)
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "renderer": bench.renderer_cls.__name__,
+            "vectorized": args.vectorized,
+        },
+        "scenarios": {},
+    }
+    for name in names:
+        print(f"rodando {name}...", file=sys.stderr)
+        results["scenarios"][name] = bench.run(name, args.seed, args.ticks, args.alloc_ticks)
+    pygame.quit()
+
+    print_results(results)
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        try:
+            lines, regressions = compare(results, baseline, args.tolerance)
+        except BaselineError as e:
+            parser.error(str(e))
+        print("\n".join(lines))
+        if regressions:
+            print(f"{regressions} regressão(ões) acima de {args.tolerance:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
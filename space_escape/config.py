@@ -0,0 +1,140 @@
+# ----------------------------------------------------------
+# 🔧 CONFIGURAÇÕES GERAIS DO JOGO
+# ----------------------------------------------------------
+# Só constantes: importar este módulo não inicializa o PyGame,
+# então ele pode ser usado pela simulação headless e por ferramentas.
+
+import os
+
+WIDTH, HEIGHT = 800, 600
+# frames desenhados por segundo (padrão; --fps muda)
+FPS = 60
+# ticks de simulação por segundo. As velocidades (meteor_speed,
+# BULLET_SPEED) e METEOR_ANIM_SPEED são por tick, então a velocidade
+# do jogo depende só daqui, não de quantos frames são desenhados
+TICK_RATE = 60
+# máximo de ticks simulados num frame para alcançar o relógio; acima
+# disso o atraso é descartado (o jogo fica lento em vez de travar)
+MAX_CATCHUP_TICKS = 5
+
+# ----------------------------------------------------------
+# 🧩 SEÇÃO DE ASSETS (troque os arquivos de assets aqui)
+# ----------------------------------------------------------
+# Dica: coloque as imagens e sons na mesma pasta do arquivo .py
+# e troque apenas os nomes abaixo.
+#
+# Nomes relativos são procurados em ASSET_DIR (a raiz do projeto, onde
+# fica o spaceScape.py), não na pasta de onde o jogo foi iniciado: as
+# máscaras de colisão saem dessas imagens, então o resultado de uma
+# partida (replay, lote, env) não pode depender do diretório atual.
+ASSET_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def asset_path(filename):
+    return filename if os.path.isabs(filename) else os.path.join(ASSET_DIR, filename)
+
+
+ASSETS = {
+    "background": "fundo_espacial.jpg",                         # imagem de fundo (padrão)
+    "player": "nave001.png",                                    # imagem da nave
+    "meteor": "meteoro001.png",                                 # imagem do meteoro
+    "sound_point": "classic-game-action-positive-5-224402.mp3", # som ao desviar com sucesso
+    "sound_hit": "stab-f-01-brvhrtz-224599.mp3",                # som de colisão
+    "music": "distorted-future-363866.mp3",           # música de fundo. direitos: Music by Maksym Malko from Pixabay
+    "victory_screen": "Tela_vitoria.png",              # tela de vitória
+    "defeat_screen": "Tela_Derrota.png",                # tela de derrota
+    "life_meteor": "meteoro_vida.png"                   # meteoro especial que dá vida
+}
+
+# --- Sons ---
+# cada efeito tem canais do mixer só dele (voices = quantas cópias
+# tocam ao mesmo tempo) e um intervalo mínimo entre dois disparos;
+# "steal" decide se, com todos os canais ocupados, o som novo corta
+# o mais antigo (True) ou é descartado (False). Ver audio.py.
+SOUNDS = {
+    "point": {"file": ASSETS["sound_point"], "voices": 3, "min_interval_ms": 60, "volume": 1.0, "steal": False},
+    "hit": {"file": ASSETS["sound_hit"], "voices": 2, "min_interval_ms": 120, "volume": 1.0, "steal": True},
+}
+MUSIC_VOLUME = 0.3
+
+# ----------------------------------------------------------
+# 🎚️ CONFIGURAÇÃO DE FASES (níveis)
+# Cada nível pode ter um fundo diferente, quantidade de meteoros
+# e velocidade distinta. Os arquivos de imagem podem ser alterados
+# sem quebrar — o `load_image` gera um fallback quando ausentes.
+# ----------------------------------------------------------
+LEVELS = [
+    {"name": "Nível 1", "bg": "fundo_espacial.png", "meteor_count": 5, "meteor_speed": 5, "threshold": 0},
+    {"name": "Nível 2", "bg": "fundo_espacial2.jpg",   "meteor_count": 7, "meteor_speed": 7, "threshold": 10},
+    {"name": "Nível 3", "bg": "fundo_espacial3.png",    "meteor_count": 10, "meteor_speed": 9, "threshold": 20},
+]
+
+# Em vez de "bg", uma fase pode ter "layers": camadas desenhadas de
+# baixo para cima (ver background.py). A primeira é opaca e cobre a
+# tela; as outras podem ter transparência e rolar (parallax):
+#   {"file": "nebulosa.png"}                          tela inteira, parada
+#   {"file": "poeira.png", "tile": True, "speed": (0, 1)}
+#                                                     tile pequeno repetido,
+#                                                     rolando (px por tick)
+#   {"stars": 40, "tile_size": (200, 200), "speed": (0, 2), "seed": 1}
+#                                                     estrelas geradas
+# Ex.: "layers": [{"file": "fundo_espacial.png"},
+#                 {"stars": 30, "speed": (0, 1)}, {"stars": 12, "speed": (0, 3), "seed": 2}]
+
+# memória máxima (bytes) dos fundos das fases carregados ao mesmo tempo;
+# acima disso os usados há mais tempo são descartados (e relidos do cache
+# em disco se a fase voltar). Um fundo 800x600 opaco ocupa ~1,9 MB.
+BACKGROUND_BUDGET_BYTES = 8 * 1024 * 1024
+
+# Pontuação necessária para vencer
+WIN_SCORE = 30
+# vidas no início de um jogo novo
+START_LIVES = 3
+
+# Cores para fallback (caso os arquivos não existam)
+WHITE = (255, 255, 255)
+RED = (255, 60, 60)
+BLUE = (60, 100, 255)
+
+# --- Tamanhos das entidades ---
+PLAYER_SIZE = (80, 60)
+METEOR_SIZE = (40, 40)
+
+# --- Meteoros de vida ---
+LIFE_METEOR_COUNT = 2
+
+# --- Animação dos meteoros ---
+# os frames giram o meteoro de -METEOR_SWING_DEG a +METEOR_SWING_DEG e de
+# volta, para dar impressão de "balanço"; METEOR_ANIM_FRAMES é a resolução
+# angular (8 frames de 10° = -10, -5, 0, 5, 10, 5, 0, -5)
+METEOR_ANIM_FRAMES = 8
+METEOR_SWING_DEG = 10
+METEOR_ANIM_SPEED = 5  # quanto menor, mais rápida a troca de frames
+# cada meteoro começa a animação num frame diferente
+METEOR_PHASES = False
+# meteoros de vida não balançam (0°); aumente para animá-los também
+LIFE_METEOR_SWING_DEG = 0
+
+
+def sprite_config():
+    # a parte da animação que muda o resultado de uma partida (com
+    # PIXEL_COLLISION, o frame de cada meteoro entra na colisão); vai no
+    # cabeçalho do replay junto com PIXEL_COLLISION
+    return {"anim_frames": METEOR_ANIM_FRAMES, "anim_speed": METEOR_ANIM_SPEED, "swing_deg": METEOR_SWING_DEG,
+            "life_swing_deg": LIFE_METEOR_SWING_DEG, "phases": METEOR_PHASES}
+
+# --- Colisão ---
+# batida só quando pixels visíveis se encostam (máscaras, ver masks.py);
+# False volta ao teste só de retângulo
+PIXEL_COLLISION = True
+
+# --- Armas / Projéteis ---
+# velocidade dos projéteis (pixels por frame)
+BULLET_SPEED = 12
+# tamanho do projétil
+BULLET_SIZE = (6, 12)
+# cooldown entre tiros em milissegundos
+FIRE_COOLDOWN_MS = 200
+# Rects de projétil criados de antemão (ver pool.py); com cooldown 0 e
+# um tiro por tick ficam no máximo ~HEIGHT / BULLET_SPEED = 50 na tela
+BULLET_POOL_SIZE = 64
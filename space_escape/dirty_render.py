@@ -0,0 +1,158 @@
+# ----------------------------------------------------------
+# 🖌️ RENDERIZAÇÃO (tela cheia ou só retângulos sujos)
+# ----------------------------------------------------------
+# FullRenderer é o jeito original: fundo inteiro + tudo de novo +
+# display.flip() a cada frame.
+#
+# DirtyRenderer guarda os retângulos desenhados no frame anterior;
+# no começo do frame só esses pedaços do fundo são restaurados, e no
+# fim só os retângulos do frame anterior + os do frame atual vão
+# para a tela com display.update(rects). Na maior parte dos frames
+# isso é uma fração pequena dos 800x600.
+#
+# Os dois têm a mesma interface, então o loop principal desenha do
+# mesmo jeito nos dois modos. O fundo é um background.Background
+# (camadas); se ele rola (parallax), a tela inteira muda a cada frame
+# e o DirtyRenderer passa a redesenhar tudo.
+
+import pygame
+
+# acima desta fração da tela vale mais a pena mandar a tela inteira
+FULL_REDRAW_FRACTION = 0.6
+
+
+class FullRenderer:
+    def __init__(self, screen, background):
+        self.screen = screen
+        self.background = background
+        self.touched_fraction = 1.0
+
+    def set_background(self, background):
+        self.background = background
+
+    def begin_frame(self):
+        self.background.draw(self.screen)
+
+    def blit(self, surf, pos):
+        return self.screen.blit(surf, pos)
+
+    def blits(self, seq):
+        self.screen.blits(seq, False)
+
+    def rect(self, color, rect):
+        pygame.draw.rect(self.screen, color, rect)
+
+    def overlay(self, surf, pos, changed=True):
+        self.screen.blit(surf, pos)
+
+    def clear_overlay(self, pos):
+        pass
+
+    def end_frame(self):
+        pygame.display.flip()
+
+
+class DirtyRenderer:
+    def __init__(self, screen, background):
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+        self.screen_area = self.screen_rect.width * self.screen_rect.height
+        self.background = background
+        self.prev_rects = []
+        self.rects = []
+        # o que foi desenhado neste frame, para refazer um pedaço da tela
+        # quando um texto do HUD muda de tamanho
+        self.ops = []
+        # posição do texto -> retângulo que ele ocupou da última vez
+        self.overlays = {}
+        self.full_redraw = True
+        # fração da tela enviada no último frame (1.0 = tela inteira)
+        self.touched_fraction = 1.0
+
+    def set_background(self, background):
+        self.background = background
+        self.full_redraw = True
+
+    def begin_frame(self):
+        if self.background.animated:
+            self.full_redraw = True
+        if self.full_redraw:
+            self.background.draw(self.screen)
+        else:
+            # apaga o frame anterior restaurando só o fundo embaixo dele
+            draw = self.background.draw
+            screen = self.screen
+            for r in self.prev_rects:
+                draw(screen, r)
+        self.rects = []
+        self.ops = []
+
+    def blit(self, surf, pos):
+        r = self.screen.blit(surf, pos)
+        self.rects.append(r)
+        self.ops.append((surf, pos, r))
+        return r
+
+    def blits(self, seq):
+        rects = self.screen.blits(seq)
+        self.rects.extend(rects)
+        self.ops.extend((item, None, r) for item, r in zip(seq, rects))
+
+    def rect(self, color, rect):
+        r = pygame.draw.rect(self.screen, color, rect)
+        self.rects.append(r)
+        self.ops.append((color, rect, r))
+
+    # `ops` guarda (surface, pos, rect) dos blit(), (item, None, rect) dos
+    # blits() — item é (surface, destino[, área]) — e (cor, rect, rect)
+    # dos retângulos desenhados
+
+    def _repaint(self, area):
+        # restaura o fundo em `area` e redesenha só ali o que já estava no frame
+        screen = self.screen
+        screen.set_clip(area)
+        self.background.draw(screen, area)
+        for what, pos, r in self.ops:
+            if r.colliderect(area):
+                if pos is None:
+                    screen.blit(*what)
+                elif isinstance(what, pygame.Surface):
+                    screen.blit(what, pos)
+                else:
+                    pygame.draw.rect(screen, what, pos)
+        screen.set_clip(None)
+        self.rects.append(area)
+
+    def overlay(self, surf, pos, changed=True):
+        # textos fixos (HUD): só redesenha se mudaram ou se algo passou
+        # por cima/embaixo deles neste frame ou no anterior
+        r = surf.get_rect(topleft=pos)
+        old = self.overlays.get(pos)
+        if changed and old is not None and not self.full_redraw:
+            # o texto antigo pode ser maior que o novo: apaga ele antes
+            self._repaint(old)
+        if changed or self.full_redraw or old is None or r.collidelist(self.rects) >= 0 \
+                or r.collidelist(self.prev_rects) >= 0:
+            self.blit(surf, pos)
+        self.overlays[pos] = r
+
+    def clear_overlay(self, pos):
+        # tira da tela um texto que não vai mais ser desenhado
+        old = self.overlays.pop(pos, None)
+        if old is not None and not self.full_redraw:
+            self._repaint(old)
+
+    def end_frame(self):
+        dirty = self.prev_rects + self.rects
+        area = 0
+        for r in dirty:
+            area += r.width * r.height
+        fraction = min(area / self.screen_area, 1.0)
+        if self.full_redraw or fraction >= FULL_REDRAW_FRACTION:
+            pygame.display.flip()
+            self.touched_fraction = 1.0
+        else:
+            pygame.display.update(dirty)
+            self.touched_fraction = fraction
+        self.full_redraw = False
+        self.prev_rects = self.rects
@@ -0,0 +1,328 @@
+# ----------------------------------------------------------
+# 🧮 ENTIDADES VETORIZADAS (opcional, precisa de NumPy)
+# ----------------------------------------------------------
+# Em vez de uma lista de pygame.Rect, cada grupo de entidades
+# (meteoros, meteoros de vida, projéteis) vira um "structure of
+# arrays": vetores x, y, w, h e alive. Mover, achar quem saiu da
+# tela, reposicionar e testar colisão viram operações em lote,
+# o que permite fases "bullet hell" com milhares de meteoros.
+#
+# VectorSimulation segue as mesmas regras de Simulation, inclusive a
+# colisão contínua em ordem de tempo de impacto (sweep.py) e a
+# confirmação por máscara (masks.py) dos pares achados, só que com
+# o gerador aleatório do NumPy (mesma semente, partidas diferentes).
+
+import pygame
+
+from space_escape import config
+from space_escape.simulation import Simulation
+from space_escape.sweep import first_contacts
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele só a simulação com listas funciona
+    np = None
+
+
+def require_numpy():
+    if np is None:
+        raise RuntimeError("a simulação vetorizada precisa do NumPy (pip install numpy)")
+
+
+class EntityStore:
+    def __init__(self, capacity=16):
+        require_numpy()
+        capacity = max(capacity, 1)
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.int32)
+        self.w = np.zeros(capacity, dtype=np.int32)
+        self.h = np.zeros(capacity, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        # compatibilidade com o código que espera pygame.Rect (desenho, saves)
+        n = self.count
+        for x, y, w, h in zip(self.x[:n].tolist(), self.y[:n].tolist(),
+                              self.w[:n].tolist(), self.h[:n].tolist()):
+            yield pygame.Rect(x, y, w, h)
+
+    def _grow(self, needed):
+        cap = len(self.x)
+        if needed <= cap:
+            return
+        new_cap = max(needed, cap * 2)
+        for name in ("x", "y", "w", "h", "alive"):
+            old = getattr(self, name)
+            arr = np.zeros(new_cap, dtype=old.dtype)
+            arr[:cap] = old
+            setattr(self, name, arr)
+
+    def append(self, rect):
+        x, y, w, h = rect
+        self._grow(self.count + 1)
+        i = self.count
+        self.x[i], self.y[i], self.w[i], self.h[i] = x, y, w, h
+        self.alive[i] = True
+        self.count += 1
+
+    def spawn(self, count, rng, size, top, bottom):
+        # cria `count` entidades em x aleatório e y entre top e bottom
+        if count <= 0:
+            return
+        w, h = size
+        self._grow(self.count + count)
+        s = slice(self.count, self.count + count)
+        self.x[s] = rng.integers(0, config.WIDTH - w, size=count, endpoint=True)
+        self.y[s] = rng.integers(top, bottom, size=count, endpoint=True)
+        self.w[s] = w
+        self.h[s] = h
+        self.alive[s] = True
+        self.count += count
+
+    def truncate(self, count):
+        # mantém só as primeiras `count` entidades
+        self.count = min(self.count, count)
+
+    def move(self, dy):
+        self.y[:self.count] += dy
+
+    def below(self, limit):
+        # máscara das entidades com y > limit (saíram por baixo)
+        n = self.count
+        return (self.y[:n] > limit) & self.alive[:n]
+
+    def above(self, limit):
+        # máscara das entidades com bottom < limit (saíram por cima)
+        n = self.count
+        return (self.y[:n] + self.h[:n] < limit) & self.alive[:n]
+
+    def respawn(self, mask, rng, top, bottom=-40):
+        # reposiciona em lote as entidades marcadas na máscara
+        idx = np.flatnonzero(mask)
+        if len(idx) == 0:
+            return 0
+        self.y[idx] = rng.integers(top, bottom, size=len(idx), endpoint=True)
+        self.x[idx] = rng.integers(0, config.WIDTH - self.w[idx], endpoint=True)
+        return len(idx)
+
+    def rect(self, i):
+        return pygame.Rect(int(self.x[i]), int(self.y[i]), int(self.w[i]), int(self.h[i]))
+
+    def sweep_rect(self, rect, dx, dy):
+        # toi (ver sweep.py) de cada entidade, que andou (dx, dy) neste
+        # tick, contra um retângulo parado; inf = não encostou
+        n = self.count
+        toi = _toi(self.x[:n], self.y[:n], self.w[:n], self.h[:n], rect.x, rect.y, rect.w, rect.h, dx, dy)
+        toi[~self.alive[:n]] = np.inf
+        return toi
+
+    def sweep_pairs(self, other, dx, dy):
+        # (toi, i, j, testados) dos pares que encostam, com as entidades de
+        # self andando (dx, dy) em relação às de other. Sem matriz de todos
+        # contra todos: os alvos vivos ficam ordenados por x e cada
+        # entidade só é comparada (testados) com a faixa de alvos que a
+        # área varrida dela alcança na horizontal
+        movers = np.flatnonzero(self.alive[:self.count])
+        targets = np.flatnonzero(other.alive[:other.count])
+        if not len(movers) or not len(targets):
+            return _NO_PAIRS
+        order = targets[np.argsort(other.x[targets], kind="stable")]
+        tx = other.x[order]
+        sx = self.x[movers] - max(dx, 0)
+        lo = np.searchsorted(tx, sx - other.w[order].max(), side="right")
+        hi = np.searchsorted(tx, sx + self.w[movers] + abs(dx), side="left")
+        counts = hi - lo
+        tested = int(counts.sum())
+        if not tested:
+            return _NO_PAIRS
+        # faixas [lo, hi) de cada mover emendadas num vetor só
+        rows = np.repeat(movers, counts)
+        cols = order[np.arange(tested) + np.repeat(lo - (np.cumsum(counts) - counts), counts)]
+        toi = _toi(self.x[rows], self.y[rows], self.w[rows], self.h[rows],
+                   other.x[cols], other.y[cols], other.w[cols], other.h[cols], dx, dy)
+        hit = toi < np.inf
+        return toi[hit], rows[hit], cols[hit], tested
+
+    def compact(self):
+        # remove as entidades mortas mantendo a ordem das vivas
+        n = self.count
+        keep = np.flatnonzero(self.alive[:n])
+        k = len(keep)
+        if k == n:
+            return
+        for name in ("x", "y", "w", "h", "alive"):
+            arr = getattr(self, name)
+            arr[:k] = arr[keep]
+        self.count = k
+
+    def positions(self, dx=0, dy=0):
+        # lista de (x, y) pronta para Surface.blits
+        n = self.count
+        return list(zip((self.x[:n] + dx).tolist(), (self.y[:n] + dy).tolist()))
+
+
+_NO_PAIRS = (None, (), None, 0)
+
+
+def _axis(a0, aw, b0, bw, v):
+    # sweep._axis em lote (v é o mesmo para todos)
+    if v == 0:
+        overlap = (a0 < b0 + bw) & (a0 + aw > b0)
+        return np.where(overlap, -np.inf, np.inf), np.where(overlap, np.inf, -np.inf)
+    t1 = (b0 - aw - a0) / v
+    t2 = (b0 + bw - a0) / v
+    return np.minimum(t1, t2), np.maximum(t1, t2)
+
+
+def _toi(ax, ay, aw, ah, bx, by, bw, bh, dx, dy):
+    # sweep.time_of_impact em lote (com broadcasting); inf = não encostou.
+    # Broadphase: a caixa varrida (início + fim, como sweep.swept_rect)
+    # só com comparações; o cálculo exato é feito só nos candidatos
+    sx = ax - max(dx, 0)
+    sy = ay - max(dy, 0)
+    near = ((sx < bx + bw) & (sx + aw + abs(dx) > bx)
+            & (sy < by + bh) & (sy + ah + abs(dy) > by))
+    toi = np.full(near.shape, np.inf)
+    idx = np.nonzero(near)
+    if not len(idx[0]):
+        return toi
+    ax, ay, aw, ah, bx, by, bw, bh = (np.broadcast_to(v, near.shape)[idx]
+                                      for v in (ax, ay, aw, ah, bx, by, bw, bh))
+    x_in, x_out = _axis(ax - dx, aw, bx, bw, dx)
+    y_in, y_out = _axis(ay - dy, ah, by, bh, dy)
+    t_in = np.maximum(x_in, y_in)
+    t_out = np.minimum(x_out, y_out)
+    hit = (t_in < t_out) & (t_in < 1) & (t_out > 0)
+    toi[idx] = np.where(hit, np.maximum(t_in, 0.0), np.inf)
+    return toi
+
+
+def positions(entities, dx=0, dy=0):
+    # posições de desenho tanto para EntityStore quanto para lista de Rect
+    if isinstance(entities, EntityStore):
+        return entities.positions(dx, dy)
+    return [(r.x + dx, r.y + dy) for r in entities]
+
+
+class VectorSimulation(Simulation):
+    def __init__(self, seed=None, **kwargs):
+        require_numpy()
+        self.np_rng = np.random.default_rng(seed)
+        super().__init__(seed=seed, **kwargs)
+        self.state.bullets = EntityStore()
+
+    def make_pools(self, life_meteor_count):
+        # os arrays do EntityStore já são o "pool": nenhum Rect criado
+        self.bullet_pool = self.meteor_pool = self.life_pool = None
+
+    def pool_stats(self):
+        return {}
+
+    def make_meteors(self, count, pool=None):
+        # os arrays do EntityStore já são o "pool": nada de Rect por entidade
+        store = EntityStore(count)
+        store.spawn(count, self.np_rng, config.METEOR_SIZE, -500, -config.METEOR_SIZE[1])
+        return store
+
+    def spawn_bullet(self, x, y):
+        self.state.bullets.append((x, y) + config.BULLET_SIZE)
+
+    def set_level(self, idx):
+        if idx < 0 or idx >= len(self.levels):
+            return
+        state = self.state
+        state.level_idx = idx
+        state.meteor_speed = self.levels[idx]["meteor_speed"]
+        # Ajusta a quantidade de meteoros para o nível
+        desired = self.levels[idx]["meteor_count"]
+        if len(state.meteors) < desired:
+            state.meteors.spawn(desired - len(state.meteors), self.np_rng,
+                                config.METEOR_SIZE, -500, -config.METEOR_SIZE[1])
+        else:
+            state.meteors.truncate(desired)
+
+    def update_meteors(self, events):
+        state = self.state
+        meteors = state.meteors
+        meteors.move(state.meteor_speed)
+
+        # Saíram da tela → reposiciona e soma pontos
+        scored = meteors.respawn(meteors.below(config.HEIGHT), self.np_rng, -100)
+        if scored:
+            events.extend(["point"] * scored)
+            self.add_score(scored, events)
+
+        # Colisão contínua (sem grade: teste em lote contra todos os meteoros)
+        hits = meteors.respawn(self.player_touched(meteors, "meteor"), self.np_rng, -100)
+        if hits:
+            state.lives -= hits
+            events.extend(["hit"] * hits)
+            if state.lives <= 0:
+                state.game_over_reason = 'defeat'
+                events.append("defeat")
+
+    def update_life_meteors(self, events):
+        state = self.state
+        life = state.life_meteors
+        life.move(state.meteor_speed)
+        life.respawn(life.below(config.HEIGHT), self.np_rng, -200)
+        gained = life.respawn(self.player_touched(life, "life_meteor"), self.np_rng, -200)
+        if gained:
+            state.lives += gained
+            events.extend(["life"] * gained)
+
+    def player_touched(self, store, sprite):
+        # máscara das entidades que encostaram na nave durante o tick
+        state = self.state
+        self.narrowphase_tests += store.count
+        toi = store.sweep_rect(state.player, 0, state.meteor_speed)
+        touched = toi < np.inf
+        idx = np.flatnonzero(touched)
+        if not len(idx):
+            return touched
+        # mesmos pares (e mesma convenção: a nave "sobe") de Simulation.player_hits
+        cols = idx.tolist()
+        pairs = list(zip(toi[idx].tolist(), [0] * len(cols), cols))
+        targets = {j: store.rect(j) for j in cols}
+        pairs = self.confirm(pairs, (state.player,), "player", 0, -state.meteor_speed, targets, sprite)
+        touched[idx] = False
+        touched[[j for _, _, j in pairs]] = True
+        return touched
+
+    def update_bullets(self, events):
+        state = self.state
+        bullets, meteors = state.bullets, state.meteors
+        if not len(bullets):
+            return
+        bullets.move(-config.BULLET_SPEED)
+        # projéteis que saíram da tela
+        bullets.alive[:bullets.count] &= ~bullets.above(0)
+
+        # projéteis subiram BULLET_SPEED e meteoros desceram meteor_speed
+        dy = -(config.BULLET_SPEED + state.meteor_speed)
+        times, rows, cols, tested = bullets.sweep_pairs(meteors, 0, dy)
+        self.narrowphase_tests += tested
+        if len(rows):
+            # em ordem de tempo de impacto (empates: menor projétil, menor
+            # meteoro), cada projétil e cada meteoro entram num contato só
+            order = np.lexsort((cols, rows, times))
+            pairs = list(zip(times[order].tolist(), rows[order].tolist(), cols[order].tolist()))
+            if self.masks is not None:
+                movers = {i: bullets.rect(i) for i in set(rows.tolist())}
+                targets = {j: meteors.rect(j) for j in set(cols.tolist())}
+            else:
+                movers = targets = None
+            pairs = self.confirm(pairs, movers, "bullet", 0, dy, targets, "meteor")
+            destroyed = np.zeros(meteors.count, dtype=bool)
+            for _, i, j in first_contacts(pairs):
+                destroyed[j] = True
+                bullets.alive[i] = False
+            kills = meteors.respawn(destroyed, self.np_rng, -200)
+            if kills:
+                events.extend(["kill"] * kills)
+                self.add_score(2 * kills, events)
+        bullets.compact()
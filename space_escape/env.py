@@ -0,0 +1,294 @@
+# ----------------------------------------------------------
+# 🤖 AMBIENTE PARA BOTS (API no estilo Gym, precisa de NumPy)
+# ----------------------------------------------------------
+# SpaceEscapeEnv embrulha uma Simulation (as mesmas regras do jogo:
+# meteoros, projéteis, meteoros de vida, pontos, vidas e fases) numa
+# API reset(seed) / step(ação), sem janela e sem mouse:
+#     obs, info = env.reset(seed=1)
+#     obs, reward, terminated, truncated, info = env.step((x, y, fire))
+# A ação é a mesma coisa que o jogo lê do mouse num tick (TickInput):
+# para onde a nave vai e se atira. A recompensa é quanto a pontuação
+# subiu no tick; terminated = vitória/derrota, truncated = max_ticks.
+#
+# VectorEnv roda N ambientes juntos: step() recebe N ações e devolve
+# tudo empilhado (obs [N, ...], recompensas [N], ...). Quem termina
+# recomeça sozinho na hora, com a próxima semente; o fim do episódio
+# fica em infos[i] ("final_obs", "final_score", "final_reason").
+#
+# Observações (obs="state" ou obs="frame"):
+#   state  vetor float32 de STATE_SIZE: nave, vidas, pontos, fase,
+#          velocidade, tiro liberado, projéteis e os meteoros (e meteoros
+#          de vida) mais próximos em posição relativa à nave
+#   frame  a tela reduzida FRAME_SCALE vezes, um byte por pixel com a
+#          classe do que está ali (ver FRAME_CLASSES). Cada ambiente
+#          desenha direto na sua faixa de uma Surface de 8 bits e a obs é
+#          um array de pygame.surfarray.pixels2d sobre ela: zero cópia.
+# As obs devolvidas são views de buffers reaproveitados a cada step();
+# copie (obs.copy()) o que precisar guardar.
+#
+# Vazão (env-steps/s) num núcleo:
+#     python -m space_escape.env --envs 16 --steps 5000 --obs frame
+
+import argparse
+import time
+
+import pygame
+
+from space_escape import config, simulation
+from space_escape.entities import EntityStore, np, require_numpy
+from space_escape.rules import LevelPackError, load_level_pack
+
+# episódio cortado (truncated) depois de tantos ticks
+MAX_TICKS = 10000
+
+# obs="state": meteoros e meteoros de vida mais próximos da nave
+NEAREST_METEORS = 8
+NEAREST_LIFE = 2
+# nave x/y, vidas, pontos, fase, velocidade, tiro liberado, projéteis
+_STATE_HEADER = 8
+STATE_SIZE = _STATE_HEADER + 3 * (NEAREST_METEORS + NEAREST_LIFE)
+
+# obs="frame": tela reduzida (800x600 / 8 = 100x75), um byte por pixel
+FRAME_SCALE = 8
+FRAME_CLASSES = {"empty": 0, "meteor": 1, "life_meteor": 2, "bullet": 3, "player": 4}
+# cores só para quem salvar a Surface como imagem (depuração)
+_PALETTE = [(0, 0, 0), (255, 60, 60), (0, 255, 0), (255, 255, 255), (60, 100, 255)]
+
+
+def frame_size(scale=FRAME_SCALE):
+    return config.WIDTH // scale, config.HEIGHT // scale
+
+
+def make_frame_surface(count=1, scale=FRAME_SCALE):
+    # Surface de 8 bits com `count` frames empilhados na vertical
+    w, h = frame_size(scale)
+    surface = pygame.Surface((w, h * count), 0, 8)
+    surface.set_palette(_PALETTE + [(0, 0, 0)] * (256 - len(_PALETTE)))
+    return surface
+
+
+def _centers(entities):
+    # centros (x, y) em float32, para lista de Rect ou EntityStore
+    if isinstance(entities, EntityStore):
+        n = entities.count
+        return np.stack((entities.x[:n] + entities.w[:n] / 2,
+                         entities.y[:n] + entities.h[:n] / 2), axis=1).astype(np.float32)
+    return np.array([r.center for r in entities], dtype=np.float32).reshape(-1, 2)
+
+
+def _write_nearest(out, entities, px, py, k):
+    # k linhas de (dx, dy, presente) dos mais próximos, em ordem de distância
+    out[:] = 0.0
+    xy = _centers(entities)
+    if not len(xy):
+        return
+    xy[:, 0] -= px
+    xy[:, 1] -= py
+    d2 = (xy * xy).sum(axis=1)
+    if len(d2) > k:
+        idx = np.argpartition(d2, k - 1)[:k]
+        idx = idx[np.argsort(d2[idx], kind="stable")]
+    else:
+        idx = np.argsort(d2, kind="stable")
+    rows = out.reshape(k, 3)
+    m = len(idx)
+    rows[:m, 0] = xy[idx, 0] / config.WIDTH
+    rows[:m, 1] = xy[idx, 1] / config.HEIGHT
+    rows[:m, 2] = 1.0
+
+
+class SpaceEscapeEnv:
+    def __init__(self, obs="state", max_ticks=MAX_TICKS, frame_scale=FRAME_SCALE, pack=None,
+                 vectorized=False, meteors=None, **sim_kwargs):
+        require_numpy()
+        if obs not in ("state", "frame"):
+            raise ValueError(f"obs precisa ser 'state' ou 'frame', não {obs!r}")
+        self.obs_type = obs
+        self.max_ticks = max_ticks
+        self.frame_scale = frame_scale
+        self.sim_args = dict(sim_kwargs, pack=pack, vectorized=vectorized, meteors=meteors)
+        self.sim = None
+        self.seed = None
+        # buffers próprios; VectorEnv troca por faixas dos buffers dele
+        surface = make_frame_surface(1, frame_scale) if obs == "frame" else None
+        self.use_buffers(np.zeros(STATE_SIZE, dtype=np.float32), surface,
+                         None if surface is None else pygame.surfarray.pixels2d(surface).T)
+
+    def use_buffers(self, state_row, frame_surface, frame_view):
+        # onde as obs são escritas: linha do vetor de estado e a Surface do
+        # frame (com o array que a enxerga, já como [altura, largura])
+        self.state_obs = state_row
+        self.frame_surface = frame_surface
+        self.frame_obs = frame_view
+
+    # ------------------------------------------------------
+    # API
+    # ------------------------------------------------------
+    def reset(self, seed=None):
+        self.seed = seed
+        self.sim = simulation.make_simulation(seed=seed, **self.sim_args)
+        return self.observe(), self.info([])
+
+    def step(self, action):
+        sim = self.sim
+        state = sim.state
+        x, y, fire = action
+        score = state.score
+        events = sim.step(simulation.TickInput(int(x), int(y), bool(fire)))
+        terminated = state.done
+        truncated = not terminated and self.max_ticks is not None and state.tick >= self.max_ticks
+        return self.observe(), float(state.score - score), terminated, truncated, self.info(events)
+
+    def info(self, events):
+        state = self.sim.state
+        return {"score": state.score, "lives": state.lives, "level": state.level_idx,
+                "tick": state.tick, "events": events}
+
+    # ------------------------------------------------------
+    # Observações
+    # ------------------------------------------------------
+    def observe(self):
+        if self.obs_type == "frame":
+            self.draw_frame()
+            return self.frame_obs
+        self.write_state()
+        return self.state_obs
+
+    def write_state(self):
+        sim = self.sim
+        state = sim.state
+        out = self.state_obs
+        px, py = state.player.center
+        ready = state.tick * simulation.TICK_MS - state.last_shot_ms >= sim.fire_cooldown_ms
+        out[:_STATE_HEADER] = (px / config.WIDTH, py / config.HEIGHT, state.lives, state.score,
+                               state.level_idx, state.meteor_speed, ready, len(state.bullets))
+        life_start = _STATE_HEADER + 3 * NEAREST_METEORS
+        _write_nearest(out[_STATE_HEADER:life_start], state.meteors, px, py, NEAREST_METEORS)
+        _write_nearest(out[life_start:], state.life_meteors, px, py, NEAREST_LIFE)
+
+    def draw_frame(self):
+        # desenha com Surface.fill direto na Surface que o array enxerga
+        state = self.sim.state
+        s = self.frame_scale
+        fill = self.frame_surface.fill
+        fill(FRAME_CLASSES["empty"])
+        for cls, group in ((FRAME_CLASSES["meteor"], state.meteors),
+                           (FRAME_CLASSES["life_meteor"], state.life_meteors),
+                           (FRAME_CLASSES["bullet"], state.bullets)):
+            for r in group:
+                fill(cls, (r.x // s, r.y // s, r.w // s or 1, r.h // s or 1))
+        p = state.player
+        fill(FRAME_CLASSES["player"], (p.x // s, p.y // s, p.w // s, p.h // s))
+
+
+class VectorEnv:
+    def __init__(self, count, obs="state", **env_kwargs):
+        require_numpy()
+        self.count = count
+        self.envs = [SpaceEscapeEnv(obs, **env_kwargs) for _ in range(count)]
+        self.obs_type = obs
+        self.state_obs = np.zeros((count, STATE_SIZE), dtype=np.float32)
+        self.frame_surface = self.frame_obs = None
+        if obs == "frame":
+            scale = self.envs[0].frame_scale
+            w, h = frame_size(scale)
+            self.frame_surface = make_frame_surface(count, scale)
+            # pixels2d é [x, y] sobre as N faixas; vira [N, altura, largura] sem cópia
+            self.frame_obs = pygame.surfarray.pixels2d(self.frame_surface).reshape(w, count, h).transpose(1, 2, 0)
+        for i, env in enumerate(self.envs):
+            if obs == "frame":
+                env.use_buffers(self.state_obs[i], self.frame_surface.subsurface((0, i * h, w, h)),
+                                self.frame_obs[i])
+            else:
+                env.use_buffers(self.state_obs[i], None, None)
+        self.rewards = np.zeros(count, dtype=np.float32)
+        self.terminated = np.zeros(count, dtype=bool)
+        self.truncated = np.zeros(count, dtype=bool)
+        self.next_seeds = [None] * count
+        self.episodes = 0
+
+    @property
+    def obs(self):
+        return self.frame_obs if self.obs_type == "frame" else self.state_obs
+
+    def reset(self, seed=None):
+        # ambiente i começa com a semente seed + i; os episódios seguintes
+        # dele usam seed + i + N, seed + i + 2N, ...
+        infos = []
+        for i, env in enumerate(self.envs):
+            env_seed = None if seed is None else seed + i
+            infos.append(env.reset(env_seed)[1])
+            self.next_seeds[i] = None if env_seed is None else env_seed + self.count
+        return self.obs, infos
+
+    def step(self, actions):
+        # actions: N ações (x, y, fire) — lista ou array [N, 3]
+        if hasattr(actions, "tolist"):
+            actions = actions.tolist()
+        infos = []
+        rewards, terminated, truncated = self.rewards, self.terminated, self.truncated
+        for i, (env, action) in enumerate(zip(self.envs, actions)):
+            obs, rewards[i], terminated[i], truncated[i], info = env.step(action)
+            if terminated[i] or truncated[i]:
+                # fim do episódio: guarda a última obs e recomeça na hora
+                state = env.sim.state
+                info.update(final_obs=obs.copy(), final_score=state.score, final_reason=state.game_over_reason)
+                self.episodes += 1
+                env.reset(self.next_seeds[i])
+                if self.next_seeds[i] is not None:
+                    self.next_seeds[i] += self.count
+            infos.append(info)
+        return self.obs, rewards, terminated, truncated, infos
+
+
+# ----------------------------------------------------------
+# Vazão
+# ----------------------------------------------------------
+def run_throughput(envs=16, steps=5000, obs="state", policy="random", seed=None, **env_kwargs):
+    # roda `steps` passos de N ambientes e imprime env-steps/s
+    venv = VectorEnv(envs, obs, **env_kwargs)
+    venv.reset(seed)
+    policies = [simulation.POLICIES[policy](None if seed is None else seed + i) for i in range(envs)]
+    scores = []
+    start = time.perf_counter()
+    for _ in range(steps):
+        actions = [p(env.sim.state) for p, env in zip(policies, venv.envs)]
+        infos = venv.step(actions)[4]
+        for info in infos:
+            if "final_score" in info:
+                scores.append(info["final_score"])
+    elapsed = time.perf_counter() - start
+    total = envs * steps
+    mean = f"{sum(scores) / len(scores):.1f}" if scores else "-"
+    print(f"{envs} ambientes x {steps} passos (obs={obs}) em {elapsed:.3f}s: "
+          f"{total / elapsed:.0f} env-steps/s, {len(scores)} episódios terminados, pontuação média {mean}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Space Escape — vazão do ambiente para bots")
+    parser.add_argument("--envs", type=int, default=16, help="ambientes rodando juntos")
+    parser.add_argument("--steps", type=int, default=5000, help="passos de cada ambiente")
+    parser.add_argument("--obs", choices=("state", "frame"), default="state")
+    parser.add_argument("--policy", choices=sorted(simulation.POLICIES), default="random")
+    parser.add_argument("--seed", type=int, default=None, help="semente do primeiro ambiente")
+    parser.add_argument("--max-ticks", type=int, default=MAX_TICKS, help="ticks até cortar o episódio")
+    parser.add_argument("--vectorized", action="store_true", help="usa as entidades em arrays do NumPy "
+                        "(outro gerador aleatório: a mesma semente dá outra partida)")
+    parser.add_argument("--meteors", type=int, default=None, help="quantidade de meteoros em todas as fases")
+    parser.add_argument("--levels", metavar="ARQUIVO", help="pacote de fases (.json ou .toml, ver rules.py)")
+    args = parser.parse_args(argv)
+    try:
+        pack = load_level_pack(args.levels) if args.levels else None
+    except (OSError, LevelPackError) as e:
+        parser.error(str(e))
+    try:
+        require_numpy()
+    except RuntimeError as e:
+        parser.error(str(e))
+    return run_throughput(args.envs, args.steps, args.obs, args.policy, args.seed, max_ticks=args.max_ticks,
+                          vectorized=args.vectorized, meteors=args.meteors, pack=pack)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
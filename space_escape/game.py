@@ -0,0 +1,397 @@
+# ----------------------------------------------------------
+# 🚀 JOGO COM JANELA
+# ----------------------------------------------------------
+# main() é o ponto de entrada (spaceScape.py só chama ele). Importar
+# este módulo não abre janela, não inicia o mixer e não carrega nada:
+# o PyGame só é iniciado dentro de main(), as fontes na primeira vez
+# que um texto é desenhado (text_cache.get_font) e o mixer na primeira
+# vez que um som ou a música é pedido (audio.ensure_mixer). Pelo mesmo
+# motivo leaderboard (sqlite3), telemetry (asyncio) e entities (NumPy)
+# só são importados por quem usa: Game, --telemetry e --vectorized.
+#
+# Ordem de uma execução: linha de comando -> tela de início ->
+# introdução -> partida (Game.play) -> tela de fim de jogo.
+
+import argparse
+import random
+import time
+
+import pygame
+
+from space_escape import simulation
+from space_escape.assets import AssetManager
+from space_escape.audio import AudioManager
+from space_escape.background import BackgroundStore
+from space_escape.config import WIDTH, HEIGHT, FPS, TICK_RATE, ASSETS, WHITE
+from space_escape.dirty_render import DirtyRenderer, FullRenderer
+from space_escape.menus import IntroScreen, StartScreen, GameOverScreen, SceneStats, run_scene
+# Salvamento (gravação assíncrona em segundo plano, ver persistence.py)
+from space_escape.persistence import SaveManager, SAVE_FILE, load_game, reset_save
+from space_escape.profiler import FrameProfiler
+from space_escape.render import GameView
+from space_escape.replay import InputRecorder, Replay
+from space_escape.rules import LevelPackError, load_level_pack
+from space_escape.text_cache import TextCache, get_font
+from space_escape.timestep import FixedTimestep
+
+
+# ----------------------------------------------------------
+# ⌨️ LINHA DE COMANDO
+# ----------------------------------------------------------
+# python spaceScape.py                               -> jogo normal
+# python spaceScape.py --headless --ticks N --seed S -> só a simulação, sem janela
+def build_parser():
+    parser = argparse.ArgumentParser(description="Space Escape")
+    parser.add_argument("--headless", action="store_true", help="roda só a simulação, sem janela nem som")
+    parser.add_argument("--ticks", type=int, default=10000, help="(headless) máximo de ticks por partida")
+    parser.add_argument("--seed", type=int, default=None, help="semente dos meteoros")
+    parser.add_argument("--games", type=int, default=1, help="(headless) quantidade de partidas")
+    parser.add_argument("--policy", choices=sorted(simulation.POLICIES), default="random",
+                        help="(headless) quem joga: " + ", ".join(sorted(simulation.POLICIES)))
+    parser.add_argument("--vectorized", action="store_true",
+                        help="entidades em arrays do NumPy (para fases com milhares de meteoros)")
+    parser.add_argument("--meteors", type=int, default=None, help="quantidade de meteoros em todas as fases")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="redesenha e envia à tela só as áreas que mudaram (máquinas fracas)")
+    parser.add_argument("--profile", action="store_true",
+                        help="mostra o overlay de tempos por fase desde o início (F3 liga/desliga)")
+    parser.add_argument("--profile-trace", metavar="ARQUIVO",
+                        help="grava o tempo de cada fase, frame a frame, em .csv ou .json ao sair")
+    parser.add_argument("--fps", type=int, default=FPS,
+                        help="frames desenhados por segundo (0 = sem limite); a velocidade do jogo não muda")
+    parser.add_argument("--player", help="nome do jogador no leaderboard (padrão: jogador)")
+    parser.add_argument("--scene-stats", action="store_true",
+                        help="ao sair, mostra tempo e uso de CPU de cada tela (introdução, início, fim)")
+    parser.add_argument("--record", metavar="ARQUIVO", help="grava a entrada da partida para replay (.serp)")
+    parser.add_argument("--replay", metavar="ARQUIVO", help="assiste a uma partida gravada com --record")
+    parser.add_argument("--levels", metavar="ARQUIVO",
+                        help="pacote de fases e vitória (.json ou .toml, ver rules.py e fases/)")
+    parser.add_argument("--telemetry", type=int, metavar="PORTA",
+                        help="transmite o estado da partida em NDJSON nesta porta local (ver telemetry.py)")
+    return parser
+
+
+class Game:
+    def __init__(self, args, pack=None):
+        self.args = args
+        # pacote de fases (--levels); None = LEVELS e WIN_SCORE de config.py
+        self.pack = pack
+        # Inicializa só o vídeo (e eventos); fontes e mixer quando forem usados
+        pygame.display.init()
+        pygame.display.set_caption("🚀 Space Escape")
+
+        # Tela do jogo
+        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+
+        # High Scores: todas as partidas ficam num banco SQLite (ver
+        # leaderboard.py); o highscores.txt antigo é importado na primeira vez
+        from space_escape.leaderboard import Leaderboard, DEFAULT_PLAYER
+        self.leaderboard = Leaderboard()
+        if args.player is None:
+            args.player = DEFAULT_PLAYER
+
+        # Textos já renderizados (HUD, menus, high scores), ver text_cache.py
+        self.text_cache = TextCache()
+
+        # As imagens e sons são carregados só quando usados pela primeira vez
+        # e as imagens já redimensionadas ficam em cache no disco (ver assets.py)
+        self.assets = AssetManager()
+
+        # Efeitos decodificados uma vez (PCM em cache no disco), com canais
+        # próprios e limite de vozes; música em stream (ver audio.py)
+        self.audio = AudioManager(timings=self.assets.timings)
+
+        # Telas paradas: desenham uma vez e dormem em pygame.event.wait()
+        # até chegar uma tecla ou clique (ver menus.py)
+        self.scene_stats = SceneStats()
+
+    def render_text(self, font, text, color=WHITE):
+        return self.text_cache.render(font, text, color, True)
+
+    # Função auxiliar para carregar imagens de forma segura
+    # (gera um fallback colorido se o arquivo não existir)
+    def load_image(self, filename, fallback_color, size=None):
+        return self.assets.image(filename, fallback_color, size)
+
+    # Fundo de cada fase (carregado quando a fase começa)
+    def level_background(self, idx):
+        return self.backgrounds.get(idx)
+
+    def load_highscores(self):
+        return self.leaderboard.top_scores()
+
+    def start_music(self):
+        # Música de fundo (opcional)
+        self.audio.start_music(ASSETS["music"])
+
+    def stop_music(self):
+        self.audio.stop_music()
+
+    def show_intro_screen(self):
+        intro = IntroScreen(self.render_text, lambda: self.level_background(0), self.load_highscores,
+                            get_font(72), get_font(36))
+        run_scene(self.screen, intro, self.scene_stats)
+
+    # Tela de escolha: continuar jogo salvo ou começar novo
+    def show_start_screen(self):
+        option = run_scene(self.screen, StartScreen(self.render_text, get_font(72), get_font(36)),
+                           self.scene_stats)
+        if option == "new":
+            reset_save()
+        return option
+
+    def show_game_over(self, reason, score):
+        # Exibe a tela apropriada (vitória ou derrota); as imagens só são
+        # carregadas agora, quando realmente vão aparecer
+        if reason == 'victory':
+            end_image = self.load_image(ASSETS["victory_screen"], WHITE, (WIDTH, HEIGHT))
+        elif reason == 'defeat':
+            end_image = self.load_image(ASSETS["defeat_screen"], WHITE, (WIDTH, HEIGHT))
+        else:
+            end_image = None
+        run_scene(self.screen, GameOverScreen(self.render_text, end_image, score, get_font(48)),
+                  self.scene_stats)
+
+    def run(self):
+        args = self.args
+        self.start_music()
+
+        # ----------------------------------------------------------
+        # 🧠 VARIÁVEIS DE JOGO
+        # ----------------------------------------------------------
+        # todo o estado da partida (nave, meteoros, projéteis, pontos, vidas,
+        # nível) fica na simulação; aqui só lemos a entrada e desenhamos
+        # --replay: semente, jogo salvo e entradas vêm do arquivo gravado
+        replay = Replay.load(args.replay) if args.replay else None
+        if replay:
+            sim = replay.make_simulation()
+        else:
+            sim = simulation.make_simulation(seed=args.seed, vectorized=args.vectorized, meteors=args.meteors,
+                                             pack=self.pack)
+
+        # Fundos das fases: carregados quando a fase começa, opacos em
+        # convert() e descartados acima de um limite de memória (ver background.py)
+        self.backgrounds = BackgroundStore(self.assets, sim.levels)
+
+        saved = None
+        if not replay:
+            start_option = self.show_start_screen()
+
+            if start_option == "continue":
+                saved = load_game()
+                if saved:
+                    sim.load_save(saved)
+
+        # --record: guarda o ponto de partida e, depois, a entrada de cada tick
+        recorder = InputRecorder(sim.seed, args.meteors, args.vectorized, saved, self.pack,
+                                 sim.masks is not None, sim.sprites) if args.record else None
+
+        # mostra a tela introdutória uma vez antes do loop principal
+        if not replay:
+            self.show_intro_screen()
+
+        run_start = time.perf_counter()
+        self.play(sim, replay, recorder)
+        state = sim.state
+
+        if recorder:
+            recorder.finish(state)
+            recorder.save(args.record)
+            print(f"Partida gravada em {args.record} ({recorder.ticks} ticks, {len(recorder.stream)} bytes de entrada)")
+
+        # Registra a partida no leaderboard (replays não contam)
+        if not replay:
+            self.leaderboard.record_run(state.score, level=state.level_idx + 1,
+                                        duration_s=time.perf_counter() - run_start, seed=args.seed,
+                                        player=args.player, result=state.game_over_reason or "saiu")
+
+        # ----------------------------------------------------------
+        # 🏁 TELA DE FIM DE JOGO
+        # ----------------------------------------------------------
+        self.stop_music()
+        self.show_game_over(state.game_over_reason, state.score)
+
+        if args.scene_stats:
+            print("\n".join(self.scene_stats.summary_lines()))
+
+        if not replay:
+            reset_save() # evita carregar um jogo já terminado
+        self.leaderboard.close()
+
+    # ----------------------------------------------------------
+    # 🕹️ LOOP PRINCIPAL
+    # ----------------------------------------------------------
+    def play(self, sim, replay=None, recorder=None):
+        args = self.args
+        state = sim.state
+        screen = self.screen
+
+        # ----------------------------------------------------------
+        # 🖼️ SPRITES E SONS DA PARTIDA
+        # ----------------------------------------------------------
+        # decodifica os efeitos agora, não no primeiro ponto da partida
+        audio = self.audio
+        audio.load()
+
+        # o loop só registra o estado; a gravação em disco acontece em outra thread
+        # (assistindo um replay nada é salvo)
+        saver = SaveManager(None if replay else SAVE_FILE)
+
+        # desenho em tela cheia (padrão) ou só dos retângulos que mudaram
+        renderer = (DirtyRenderer if args.dirty_rects else FullRenderer)(
+            screen, self.level_background(state.level_idx))
+        touched_total = 0.0
+        frames_drawn = 0
+
+        # tempos por fase do frame (F3 mostra/esconde o overlay)
+        profiler = FrameProfiler(trace=bool(args.profile_trace))
+        profiler.overlay_visible = args.profile
+        sim.profiler = profiler
+
+        # sprites, atlas dos meteoros e HUD (ver render.py)
+        view = GameView(renderer, self.assets, self.text_cache, levels=sim.levels, profiler=profiler)
+
+        # --telemetry: servidor numa thread própria; sem cliente conectado
+        # cada publish_*() só compara um contador (ver telemetry.py)
+        telemetry = None
+        if args.telemetry is not None:
+            from space_escape.telemetry import start_server
+            telemetry = start_server(args.telemetry, levels=sim.levels)
+
+        # tempo gasto com cada asset até aqui (decodificação ou cache)
+        self.assets.report("Assets carregados até o início da partida")
+
+        replay_inputs = replay.inputs() if replay else None
+        # a simulação anda em ticks fixos (TICK_RATE por segundo), independente
+        # de quantos frames são desenhados (ver timestep.py)
+        timestep = FixedTimestep()
+        # um clique vale para o próximo tick, mesmo que o frame atual não rode nenhum
+        fire = False
+        running = True
+        clock = pygame.time.Clock()
+        while running:
+            profiler.begin_frame()
+            frame_ms = clock.tick(args.fps)
+            profiler.lap("wait")
+
+            # --- Eventos ---
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                # Disparo: clique esquerdo do mouse ou barra de espaço
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    if event.button == 1:  # botão esquerdo
+                        fire = True
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_SPACE:
+                        fire = True
+                    if event.key == pygame.K_F3:
+                        profiler.toggle_overlay()
+
+            # --- Movimento do jogador via mouse (apenas mouse ativa o movimento) ---
+            # a nave vai para a posição do cursor; a simulação cuida do resto
+            # (limites da tela, meteoros, projéteis, pontos, vidas e níveis)
+            mx, my = pygame.mouse.get_pos()
+            profiler.lap("events")
+
+            for _ in range(timestep.advance(frame_ms)):
+                if replay_inputs is not None:
+                    # replay: a entrada vem do arquivo, não do mouse
+                    inp = next(replay_inputs, None)
+                    if inp is None:
+                        running = False
+                        break
+                else:
+                    inp = simulation.TickInput(mx, my, fire)
+                    fire = False
+                if recorder:
+                    recorder.record(inp)
+                events = sim.step(inp)
+                if telemetry:
+                    telemetry.publish_tick(state, events)
+
+                # --- Sons e reações aos eventos do tick ---
+                for ev in events:
+                    if ev in ("point", "kill"):
+                        audio.play("point")
+                    elif ev == "hit":
+                        audio.play("hit")
+                    elif ev == "level":
+                        renderer.set_background(self.level_background(state.level_idx))
+                        saver.update(state.score, state.lives, state.level_idx,
+                                     state.player.centerx, state.player.centery)
+                        saver.flush()
+                if state.done:
+                    running = False
+                    break
+                profiler.lap("events")
+
+            # --- Desenha tudo (nave, projéteis, meteoros, HUD) ---
+            # (entre o tick anterior e o atual, conforme o tempo que sobrou no acumulador)
+            view.draw(state, 1.0 if state.done else timestep.alpha)
+
+            # salva automaticamente durante o jogo (só marca o estado; quem grava é o SaveManager)
+            saver.update(state.score, state.lives, state.level_idx, state.player.centerx, state.player.centery)
+            profiler.lap("save")
+
+            renderer.end_frame()
+            profiler.lap("flip")
+            profiler.end_frame()
+            if telemetry and profiler.frames % TICK_RATE == 0:
+                telemetry.publish_frame(profiler)
+            touched_total += renderer.touched_fraction
+            frames_drawn += 1
+
+        # fim de jogo ou saída: grava o último estado e encerra a thread de salvamento
+        saver.close()
+        if telemetry:
+            telemetry.publish_end(state)
+            telemetry.close()
+            print(telemetry.summary_line())
+        print(f"Saves: {saver.saves_written} gravados, {saver.saves_skipped} ignorados")
+        if frames_drawn:
+            print(f"Tela atualizada por frame: {100 * touched_total / frames_drawn:.1f}% em média")
+        for name, st in sim.pool_stats().items():
+            if st["reused"]:
+                print(f"Pool {name}: máx {st['high_water']} em uso, {st['reused']} alocações evitadas, "
+                      f"{st['created'] - st['capacity']} Rects extras")
+        bg = self.backgrounds.stats()
+        print(f"Fundos: {bg['loads']} carregados, {bg['evictions']} descartados, "
+              f"{bg['loaded']} em memória ({bg['bytes'] / 2 ** 20:.1f} MB)")
+        for line in audio.summary_lines():
+            print(line)
+        if timestep.dropped_ticks:
+            print(f"Ticks descartados (frames lentos demais): {timestep.dropped_ticks}")
+        if args.profile or args.profile_trace:
+            print("\n".join(profiler.summary_lines()))
+        if args.profile_trace:
+            profiler.dump(args.profile_trace)
+            print(f"Traço de {profiler.frames} frames gravado em {args.profile_trace}")
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        pack = load_level_pack(args.levels) if args.levels else None
+    except (OSError, LevelPackError) as e:
+        parser.error(str(e))
+
+    if args.headless:
+        return simulation.run_headless(args.ticks, args.seed, args.games, args.policy,
+                                       args.vectorized, args.meteors, pack)
+
+    # a partida sempre tem semente: assim ela pode ser gravada (--record)
+    # e reproduzida exatamente igual depois
+    if args.seed is None:
+        args.seed = random.randrange(2 ** 31)
+
+    try:
+        Game(args, pack).run()
+    finally:
+        pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
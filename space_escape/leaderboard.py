@@ -0,0 +1,174 @@
+# ----------------------------------------------------------
+# 🏆 LEADERBOARD (SQLite)
+# ----------------------------------------------------------
+# Cada partida vira uma linha na tabela `runs` (jogador, pontos, nível
+# alcançado, duração, semente, resultado e data). Nada é descartado:
+# o top-N é só uma consulta ordenada, servida pelo índice
+# (score DESC), e as consultas por jogador usam o índice
+# (player, score DESC) — as duas são O(log n) + N linhas lidas.
+#
+# Várias instâncias do jogo na mesma máquina podem gravar ao mesmo
+# tempo: o banco fica em modo WAL (leitores não bloqueiam o escritor),
+# cada gravação é uma transação curta BEGIN IMMEDIATE e, se outra
+# instância estiver gravando, o SQLite espera até `timeout` segundos.
+#
+# Na primeira abertura o highscores.txt antigo é importado (uma vez
+# só, marcado na tabela `meta`).
+
+import argparse
+import os
+import sqlite3
+import time
+from collections import namedtuple
+
+LEADERBOARD_FILE = "leaderboard.db"
+# arquivo do formato antigo (um número por linha)
+HIGHSCORES_FILE = "highscores.txt"
+MAX_HIGHSCORES = 5
+DEFAULT_PLAYER = "jogador"
+# jogador das pontuações vindas do highscores.txt
+IMPORTED_PLAYER = "importado"
+
+Run = namedtuple("Run", "id player score level duration_s seed result created_at")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    level INTEGER,
+    duration_s REAL,
+    seed INTEGER,
+    result TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_score ON runs (score DESC, created_at);
+CREATE INDEX IF NOT EXISTS runs_by_player ON runs (player, score DESC, created_at);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_COLUMNS = "id, player, score, level, duration_s, seed, result, created_at"
+
+
+class Leaderboard:
+    def __init__(self, path=LEADERBOARD_FILE, timeout=5.0, import_from=HIGHSCORES_FILE):
+        self.path = path
+        # isolation_level=None: as transações são abertas à mão (BEGIN IMMEDIATE)
+        self.conn = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        # em WAL, NORMAL ainda é seguro contra corrupção e evita um fsync por partida
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # executescript() faria COMMIT por conta própria; aqui cada
+        # comando roda dentro da mesma transação
+        with self._write():
+            for stmt in _SCHEMA.split(";"):
+                if stmt.strip():
+                    self.conn.execute(stmt)
+        if import_from:
+            self.import_highscores_txt(import_from)
+
+    def _write(self):
+        return _Transaction(self.conn)
+
+    # ------------------------------------------------------
+    # Gravação
+    # ------------------------------------------------------
+    def record_run(self, score, level=None, duration_s=None, seed=None,
+                   player=DEFAULT_PLAYER, result=None, created_at=None):
+        with self._write():
+            cur = self.conn.execute(
+                "INSERT INTO runs (player, score, level, duration_s, seed, result, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (player, int(score), level, duration_s, seed, result,
+                 time.time() if created_at is None else created_at))
+        return cur.lastrowid
+
+    def import_highscores_txt(self, path=HIGHSCORES_FILE):
+        # importa o formato antigo uma única vez; devolve quantas pontuações entraram
+        if not os.path.exists(path):
+            return 0
+        key = f"imported:{os.path.abspath(path)}"
+        with self._write():
+            # dentro da transação: duas instâncias abrindo juntas não importam duas vezes
+            if self.conn.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone():
+                return 0
+            with open(path, "r") as f:
+                scores = [int(line.strip()) for line in f if line.strip().isdigit()]
+            created = os.path.getmtime(path)
+            self.conn.executemany(
+                "INSERT INTO runs (player, score, result, created_at) VALUES (?, ?, 'importado', ?)",
+                [(IMPORTED_PLAYER, s, created) for s in scores])
+            self.conn.execute("INSERT INTO meta (key, value) VALUES (?, ?)", (key, str(len(scores))))
+        return len(scores)
+
+    # ------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------
+    def top(self, n=MAX_HIGHSCORES):
+        rows = self.conn.execute(
+            f"SELECT {_COLUMNS} FROM runs ORDER BY score DESC, created_at LIMIT ?", (n,))
+        return [Run(*row) for row in rows]
+
+    def top_scores(self, n=MAX_HIGHSCORES):
+        return [run.score for run in self.top(n)]
+
+    def player_top(self, player, n=MAX_HIGHSCORES):
+        rows = self.conn.execute(
+            f"SELECT {_COLUMNS} FROM runs WHERE player = ? ORDER BY score DESC, created_at LIMIT ?",
+            (player, n))
+        return [Run(*row) for row in rows]
+
+    def player_best(self, player):
+        runs = self.player_top(player, 1)
+        return runs[0] if runs else None
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+
+class _Transaction:
+    # BEGIN IMMEDIATE pega o lock de escrita logo no início: se outra
+    # instância estiver gravando, espera aqui (busy timeout) em vez de
+    # falhar no meio da transação
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+
+def format_run(pos, run):
+    level = f"nível {run.level}" if run.level is not None else "-"
+    duration = f"{run.duration_s:.0f}s" if run.duration_s is not None else "-"
+    when = time.strftime("%Y-%m-%d %H:%M", time.localtime(run.created_at))
+    return f"{pos:3d}. {run.score:6d}  {run.player:<12} {level:<8} {duration:>6}  {when}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Space Escape — leaderboard")
+    parser.add_argument("--db", default=LEADERBOARD_FILE, help="arquivo do banco")
+    parser.add_argument("--top", type=int, default=10, help="quantas partidas mostrar")
+    parser.add_argument("--player", help="só as partidas deste jogador")
+    args = parser.parse_args(argv)
+    board = Leaderboard(args.db)
+    runs = board.player_top(args.player, args.top) if args.player else board.top(args.top)
+    print(f"{board.count()} partidas registradas")
+    for pos, run in enumerate(runs, start=1):
+        print(format_run(pos, run))
+    board.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
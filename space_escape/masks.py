@@ -0,0 +1,123 @@
+# ----------------------------------------------------------
+# 🎭 COLISÃO POR PIXEL (máscaras pré-calculadas)
+# ----------------------------------------------------------
+# O rect de 40x40 de um meteoro não é o que aparece na tela: o desenho
+# é um dos frames girados do atlas (atlas.py), centralizado sobre o
+# rect e com cantos transparentes; a nave também tem transparência em
+# volta. Para uma batida só valer quando pixels visíveis se encostam,
+# cada frame ganha uma pygame.mask.Mask, criada uma única vez no
+# carregamento (from_surface a cada tick custaria caro).
+#
+# A colisão fica em duas etapas: o teste de retângulo (sweep.py) acha
+# os pares candidatos em C e só esses pares passam por Mask.overlap.
+# Como a colisão é contínua, a máscara é testada ao longo do movimento
+# do tick, de pixel em pixel a partir do tempo de impacto dos
+# retângulos; o toi do par passa a ser o do primeiro pixel encostado.
+#
+# As imagens vêm do AssetManager (sempre de config.ASSET_DIR, com o
+# mesmo cache em disco do jogo; sem janela elas só não passam por
+# convert()), e as máscaras ficam em cache no processo: todas as
+# partidas usam as mesmas.
+
+import math
+
+import pygame
+
+from space_escape import config
+from space_escape.assets import AssetManager
+from space_escape.atlas import RotationAtlas, frame_phase, swing_angles
+
+
+class SpriteMasks:
+    def __init__(self, frames, phases=False):
+        # frames: [(Mask, (dx, dy))], com o deslocamento do frame sobre o rect
+        self.frames = frames
+        self.count = len(frames)
+        self.phases = phases
+
+    @classmethod
+    def from_atlas(cls, atlas, phases=False):
+        return cls([(pygame.mask.from_surface(atlas.frame(k)), atlas.offsets[k])
+                    for k in range(atlas.count)], phases)
+
+    @classmethod
+    def from_surface(cls, surface):
+        return cls([(pygame.mask.from_surface(surface), (0, 0))])
+
+    @classmethod
+    def filled(cls, size):
+        # projéteis são desenhados como retângulo cheio
+        return cls([(pygame.mask.Mask(size, fill=True), (0, 0))])
+
+    def frame(self, anim_index, i):
+        # o mesmo frame que o SpriteBatch desenha para a entidade i
+        return self.frames[(anim_index + frame_phase(i, self.count, self.phases)) % self.count]
+
+
+def mask_toi(a, a_frame, dx, dy, b, b_frame, toi):
+    # `a` terminou o tick em a e andou (dx, dy) em relação a `b` (como em
+    # sweep.time_of_impact); testa as máscaras de pixel em pixel de `toi`
+    # até o fim do tick e devolve o primeiro instante com pixels
+    # encostados, ou None
+    a_mask, (aox, aoy) = a_frame
+    b_mask, (box, boy) = b_frame
+    # posição de a em relação a b no fim do tick
+    rx = a.x + aox - b.x - box
+    ry = a.y + aoy - b.y - boy
+    steps = math.ceil(max(abs(dx), abs(dy)) * (1 - toi))
+    for k in range(steps + 1):
+        t = toi + (1 - toi) * k / steps if steps else toi
+        back = 1 - t
+        if b_mask.overlap(a_mask, (round(rx - dx * back), round(ry - dy * back))):
+            return t
+    return None
+
+
+class CollisionMasks:
+    def __init__(self, player, meteor, life_meteor, bullet):
+        self.player = player
+        self.meteor = meteor
+        self.life_meteor = life_meteor
+        self.bullet = bullet
+
+    def confirm(self, pairs, movers, mover, dx, dy, targets, target, anim_index):
+        # pares (toi, i, j) aceitos pelo retângulo -> só os que encostam
+        # pixel com pixel, com o toi do primeiro pixel, em ordem de toi.
+        # mover/target: nome do sprite de cada lado ("meteor", ...);
+        # movers/targets só precisam de [i] -> Rect (lista ou dicionário)
+        mover = getattr(self, mover)
+        target = getattr(self, target)
+        hits = []
+        for toi, i, j in pairs:
+            t = mask_toi(movers[i], mover.frame(anim_index, i), dx, dy,
+                         targets[j], target.frame(anim_index, j), toi)
+            if t is not None:
+                hits.append((t, i, j))
+        hits.sort()
+        return hits
+
+
+# config.sprite_config() -> máscaras (uma vez por processo para cada animação)
+_masks = {}
+
+
+def collision_masks(sprites=None, assets=None):
+    # máscaras de nave, meteoros, meteoros de vida e projéteis
+    sprites = sprites or config.sprite_config()
+    key = tuple(sorted(sprites.items()))
+    masks = _masks.get(key)
+    if masks is None:
+        # keep=False: depois das máscaras prontas as imagens não servem mais
+        assets = assets or AssetManager()
+        player = assets.image(config.ASSETS["player"], config.BLUE, config.PLAYER_SIZE, keep=False)
+        meteor = assets.image(config.ASSETS["meteor"], config.RED, config.METEOR_SIZE, keep=False)
+        life = assets.image(config.ASSETS["life_meteor"], (0, 255, 0), config.METEOR_SIZE, keep=False)
+        # mesmos frames girados que o GameView desenha (render.py)
+        frames = sprites["anim_frames"]
+        meteor_atlas = RotationAtlas(meteor, swing_angles(frames, sprites["swing_deg"]))
+        life_atlas = RotationAtlas(life, swing_angles(frames, sprites["life_swing_deg"]))
+        masks = _masks[key] = CollisionMasks(SpriteMasks.from_surface(player),
+                                             SpriteMasks.from_atlas(meteor_atlas, sprites["phases"]),
+                                             SpriteMasks.from_atlas(life_atlas, sprites["phases"]),
+                                             SpriteMasks.filled(config.BULLET_SIZE))
+    return masks
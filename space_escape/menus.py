@@ -0,0 +1,251 @@
+# ----------------------------------------------------------
+# 📋 TELAS PARADAS (introdução, início, fim de jogo)
+# ----------------------------------------------------------
+# Nessas telas nada se mexe sozinho, então não faz sentido redesenhar
+# 60 vezes por segundo. run_scene() desenha a tela uma vez e depois
+# fica bloqueado em pygame.event.wait() — o processo dorme até chegar
+# uma tecla, um clique ou um evento de timer — e só redesenha quando
+# a cena pede (scene.dirty = True) ou quando o timer dela dispara.
+#
+# Uma cena implementa:
+#   enter()        -> chamado uma vez ao entrar (ex.: ler os high scores)
+#   draw(screen)   -> desenha a tela inteira
+#   handle(event)  -> devolve None para continuar ou o resultado da cena
+#   timer_ms       -> > 0 redesenha também a cada timer_ms (animações)
+#
+# SceneStats guarda, por cena, o tempo de parede, o tempo de CPU do
+# processo, quantos redesenhos e quantos eventos houve; com isso dá
+# para ver quanto da CPU uma tela parada está usando.
+
+import time
+
+import pygame
+
+from space_escape.config import WIDTH, HEIGHT, WHITE
+
+# evento do timer das cenas animadas
+REDRAW_EVENT = pygame.event.custom_type()
+
+
+def quit_game():
+    pygame.quit()
+    raise SystemExit
+
+
+class Scene:
+    name = "cena"
+    timer_ms = 0
+
+    def __init__(self):
+        self.dirty = True
+
+    def enter(self):
+        pass
+
+    def draw(self, screen):
+        pass
+
+    def handle(self, event):
+        return None
+
+
+class SceneStats:
+    def __init__(self):
+        # (nome, segundos de parede, segundos de CPU, redesenhos, eventos)
+        self.rows = []
+
+    def record(self, name, wall, cpu, frames, events):
+        self.rows.append((name, wall, cpu, frames, events))
+
+    def summary_lines(self):
+        lines = ["cena            tempo(s)  CPU(s)   CPU%  redesenhos  eventos"]
+        for name, wall, cpu, frames, events in self.rows:
+            pct = 100 * cpu / wall if wall > 0 else 0.0
+            lines.append(f"{name:<14} {wall:9.2f} {cpu:7.3f} {pct:6.1f} {frames:11d} {events:8d}")
+        return lines
+
+
+def run_scene(screen, scene, stats=None):
+    # desenha, espera eventos e devolve o resultado de scene.handle()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    frames = 0
+    events = 0
+
+    scene.enter()
+    scene.dirty = True
+    if scene.timer_ms:
+        pygame.time.set_timer(REDRAW_EVENT, scene.timer_ms)
+    try:
+        result = None
+        while result is None:
+            if scene.dirty:
+                scene.draw(screen)
+                pygame.display.flip()
+                scene.dirty = False
+                frames += 1
+
+            # dorme até o próximo evento e depois trata o que mais tiver chegado junto
+            pending = [pygame.event.wait()] + pygame.event.get()
+            for event in pending:
+                events += 1
+                if event.type == REDRAW_EVENT:
+                    scene.dirty = True
+                    continue
+                if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                    # janela voltou a aparecer: o conteúdo precisa ser refeito
+                    scene.dirty = True
+                    continue
+                result = scene.handle(event)
+                if result is not None:
+                    break
+    finally:
+        if scene.timer_ms:
+            pygame.time.set_timer(REDRAW_EVENT, 0)
+        if stats is not None:
+            stats.record(scene.name, time.perf_counter() - wall_start,
+                         time.process_time() - cpu_start, frames, events)
+    return result
+
+
+# ----------------------------------------------------------
+# Telas do jogo
+# ----------------------------------------------------------
+class IntroScreen(Scene):
+    name = "introdução"
+
+    def __init__(self, render_text, background, load_scores, font_big, font_small):
+        super().__init__()
+        self.render_text = render_text
+        self.background = background
+        self.load_scores = load_scores
+        self.font_big = font_big
+        self.font_small = font_small
+        self.scores = []
+
+    def enter(self):
+        # lê os high scores uma vez por entrada na tela, não a cada desenho
+        self.scores = self.load_scores()
+
+    def draw(self, screen):
+        render_text, font_small = self.render_text, self.font_small
+        # fundo da primeira fase na tela de introdução
+        self.background().draw(screen)
+
+        title = render_text(self.font_big, "SPACE ESCAPE")
+        title_rect = title.get_rect(center=(WIDTH // 2, 100))
+        screen.blit(title, title_rect)
+
+        # High Scores
+        y = 200
+        hs_title = render_text(font_small, "High Scores:")
+        screen.blit(hs_title, (WIDTH // 2 - 80, y))
+        y += 40
+
+        if self.scores:
+            for i, s in enumerate(self.scores, start=1):
+                txt = render_text(font_small, f"{i}. {s}")
+                screen.blit(txt, (WIDTH // 2 - 50, y))
+                y += 30
+        else:
+            txt = render_text(font_small, "Pressione qualquer tecla para começar")
+            screen.blit(txt, (WIDTH // 2 - 80, y))
+
+        instr = render_text(font_small, "Pressione qualquer tecla para começar")
+        instr_rect = instr.get_rect(center=(WIDTH // 2, HEIGHT - 100))
+        screen.blit(instr, instr_rect)
+
+    def handle(self, event):
+        if event.type == pygame.QUIT:
+            quit_game()
+        if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
+            return True
+        return None
+
+
+class StartScreen(Scene):
+    # Tela de escolha: continuar jogo salvo ou começar novo
+    name = "início"
+
+    def __init__(self, render_text, font_big, font_small):
+        super().__init__()
+        self.render_text = render_text
+        self.font_big = font_big
+        self.font_small = font_small
+        self.cont_rect = self.new_rect = self.quit_rect = pygame.Rect(0, 0, 0, 0)
+
+    def draw(self, screen):
+        render_text, font_small = self.render_text, self.font_small
+        screen.fill((10, 10, 30))
+
+        title = render_text(self.font_big, "SPACE ESCAPE")
+        screen.blit(title, (WIDTH//2 - title.get_width()//2, 150))
+
+        continue_msg = render_text(font_small, "1 - Continuar jogo salvo")
+        new_msg = render_text(font_small, "2 - Novo jogo")
+        quit_msg = render_text(font_small, "ESC - Sair")
+
+        # posiciona as opções em linhas separadas para evitar sobreposição
+        x = WIDTH // 2 - 150
+        y = 300
+        gap = 40
+        cont_pos = (x, y)
+        new_pos = (x, y + gap)
+        quit_pos = (x, y + 2 * gap)
+        screen.blit(continue_msg, cont_pos)
+        screen.blit(new_msg, new_pos)
+        screen.blit(quit_msg, quit_pos)
+
+        # cria rects para tornar as opções clicáveis
+        self.cont_rect = continue_msg.get_rect(topleft=cont_pos)
+        self.new_rect = new_msg.get_rect(topleft=new_pos)
+        self.quit_rect = quit_msg.get_rect(topleft=quit_pos)
+
+    def handle(self, event):
+        if event.type == pygame.QUIT:
+            quit_game()
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_1 or event.key == pygame.K_KP1:
+                return "continue"
+            if event.key == pygame.K_2 or event.key == pygame.K_KP2:
+                return "new"
+            if event.key == pygame.K_ESCAPE:
+                quit_game()
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            mx, my = event.pos
+            if self.cont_rect.collidepoint(mx, my):
+                return "continue"
+            if self.new_rect.collidepoint(mx, my):
+                return "new"
+            if self.quit_rect.collidepoint(mx, my):
+                quit_game()
+        return None
+
+
+class GameOverScreen(Scene):
+    # vitória, derrota ou saída no meio do jogo, com a pontuação final no rodapé
+    name = "fim de jogo"
+
+    def __init__(self, render_text, image, score, font):
+        super().__init__()
+        self.render_text = render_text
+        self.image = image
+        self.score = score
+        self.font = font
+
+    def draw(self, screen):
+        if self.image is not None:
+            screen.blit(self.image, (0, 0))
+        else:
+            # Fallback genérico
+            screen.fill((20, 20, 20))
+
+        # Exibe a pontuação final no rodapé
+        final_score_text = self.render_text(self.font, f"Pontuação final: {self.score}", WHITE)
+        final_score_rect = final_score_text.get_rect(center=(WIDTH // 2, HEIGHT - 50))
+        screen.blit(final_score_text, final_score_rect)
+
+    def handle(self, event):
+        if event.type == pygame.QUIT or event.type == pygame.KEYDOWN:
+            return True
+        return None
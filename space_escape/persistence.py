@@ -0,0 +1,135 @@
+# ----------------------------------------------------------
+# 💾 SALVAMENTO DO JOGO
+# ----------------------------------------------------------
+# O loop principal só marca o estado como "sujo" a cada frame;
+# a escrita em disco acontece numa thread separada, no máximo
+# uma vez a cada `interval` segundos, ou imediatamente quando
+# pedimos um flush (troca de nível, fim de jogo, saída).
+# A escrita é atômica: grava num arquivo temporário na mesma
+# pasta e troca com os.replace, então um save nunca fica pela
+# metade mesmo se o jogo for fechado no meio da escrita.
+
+import json
+import os
+import tempfile
+import threading
+
+SAVE_FILE = "savegame.json"
+# intervalo padrão entre gravações automáticas (segundos)
+SAVE_INTERVAL_S = 2.0
+
+
+def load_game(path=SAVE_FILE):
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def reset_save(path=SAVE_FILE):
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def write_atomic(path, data):
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".save-", suffix=".tmp", dir=folder)
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class SaveManager:
+    def __init__(self, path=SAVE_FILE, interval=SAVE_INTERVAL_S):
+        self.path = path
+        self.interval = interval
+        # contadores: snapshots gravados em disco e snapshots descartados
+        # (substituídos por um mais novo antes de serem gravados, ou
+        # idênticos ao último já gravado)
+        self.saves_written = 0
+        self.saves_skipped = 0
+        self._pending = None
+        self._last_written = None
+        self._cond = threading.Condition()
+        self._flush_requested = False
+        self._writing = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+        self._thread.start()
+
+    def update(self, score, lives, level, player_x, player_y):
+        # chamado a cada frame: só guarda o snapshot em memória
+        if self.path is None:
+            # path=None: não grava nada (ex.: assistindo um replay)
+            return
+        data = {
+            "score": score,
+            "lives": lives,
+            "level": level,
+            "player_x": player_x,
+            "player_y": player_y,
+        }
+        with self._cond:
+            if self._pending is not None:
+                self.saves_skipped += 1
+            self._pending = data
+
+    def flush(self, wait=False):
+        # pede gravação imediata do snapshot pendente
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            if wait:
+                while (self._pending is not None or self._flush_requested or self._writing) \
+                        and self._thread.is_alive():
+                    self._cond.wait(0.1)
+
+    def close(self):
+        # grava o que estiver pendente e encerra a thread
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._closed and not self._flush_requested:
+                    self._cond.wait(self.interval)
+                data = self._pending
+                self._pending = None
+                self._flush_requested = False
+                self._writing = data is not None
+                closed = self._closed
+
+            if data is not None:
+                if data == self._last_written:
+                    with self._cond:
+                        self.saves_skipped += 1
+                else:
+                    try:
+                        write_atomic(self.path, data)
+                        self._last_written = data
+                        with self._cond:
+                            self.saves_written += 1
+                    except OSError as e:
+                        print(f"Falha ao salvar o jogo: {e}")
+
+            with self._cond:
+                self._writing = False
+                self._cond.notify_all()
+            if closed:
+                return
@@ -0,0 +1,58 @@
+# ----------------------------------------------------------
+# ♻️ POOL DE RETÂNGULOS
+# ----------------------------------------------------------
+# Projéteis e meteoros nascem e morrem o tempo todo; em vez de criar
+# um pygame.Rect novo a cada tiro (e deixar o antigo para o coletor
+# de lixo), cada grupo tem um RectPool com Rects já criados:
+# acquire() tira um da lista livre e só posiciona, release() devolve.
+#
+# O pool começa com `capacity` Rects; se acabar, cria mais (um tiro
+# nunca é perdido por falta de Rect) e conta isso em `created`, para
+# dar para ajustar a capacidade olhando `high_water`.
+
+import pygame
+
+
+class RectPool:
+    def __init__(self, size, capacity=0):
+        self.size = size
+        self.free = [pygame.Rect((0, 0), size) for _ in range(capacity)]
+        self.capacity = capacity
+        # Rects criados no total (os da capacidade inicial + os extras)
+        self.created = capacity
+        # acquire() atendidos pela lista livre (alocações evitadas)
+        self.reused = 0
+        self.in_use = 0
+        # maior quantidade em uso ao mesmo tempo
+        self.high_water = 0
+
+    def acquire(self, x, y):
+        if self.free:
+            rect = self.free.pop()
+            rect.x = x
+            rect.y = y
+            self.reused += 1
+        else:
+            rect = pygame.Rect((x, y), self.size)
+            self.created += 1
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return rect
+
+    def release(self, rect):
+        self.free.append(rect)
+        self.in_use -= 1
+
+    def release_all(self, rects):
+        self.free.extend(rects)
+        self.in_use -= len(rects)
+
+    def stats(self):
+        return {
+            "capacity": self.capacity,
+            "created": self.created,
+            "reused": self.reused,
+            "in_use": self.in_use,
+            "high_water": self.high_water,
+        }
@@ -0,0 +1,148 @@
+# ----------------------------------------------------------
+# ⏱️ PROFILER DE FRAME
+# ----------------------------------------------------------
+# Mede, com perf_counter_ns, quanto de cada frame vai para cada
+# fase (eventos, animação, meteoros, meteoros de vida, projéteis,
+# desenho, HUD, salvamento, flip). Uso:
+#
+#     profiler.begin_frame()
+#     ...eventos...
+#     profiler.lap("events")      # tempo desde o último lap
+#     ...
+#     profiler.end_frame()
+#
+# Guarda as últimas `window` medições de cada fase para calcular
+# p50/p95/p99 (mostrados no overlay, tecla F3) e, se pedido, o
+# traço completo frame a frame para gravar em CSV ou JSON ao sair.
+
+import csv
+import json
+import time
+from collections import deque
+
+import pygame
+
+from space_escape import config
+
+PHASES = ("events", "animation", "meteors", "life_meteors", "bullets", "draw", "hud", "save", "flip")
+# tempo esperando o clock.tick (fora do orçamento do frame)
+WAIT_PHASE = "wait"
+# orçamento de um frame no FPS alvo do jogo
+FRAME_BUDGET_MS = 1000 / config.FPS
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    k = min(int(round(p / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[k]
+
+
+class FrameProfiler:
+    def __init__(self, window=600, trace=False, refresh_every=30):
+        self.window = window
+        self.samples = {}
+        self.trace = [] if trace else None
+        self.refresh_every = refresh_every
+        self.frames = 0
+        self.overlay_visible = False
+        self._overlay_surface = None
+        self._last = 0
+        self._current = {}
+
+    def begin_frame(self):
+        self._current = {}
+        self._last = time.perf_counter_ns()
+        self._frame_start = self._last
+
+    def lap(self, phase):
+        # soma ao `phase` o tempo desde o último lap (ou begin_frame)
+        now = time.perf_counter_ns()
+        cur = self._current
+        cur[phase] = cur.get(phase, 0) + (now - self._last)
+        self._last = now
+
+    def end_frame(self):
+        cur = self._current
+        wait = cur.get(WAIT_PHASE, 0)
+        cur["total"] = self._last - self._frame_start - wait
+        for phase, ns in cur.items():
+            dq = self.samples.get(phase)
+            if dq is None:
+                dq = self.samples[phase] = deque(maxlen=self.window)
+            dq.append(ns)
+        if self.trace is not None:
+            self.trace.append(cur)
+        self.frames += 1
+
+    def stats(self, phase):
+        # (p50, p95, p99) em milissegundos das últimas `window` medições
+        values = sorted(self.samples.get(phase, ()))
+        return tuple(percentile(values, p) / 1e6 for p in (50, 95, 99))
+
+    def summary_rows(self):
+        # [(fase, p50, p95, p99), ...] nas fases que já têm medições
+        return [(phase,) + self.stats(phase) for phase in PHASES + ("total", WAIT_PHASE)
+                if phase in self.samples]
+
+    def summary_lines(self):
+        lines = ["fase           p50    p95    p99 (ms)"]
+        for phase, p50, p95, p99 in self.summary_rows():
+            lines.append(f"{phase:<12} {p50:6.2f} {p95:6.2f} {p99:6.2f}")
+        return lines
+
+    # ------------------------------------------------------
+    # Overlay na tela
+    # ------------------------------------------------------
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        self._overlay_surface = None
+
+    def overlay(self, font):
+        # devolve (surface, mudou?) — só re-renderiza a cada refresh_every frames
+        if self._overlay_surface is not None and self.frames % self.refresh_every:
+            return self._overlay_surface, False
+        color = (255, 255, 0)
+        rows = [("fase", "p50", "p95", "p99")]
+        rows += [(phase, f"{p50:.2f}", f"{p95:.2f}", f"{p99:.2f}")
+                 for phase, p50, p95, p99 in self.summary_rows()]
+        totals = self.samples.get("total", ())
+        over = sum(1 for ns in totals if ns > FRAME_BUDGET_MS * 1e6)
+        footer = f"acima de {FRAME_BUDGET_MS:.1f} ms: {over}/{len(totals)} frames"
+
+        # a fonte não é monoespaçada: cada coluna é alinhada à direita
+        line_h = font.get_linesize()
+        name_w = max(font.size(r[0])[0] for r in rows) + 10
+        col_w = max(font.size(v)[0] for r in rows for v in r[1:]) + 10
+        width = max(name_w + 3 * col_w, font.size(footer)[0]) + 8
+        surf = pygame.Surface((width, line_h * (len(rows) + 1) + 8), pygame.SRCALPHA)
+        surf.fill((0, 0, 0, 170))
+        y = 4
+        for row in rows:
+            surf.blit(font.render(row[0], True, color), (4, y))
+            for i, value in enumerate(row[1:]):
+                txt = font.render(value, True, color)
+                surf.blit(txt, (4 + name_w + (i + 1) * col_w - txt.get_width(), y))
+            y += line_h
+        surf.blit(font.render(footer, True, color), (4, y))
+        self._overlay_surface = surf
+        return surf, True
+
+    # ------------------------------------------------------
+    # Gravação do traço frame a frame
+    # ------------------------------------------------------
+    def dump(self, path):
+        if self.trace is None:
+            return
+        columns = list(PHASES) + ["total", WAIT_PHASE]
+        extra = sorted({k for row in self.trace for k in row} - set(columns))
+        columns += extra
+        if path.endswith(".json"):
+            with open(path, "w") as f:
+                json.dump({"unit": "ns", "phases": columns, "frames": self.trace}, f)
+        else:
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["frame"] + columns)
+                for i, row in enumerate(self.trace):
+                    writer.writerow([i] + [row.get(c, 0) for c in columns])
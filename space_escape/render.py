@@ -0,0 +1,96 @@
+# ----------------------------------------------------------
+# 🎨 DESENHO DA PARTIDA
+# ----------------------------------------------------------
+# GameView desenha um GameState (nave, projéteis, meteoros, meteoros
+# de vida, HUD e o overlay do profiler) através de um renderer de
+# dirty_render.py. O jogo (game.py) e o benchmark usam a mesma
+# classe, então o que é medido é o mesmo caminho que o jogador vê.
+#
+# draw() recebe `alpha` (ver timestep.py): o estado é do fim do último
+# tick e o frame mostra um instante entre ele e o anterior. Como
+# meteoros e projéteis andam em linha reta com velocidade fixa por
+# tick, a posição interpolada é a atual recuada (1 - alpha) ticks, sem
+# guardar uma cópia do estado anterior. A nave fica sempre na posição
+# atual (é a resposta direta ao mouse).
+
+from space_escape.atlas import RotationAtlas, SpriteBatch, swing_angles
+from space_escape.config import (
+    WIDTH, ASSETS, LEVELS, WHITE, RED, BLUE, PLAYER_SIZE, METEOR_SIZE, BULLET_SPEED,
+    METEOR_ANIM_FRAMES, METEOR_SWING_DEG, METEOR_PHASES, LIFE_METEOR_SWING_DEG,
+)
+from space_escape.text_cache import HudLabel, get_font
+
+PROFILER_POS = (10, 50)
+
+
+class GameView:
+    def __init__(self, renderer, assets, text_cache, levels=LEVELS, profiler=None):
+        self.renderer = renderer
+        self.levels = levels
+        self.profiler = profiler
+
+        # Carrega imagens da partida
+        self.player_img = assets.image(ASSETS["player"], BLUE, PLAYER_SIZE)
+        meteor_base = assets.image(ASSETS["meteor"], RED, METEOR_SIZE)
+        life_meteor_img = assets.image(ASSETS["life_meteor"], (0, 255, 0), METEOR_SIZE)
+
+        # Gera os frames rotacionados uma vez só, num atlas (ver atlas.py);
+        # a sequência de ângulos dá impressão de "balanço"
+        self.meteor_atlas = RotationAtlas(meteor_base, swing_angles(METEOR_ANIM_FRAMES, METEOR_SWING_DEG))
+        self.life_meteor_atlas = RotationAtlas(life_meteor_img,
+                                               swing_angles(METEOR_ANIM_FRAMES, LIFE_METEOR_SWING_DEG))
+        # listas de blits reaproveitadas de um frame para o outro
+        self.meteor_batch = SpriteBatch(self.meteor_atlas, phases=METEOR_PHASES)
+        self.life_meteor_batch = SpriteBatch(self.life_meteor_atlas, phases=METEOR_PHASES)
+
+        # HUD: só rasteriza de novo quando pontos, vidas ou nível mudam
+        font = get_font(36)
+        self.score_label = HudLabel(text_cache, font, WHITE)
+        self.level_label = HudLabel(text_cache, font, WHITE)
+        self.profiler_font = get_font(22)
+
+    def draw(self, state, alpha=1.0):
+        renderer = self.renderer
+        profiler = self.profiler
+        back = 1.0 - alpha
+        meteor_dy = -round(state.meteor_speed * back)
+        bullet_dy = round(BULLET_SPEED * back)
+
+        # --- Desenha tudo ---
+        # fundo com parallax rola junto com o tempo da simulação
+        renderer.background.scroll(state.tick - back)
+        renderer.begin_frame()
+        renderer.blit(self.player_img, state.player.topleft)
+
+        # Desenha projéteis
+        if bullet_dy:
+            for b in state.bullets:
+                renderer.rect(WHITE, b.move(0, bullet_dy))
+        else:
+            for b in state.bullets:
+                renderer.rect(WHITE, b)
+
+        # frame atual de cada meteoro, já centralizado no rect
+        renderer.blits(self.meteor_batch.update(state.meteors, state.anim_index, meteor_dy))
+
+        # Meteoros de vida
+        renderer.blits(self.life_meteor_batch.update(state.life_meteors, state.anim_index, meteor_dy))
+        if profiler:
+            profiler.lap("draw")
+
+        # --- Exibe pontuação e vidas ---
+        text = self.score_label.update(f"Pontos: {state.score}   Vidas: {state.lives}")
+        renderer.overlay(text, (10, 10), self.score_label.dirty)
+
+        # Exibe o nível atual
+        level_text = self.level_label.update(self.levels[state.level_idx]["name"])
+        renderer.overlay(level_text, (WIDTH - 180, 10), self.level_label.dirty)
+
+        # Overlay do profiler
+        if profiler and profiler.overlay_visible:
+            prof_surf, prof_changed = profiler.overlay(self.profiler_font)
+            renderer.overlay(prof_surf, PROFILER_POS, prof_changed)
+        else:
+            renderer.clear_overlay(PROFILER_POS)
+        if profiler:
+            profiler.lap("hud")
@@ -0,0 +1,270 @@
+# ----------------------------------------------------------
+# 🎞️ GRAVAÇÃO E REPLAY DE PARTIDAS
+# ----------------------------------------------------------
+# A simulação é determinística: dada a semente e a entrada de cada
+# tick (x/y do cursor e se atirou), ela chega sempre ao mesmo estado.
+# Então para reproduzir uma partida basta guardar a semente, o ponto
+# de partida (jogo salvo, se houver), o pacote de fases (se não for o
+# padrão) e a entrada tick a tick.
+#
+# Formato do arquivo (.serp), tudo little-endian:
+#   cabeçalho   "SERP", versão, flags, semente, meteoros
+#   jogo salvo  varint com o tamanho + JSON (só se a flag estiver ligada)
+#   fases       varint com o tamanho + JSON do pacote (idem)
+#   colisão     varint com o tamanho + JSON com PIXEL_COLLISION e a
+#               animação dos meteoros (config.sprite_config()), que
+#               mudam o resultado
+#   resultado   ticks, pontos, vidas, nível e razão do fim (para conferir)
+#   entradas    sequência de varints, com delta em relação ao tick anterior:
+#                 token par   -> (token >> 1) ticks parados, sem atirar
+#                 token ímpar -> um tick: token >> 1 = zigzag(dx) << 1 | tiro,
+#                                seguido de um varint com zigzag(dy)
+# Um tick parado custa menos de 1 byte (vários viram um token só) e um
+# tick com o mouse mexendo, 2 a 3 bytes.
+#
+# Uso:
+#     python spaceScape.py --record partida.serp    # grava
+#     python spaceScape.py --replay partida.serp    # assiste
+#     python -m space_escape.replay partida.serp ...  # confere sem janela
+
+import argparse
+import json
+import struct
+import sys
+import time
+
+from space_escape import config, simulation
+from space_escape.assets import write_bytes_atomic
+from space_escape.rules import pack_from_dict, pack_to_dict
+
+MAGIC = b"SERP"
+# versão 2: pontos de meteoros destruídos também trocam de nível/vencem
+# versão 3: colisão contínua (sweep.py), em ordem de tempo de impacto
+# versão 4: colisão por pixel (masks.py) depois do teste de retângulo
+# versão 5: configuração de colisão e animação gravada no arquivo
+# versão 6: animação avança antes das colisões (máscara = frame desenhado)
+VERSION = 6
+_HEADER = struct.Struct("<4sBBqi")
+_RESULT = struct.Struct("<IiiBB")
+
+FLAG_VECTORIZED = 1
+FLAG_SAVE = 2
+FLAG_METEORS = 4
+FLAG_PACK = 8
+
+# razão do fim do jogo <-> código no arquivo
+RESULTS = (None, "victory", "defeat")
+
+
+class ReplayError(ValueError):
+    pass
+
+
+def _zigzag(n):
+    return (n << 1) ^ (n >> 63)
+
+
+def _unzigzag(z):
+    return (z >> 1) ^ -(z & 1)
+
+
+def _write_varint(out, n):
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(data, pos):
+    result = shift = 0
+    while True:
+        if pos >= len(data):
+            raise ReplayError("arquivo de replay truncado")
+        b = data[pos]
+        pos += 1
+        result |= (b & 0x7F) << shift
+        if not b & 0x80:
+            return result, pos
+        shift += 7
+
+
+class InputRecorder:
+    # grava a entrada de cada tick; save() escreve o arquivo no fim
+    def __init__(self, seed, meteors=None, vectorized=False, saved=None, pack=None,
+                 pixel_collision=config.PIXEL_COLLISION, sprites=None):
+        self.seed = seed
+        self.meteors = meteors
+        self.vectorized = vectorized
+        self.saved = saved
+        self.pack = pack
+        self.pixel_collision = pixel_collision
+        self.sprites = sprites or config.sprite_config()
+        self.stream = bytearray()
+        self.ticks = 0
+        self._x = self._y = 0
+        self._idle = 0
+        self.result = (0, 0, 0, 0, None)
+
+    def record(self, inp):
+        dx = inp.x - self._x
+        dy = inp.y - self._y
+        self.ticks += 1
+        if not dx and not dy and not inp.fire:
+            self._idle += 1
+            return
+        self._flush_idle()
+        self._x, self._y = inp.x, inp.y
+        _write_varint(self.stream, ((_zigzag(dx) << 1 | bool(inp.fire)) << 1) | 1)
+        _write_varint(self.stream, _zigzag(dy))
+
+    def _flush_idle(self):
+        if self._idle:
+            _write_varint(self.stream, self._idle << 1)
+            self._idle = 0
+
+    def finish(self, state):
+        # guarda o resultado da partida, conferido no replay
+        self._flush_idle()
+        self.result = (state.tick, state.score, state.lives, state.level_idx, state.game_over_reason)
+
+    def to_bytes(self):
+        flags = (FLAG_VECTORIZED if self.vectorized else 0) | (FLAG_METEORS if self.meteors is not None else 0)
+        out = bytearray()
+        if self.saved is not None:
+            flags |= FLAG_SAVE
+        if self.pack is not None:
+            flags |= FLAG_PACK
+        out += _HEADER.pack(MAGIC, VERSION, flags, self.seed, self.meteors or 0)
+        collision = {"pixel_collision": self.pixel_collision, "sprites": self.sprites}
+        for blob in (self.saved, None if self.pack is None else pack_to_dict(self.pack), collision):
+            if blob is not None:
+                blob = json.dumps(blob, sort_keys=True).encode()
+                _write_varint(out, len(blob))
+                out += blob
+        ticks, score, lives, level, reason = self.result
+        out += _RESULT.pack(ticks, score, lives, level, RESULTS.index(reason))
+        out += self.stream
+        return bytes(out)
+
+    def save(self, path):
+        write_bytes_atomic(path, self.to_bytes())
+
+
+class Replay:
+    def __init__(self, data):
+        if len(data) < _HEADER.size + _RESULT.size:
+            raise ReplayError("arquivo de replay truncado")
+        magic, version, flags, self.seed, meteors = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ReplayError("não é um arquivo de replay")
+        if version != VERSION:
+            raise ReplayError(f"versão de replay não suportada: {version}")
+        self.vectorized = bool(flags & FLAG_VECTORIZED)
+        self.meteors = meteors if flags & FLAG_METEORS else None
+        pos = _HEADER.size
+        self.saved = self.pack = None
+        if flags & FLAG_SAVE:
+            size, pos = _read_varint(data, pos)
+            self.saved = json.loads(data[pos:pos + size])
+            pos += size
+        if flags & FLAG_PACK:
+            size, pos = _read_varint(data, pos)
+            self.pack = pack_from_dict(json.loads(data[pos:pos + size]))
+            pos += size
+        size, pos = _read_varint(data, pos)
+        collision = json.loads(data[pos:pos + size])
+        pos += size
+        self.pixel_collision = collision["pixel_collision"]
+        self.sprites = collision["sprites"]
+        ticks, score, lives, level, reason = _RESULT.unpack_from(data, pos)
+        if reason >= len(RESULTS):
+            raise ReplayError("resultado inválido no replay")
+        self.ticks, self.score, self.lives, self.level_idx = ticks, score, lives, level
+        self.game_over_reason = RESULTS[reason]
+        self.data = data
+        self.stream_start = pos + _RESULT.size
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    def inputs(self):
+        # gera um TickInput por tick gravado
+        data = self.data
+        pos = self.stream_start
+        end = len(data)
+        x = y = 0
+        while pos < end:
+            token, pos = _read_varint(data, pos)
+            if not token & 1:
+                idle = simulation.TickInput(x, y, False)
+                for _ in range(token >> 1):
+                    yield idle
+                continue
+            token >>= 1
+            x += _unzigzag(token >> 1)
+            z, pos = _read_varint(data, pos)
+            y += _unzigzag(z)
+            yield simulation.TickInput(x, y, bool(token & 1))
+
+    def make_simulation(self):
+        sim = simulation.make_simulation(seed=self.seed, vectorized=self.vectorized, meteors=self.meteors,
+                                         pack=self.pack, pixel_collision=self.pixel_collision,
+                                         sprites=self.sprites)
+        if self.saved:
+            sim.load_save(self.saved)
+        return sim
+
+    def expected(self):
+        return (self.ticks, self.score, self.lives, self.level_idx, self.game_over_reason)
+
+
+def run_replay(replay):
+    # roda a partida inteira sem janela, o mais rápido possível
+    sim = replay.make_simulation()
+    step = sim.step
+    for inp in replay.inputs():
+        step(inp)
+    return sim
+
+
+def verify(replay):
+    # (confere?, resultado obtido)
+    state = run_replay(replay).state
+    got = (state.tick, state.score, state.lives, state.level_idx, state.game_over_reason)
+    return got == replay.expected(), got
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Space Escape — confere replays sem janela")
+    parser.add_argument("files", nargs="+", metavar="ARQUIVO", help="arquivos .serp")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    total_ticks = 0
+    start = time.perf_counter()
+    for path in args.files:
+        try:
+            replay = Replay.load(path)
+            ok, got = verify(replay)
+        except (OSError, ReplayError, ValueError) as e:
+            print(f"{path}: ERRO {e}")
+            failures += 1
+            continue
+        total_ticks += got[0]
+        if ok:
+            print(f"{path}: ok  seed={replay.seed} ticks={got[0]} pontos={got[1]} fim={got[4]}")
+        else:
+            failures += 1
+            print(f"{path}: DIVERGE  gravado={replay.expected()} replay={got}")
+    elapsed = time.perf_counter() - start
+    if elapsed > 0 and total_ticks:
+        speed = total_ticks / elapsed
+        print(f"{len(args.files)} replays, {total_ticks} ticks em {elapsed:.2f}s "
+              f"({speed:.0f} ticks/s, {speed / config.TICK_RATE:.0f}x tempo real)", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
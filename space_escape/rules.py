@@ -0,0 +1,114 @@
+# ----------------------------------------------------------
+# 📜 REGRAS DE FASE E VITÓRIA (+ pacotes de fases em JSON/TOML)
+# ----------------------------------------------------------
+# As regras só olham a pontuação, então só precisam rodar quando ela
+# muda. Simulation.add_score() é o único caminho que soma pontos
+# (meteoro que passou, meteoro destruído, ...) e chama
+# Rules.on_score() com a pontuação nova.
+#
+# A fase de uma pontuação é "a fase de maior índice cujo threshold
+# já foi alcançado". Os thresholds ficam ordenados numa lista, com o
+# maior índice alcançável até cada um já calculado, então a consulta é
+# um bisect: O(log fases) por mudança de pontuação.
+#
+# Um pacote de fases é um arquivo .json ou .toml com as fases e a
+# pontuação de vitória (ver fases/):
+#     {"name": "...", "win_score": 30, "life_meteor_count": 2,
+#      "levels": [{"name": "Nível 1", "bg": "...", "meteor_count": 5,
+#                  "meteor_speed": 5, "threshold": 0}, ...]}
+# Sem pacote, valem LEVELS e WIN_SCORE de config.py.
+
+import json
+import os
+from bisect import bisect_right
+from collections import namedtuple
+
+from space_escape import config
+
+LevelPack = namedtuple("LevelPack", "name levels win_score life_meteor_count")
+
+_REQUIRED_LEVEL_KEYS = ("meteor_count", "meteor_speed", "threshold")
+
+
+class LevelPackError(ValueError):
+    pass
+
+
+class Rules:
+    def __init__(self, levels, win_score):
+        self.win_score = win_score
+        # thresholds distintos em ordem crescente e, para cada um, a maior
+        # fase liberada com essa pontuação
+        self.thresholds = []
+        self.level_at = []
+        best = -1
+        for idx in sorted(range(len(levels)), key=lambda i: levels[i]["threshold"]):
+            threshold = levels[idx]["threshold"]
+            best = max(best, idx)
+            if self.thresholds and self.thresholds[-1] == threshold:
+                self.level_at[-1] = best
+            else:
+                self.thresholds.append(threshold)
+                self.level_at.append(best)
+
+    def level_for(self, score, current):
+        # abaixo de todos os thresholds a fase não muda
+        i = bisect_right(self.thresholds, score) - 1
+        return self.level_at[i] if i >= 0 else current
+
+    def on_score(self, score, level_idx):
+        # (fase para a pontuação, venceu?)
+        return self.level_for(score, level_idx), score >= self.win_score
+
+
+# ----------------------------------------------------------
+# Pacotes de fases
+# ----------------------------------------------------------
+def _read_pack_file(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    if path.endswith(".toml"):
+        try:
+            import tomllib
+        except ImportError:
+            raise LevelPackError("pacote .toml precisa do Python 3.11+ (tomllib); use .json") from None
+        try:
+            return tomllib.loads(data.decode())
+        except tomllib.TOMLDecodeError as e:
+            raise LevelPackError(f"{path}: {e}") from None
+    try:
+        return json.loads(data)
+    except json.JSONDecodeError as e:
+        raise LevelPackError(f"{path}: {e}") from None
+
+
+def pack_from_dict(data, name="pacote"):
+    levels = data.get("levels")
+    if not isinstance(levels, list) or not levels:
+        raise LevelPackError(f"{name}: 'levels' precisa ser uma lista com pelo menos uma fase")
+    for i, lvl in enumerate(levels):
+        if not isinstance(lvl, dict):
+            raise LevelPackError(f"{name}: fase {i + 1} precisa ser um objeto/tabela")
+        missing = [k for k in _REQUIRED_LEVEL_KEYS if not isinstance(lvl.get(k), int)]
+        if missing:
+            raise LevelPackError(f"{name}: fase {i + 1} sem {', '.join(missing)} (inteiros)")
+        if lvl["meteor_count"] < 1 or lvl["meteor_speed"] < 1:
+            raise LevelPackError(f"{name}: fase {i + 1} precisa de meteor_count e meteor_speed >= 1")
+        lvl.setdefault("name", f"Nível {i + 1}")
+    win_score = data.get("win_score", config.WIN_SCORE)
+    life_meteors = data.get("life_meteor_count", config.LIFE_METEOR_COUNT)
+    if not isinstance(win_score, int) or not isinstance(life_meteors, int) or life_meteors < 0:
+        raise LevelPackError(f"{name}: win_score e life_meteor_count precisam ser inteiros")
+    return LevelPack(data.get("name", name), levels, win_score, life_meteors)
+
+
+def load_level_pack(path):
+    data = _read_pack_file(path)
+    if not isinstance(data, dict):
+        raise LevelPackError(f"{path}: o pacote precisa ser um objeto/tabela")
+    return pack_from_dict(data, os.path.splitext(os.path.basename(path))[0])
+
+
+def pack_to_dict(pack):
+    return {"name": pack.name, "levels": pack.levels, "win_score": pack.win_score,
+            "life_meteor_count": pack.life_meteor_count}
@@ -0,0 +1,551 @@
+# ----------------------------------------------------------
+# 🧠 SIMULAÇÃO (regras do jogo sem janela)
+# ----------------------------------------------------------
+# Todo o estado de uma partida fica em GameState (state.py) e as regras de
+# meteoros, meteoros de vida, projéteis, pontuação e níveis ficam
+# em Simulation.step(), que avança um tick (1/TICK_RATE s) a partir
+# de um TickInput. Nada aqui abre janela nem toca som: só usamos
+# pygame.Rect, que funciona sem pygame.init().
+#
+# Colisões: o teste contínuo de retângulos (sweep.py) acha os pares e,
+# com PIXEL_COLLISION, as máscaras (masks.py) confirmam só esses pares.
+# rect_hits e mask_hits contam quantos pares passaram em cada etapa.
+#
+# Pontos só mudam por add_score(), que passa a pontuação nova pelas
+# regras de fase e vitória (rules.py) — uma vez por tipo de pontuação
+# por tick, depois que meteoros/projéteis daquele tipo já andaram.
+#
+# O jogo com janela (game.py) lê o mouse/teclado, monta o
+# TickInput e desenha o estado; no modo headless quem gera o
+# TickInput é uma "policy" (aleatória ou roteirizada).
+
+import argparse
+import random
+import time
+
+from space_escape import config
+from space_escape.pool import RectPool
+from space_escape.rules import Rules, LevelPackError, load_level_pack
+from space_escape.spatial_hash import SpatialHash
+from space_escape.sweep import sweep_hits, first_contacts
+# GameState e TickInput ficam em state.py (reexportados aqui)
+from space_escape.state import GameState, TickInput
+
+# duração de um tick em milissegundos (usado pelo cooldown do tiro)
+TICK_MS = 1000 / config.TICK_RATE
+
+# grade de colisão (spatial_hash.py): uma consulta à grade custa uns
+# 3 µs em Python e a varredura em C de todos os meteoros ~13 ns por
+# meteoro, mais a manutenção da grade (cada meteoro que reaparece muda
+# de célula). A partir de GRID_MIN_METEORS meteoros, com alguns
+# projéteis na tela, a grade sai mais barata (cenários meteors_1k e
+# meteors_10k do bench). Os meteoros de vida usam o mesmo limite, com
+# grade própria
+GRID_MIN_METEORS = 400
+
+
+class Simulation:
+    def __init__(self, seed=None, levels=None, win_score=config.WIN_SCORE,
+                 life_meteor_count=config.LIFE_METEOR_COUNT, grid_min_meteors=GRID_MIN_METEORS,
+                 fire_cooldown_ms=config.FIRE_COOLDOWN_MS,
+                 pixel_collision=config.PIXEL_COLLISION, sprites=None):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.levels = levels if levels is not None else config.LEVELS
+        self.win_score = win_score
+        # fase e vitória em função da pontuação (bisect nos thresholds)
+        self.rules = Rules(self.levels, win_score)
+        self.fire_cooldown_ms = fire_cooldown_ms
+        # broadphase: grades dos meteoros e dos meteoros de vida, que
+        # descem junto com eles e só mudam quando um reaparece; valem
+        # para a nave e para os projéteis
+        self.meteor_grid = SpatialHash()
+        self.life_grid = SpatialHash()
+        self.grid_min_meteors = grid_min_meteors
+        # FrameProfiler opcional: mede cada fase do step() (ver profiler.py)
+        self.profiler = None
+        # quantos pares passaram pelo teste de retângulo (narrowphase) no
+        # último tick, e o total desde o início da partida: sem grade todo
+        # par é testado (em C); com grade só os vizinhos de célula
+        self.narrowphase_tests = 0
+        self.narrowphase_total = 0
+        # animação dos meteoros (config.sprite_config()): com máscaras, o
+        # frame de cada meteoro muda quem encosta em quem
+        self.sprites = dict(sprites) if sprites is not None else config.sprite_config()
+        # máscaras por pixel, carregadas uma vez por processo (import aqui:
+        # masks -> atlas -> entities importa este módulo)
+        if pixel_collision:
+            from space_escape.masks import collision_masks
+            self.masks = collision_masks(self.sprites)
+        else:
+            self.masks = None
+        # pares aceitos pelo retângulo e confirmados pela máscara, desde o
+        # início da partida
+        self.rect_hits = 0
+        self.mask_hits = 0
+        self.make_pools(life_meteor_count)
+        self.state = GameState()
+        self.state.life_meteors = self.make_meteors(life_meteor_count, self.life_pool)
+        self.state.meteors = self.make_meteors(self.levels[0]["meteor_count"])
+        self.state.meteor_speed = self.levels[0]["meteor_speed"]
+
+    def make_pools(self, life_meteor_count):
+        # Rects reaproveitados: projéteis, meteoros e meteoros de vida
+        # nunca são criados no meio do jogo enquanto houver Rect livre
+        self.bullet_pool = RectPool(config.BULLET_SIZE, config.BULLET_POOL_SIZE)
+        self.meteor_pool = RectPool(config.METEOR_SIZE, max(lvl["meteor_count"] for lvl in self.levels))
+        self.life_pool = RectPool(config.METEOR_SIZE, life_meteor_count)
+
+    def make_meteors(self, count, pool=None):
+        w, h = config.METEOR_SIZE
+        acquire = (pool or self.meteor_pool).acquire
+        lst = []
+        for _ in range(count):
+            x = self.rng.randint(0, config.WIDTH - w)
+            y = self.rng.randint(-500, -h)
+            lst.append(acquire(x, y))
+        return lst
+
+    def set_level(self, idx):
+        if idx < 0 or idx >= len(self.levels):
+            return
+        state = self.state
+        state.level_idx = idx
+        state.meteor_speed = self.levels[idx]["meteor_speed"]
+        # Ajusta a quantidade de meteoros para o nível
+        desired = self.levels[idx]["meteor_count"]
+        if len(state.meteors) < desired:
+            # adiciona novos meteoros
+            state.meteors.extend(self.make_meteors(desired - len(state.meteors)))
+        elif len(state.meteors) > desired:
+            # reduz a lista (mantém os primeiros) e devolve o resto ao pool
+            self.meteor_pool.release_all(state.meteors[desired:])
+            del state.meteors[desired:]
+        # meteoros novos (e outra velocidade): a grade é refeita no próximo uso
+        self.meteor_grid.valid = False
+
+    def load_save(self, saved):
+        # restaura um jogo salvo (dicionário de persistence.load_game)
+        state = self.state
+        state.score = saved["score"]
+        state.lives = saved["lives"]
+        state.player.centerx = saved["player_x"]
+        state.player.centery = saved["player_y"]
+        # reajusta os meteoros conforme o nível salvo
+        self.set_level(saved["level"])
+
+    def respawn(self, rect, top):
+        rect.y = self.rng.randint(top, -40)
+        rect.x = self.rng.randint(0, config.WIDTH - rect.width)
+
+    # ------------------------------------------------------
+    # Um tick de jogo. Retorna a lista de eventos que aconteceram
+    # ("shot", "point", "kill", "hit", "life", "level", "victory",
+    # "defeat") para quem estiver desenhando tocar sons etc.
+    # ------------------------------------------------------
+    def step(self, inp):
+        events = []
+        state = self.state
+        self.narrowphase_tests = self.meteor_grid.tests = self.life_grid.tests = 0
+        prof = self.profiler
+        self.fire(inp.fire, events)
+        self.move_player(inp.x, inp.y)
+        if prof:
+            prof.lap("events")
+        # a animação anda antes das colisões: a máscara testada é a do
+        # frame que vai ser desenhado no fim deste tick
+        self.update_animation()
+        if prof:
+            prof.lap("animation")
+        self.update_meteors(events)
+        if prof:
+            prof.lap("meteors")
+        self.update_life_meteors(events)
+        if prof:
+            prof.lap("life_meteors")
+        self.update_bullets(events)
+        if prof:
+            prof.lap("bullets")
+        self.narrowphase_tests += self.meteor_grid.tests + self.life_grid.tests
+        self.narrowphase_total += self.narrowphase_tests
+        state.tick += 1
+        return events
+
+    def fire(self, pressed, events):
+        state = self.state
+        if not pressed:
+            return
+        now = state.tick * TICK_MS
+        if now - state.last_shot_ms >= self.fire_cooldown_ms:
+            # cria um projétil na frente da nave
+            bw, bh = config.BULLET_SIZE
+            self.spawn_bullet(state.player.centerx - bw // 2, state.player.top - bh)
+            state.last_shot_ms = now
+            events.append("shot")
+
+    def spawn_bullet(self, x, y):
+        # único jeito de criar projétil (tiro do jogador, benchmark)
+        self.state.bullets.append(self.bullet_pool.acquire(x, y))
+
+    def hit_stats(self):
+        return {"rect": self.rect_hits, "mask": self.mask_hits if self.masks else None}
+
+    def pool_stats(self):
+        return {"bullets": self.bullet_pool.stats(), "meteors": self.meteor_pool.stats(),
+                "life_meteors": self.life_pool.stats()}
+
+    def move_player(self, x, y):
+        player = self.state.player
+        player.centerx = x
+        player.centery = y
+        # Garante que a nave permaneça dentro da tela
+        if player.left < 0:
+            player.left = 0
+        if player.right > config.WIDTH:
+            player.right = config.WIDTH
+        if player.top < 0:
+            player.top = 0
+        if player.bottom > config.HEIGHT:
+            player.bottom = config.HEIGHT
+
+    def player_hits(self, rects, sprite, grid=None):
+        # índices dos retângulos que encostaram na nave durante o tick, em
+        # ordem de tempo de impacto (colisão contínua, ver sweep.py). Eles
+        # desceram meteor_speed e a nave está onde o mouse a deixou, então
+        # em relação a eles a nave "subiu" meteor_speed. grid: SpatialHash
+        # já montada com `rects` (os testes são contados por ela)
+        if grid is None:
+            self.narrowphase_tests += len(rects)
+        player = (self.state.player,)
+        dy = -self.state.meteor_speed
+        pairs = sweep_hits(player, 0, dy, rects, grid)
+        if pairs:
+            pairs = self.confirm(pairs, player, "player", 0, dy, rects, sprite)
+        return [j for _, _, j in pairs]
+
+    def confirm(self, pairs, movers, mover, dx, dy, targets, target):
+        # 2ª etapa da colisão: pares (toi, i, j) aceitos pelo retângulo
+        # passam pelas máscaras; mover/target dizem qual sprite cada lado
+        # é ("player", "meteor", "life_meteor", "bullet")
+        self.rect_hits += len(pairs)
+        if self.masks is None:
+            return pairs
+        pairs = self.masks.confirm(pairs, movers, mover, dx, dy, targets, target, self.state.anim_index)
+        self.mask_hits += len(pairs)
+        return pairs
+
+    def add_score(self, points, events):
+        # único jeito de mudar a pontuação: toda forma de pontuar passa
+        # pelas mesmas regras de troca de nível e de vitória
+        state = self.state
+        state.score += points
+        level_idx, won = self.rules.on_score(state.score, state.level_idx)
+        if level_idx != state.level_idx:
+            self.set_level(level_idx)
+            events.append("level")
+        if won and state.game_over_reason is None:
+            state.game_over_reason = 'victory'
+            events.append("victory")
+
+    def update_meteors(self, events):
+        state = self.state
+        points = 0
+        grid = self.moving_grid(self.meteor_grid)
+        for meteor in state.meteors:
+            meteor.y += state.meteor_speed
+
+            # Saiu da tela → reposiciona e soma pontos
+            if meteor.y > config.HEIGHT:
+                self.respawn(meteor, -100)
+                if grid is not None:
+                    grid.move_rect(meteor)
+                points += 1
+                events.append("point")
+
+        # troca de nível e vitória depois do laço (set_level mexe na lista)
+        if points:
+            self.add_score(points, events)
+
+        # Colisão
+        meteors = state.meteors
+        grid = self.grid_for(self.meteor_grid, meteors)
+        hit = False
+        for i in self.player_hits(meteors, "meteor", grid):
+            state.lives -= 1
+            self.respawn(meteors[i], -100)
+            if grid is not None:
+                grid.move(i, meteors[i])
+            events.append("hit")
+            hit = True
+        # um "defeat" só, mesmo com vários meteoros no mesmo tick
+        if hit and state.lives <= 0:
+            state.game_over_reason = 'defeat'
+            events.append("defeat")
+
+    def update_life_meteors(self, events):
+        state = self.state
+        grid = self.moving_grid(self.life_grid)
+        for meteor in state.life_meteors:
+            meteor.y += state.meteor_speed
+
+            # Se sair da tela, reposiciona
+            if meteor.y > config.HEIGHT:
+                self.respawn(meteor, -200)
+                if grid is not None:
+                    grid.move_rect(meteor)
+
+        # Colisão com a nave -> ganha vida extra
+        life = state.life_meteors
+        grid = self.grid_for(self.life_grid, life)
+        for i in self.player_hits(life, "life_meteor", grid):
+            state.lives += 1
+            # reposiciona o meteoro para cima
+            self.respawn(life[i], -200)
+            if grid is not None:
+                grid.move(i, life[i])
+            events.append("life")
+
+    def moving_grid(self, grid):
+        # antes de os meteoros descerem: a grade desce junto (quem
+        # reaparecer é movido nela), ou None se ela não está em uso
+        if not grid.valid:
+            return None
+        grid.shift(self.state.meteor_speed)
+        return grid
+
+    def grid_for(self, grid, rects):
+        # a grade com as posições de agora, ou None (abaixo de
+        # grid_min_meteors o teste em C sai mais barato)
+        if len(rects) < self.grid_min_meteors:
+            grid.valid = False
+            return None
+        if not grid.valid:
+            grid.rebuild(rects)
+        return grid
+
+    def update_animation(self):
+        state = self.state
+        state.anim_timer += 1
+        if state.anim_timer >= self.sprites["anim_speed"]:
+            state.anim_timer = 0
+            state.anim_index = (state.anim_index + 1) % self.sprites["anim_frames"]
+
+    def update_bullets(self, events):
+        state = self.state
+        meteors = state.meteors
+        # atualiza posição e descarta projéteis fora da tela; os que sobram
+        # são compactados no começo da lista (nada de list.remove, que é
+        # O(n) para cada projétil)
+        bullets = state.bullets
+        release = self.bullet_pool.release
+        kept = 0
+        for b in bullets:
+            b.y -= config.BULLET_SPEED
+            # projétil saiu da tela
+            if b.bottom < 0:
+                release(b)
+                continue
+            bullets[kept] = b
+            kept += 1
+        del bullets[kept:]
+        if not bullets:
+            return
+
+        # colisão contínua com os meteoros regulares: projéteis subiram
+        # BULLET_SPEED e meteoros desceram meteor_speed; em ordem de tempo de
+        # impacto, cada projétil destrói no máximo um meteoro e vice-versa
+        # a grade dos meteoros já está em dia (update_meteors); neste
+        # tick eles não andam mais
+        if self.meteor_grid.valid:
+            grid = self.meteor_grid
+        else:
+            grid = None
+            self.narrowphase_tests += len(bullets) * len(meteors)
+        dy = -(config.BULLET_SPEED + state.meteor_speed)
+        pairs = sweep_hits(bullets, 0, dy, meteors, grid)
+        if not pairs:
+            return
+        pairs = self.confirm(pairs, bullets, "bullet", 0, dy, meteors, "meteor")
+        contacts = first_contacts(pairs)
+        if not contacts:
+            return
+        spent = set()
+        for _, i, j in contacts:
+            # 'destrói' o meteoro reposicionando-o lá em cima
+            self.respawn(meteors[j], -200)
+            if grid is not None:
+                grid.move(j, meteors[j])
+            events.append("kill")
+            spent.add(i)
+        kept = 0
+        for i, b in enumerate(bullets):
+            if i in spent:
+                release(b)
+                continue
+            bullets[kept] = b
+            kept += 1
+        del bullets[kept:]
+        # aumenta a pontuação por destruir
+        self.add_score(2 * len(contacts), events)
+
+
+# ----------------------------------------------------------
+# 🤖 POLICIES (quem "joga" no modo headless)
+# ----------------------------------------------------------
+class RandomPolicy:
+    # passeia com o cursor aleatoriamente e atira de vez em quando
+    def __init__(self, seed=None, fire_chance=0.1, max_step=40):
+        self.rng = random.Random(seed)
+        self.fire_chance = fire_chance
+        self.max_step = max_step
+        self.x = config.WIDTH // 2
+        self.y = config.HEIGHT - 60
+
+    def __call__(self, state):
+        self.x = min(max(self.x + self.rng.randint(-self.max_step, self.max_step), 0), config.WIDTH)
+        self.y = min(max(self.y + self.rng.randint(-self.max_step, self.max_step), 0), config.HEIGHT)
+        return TickInput(self.x, self.y, self.rng.random() < self.fire_chance)
+
+
+class ScriptedPolicy:
+    # repete uma lista fixa de TickInput (ou de tuplas (x, y, fire))
+    def __init__(self, inputs, loop=True):
+        self.inputs = [TickInput(*i) for i in inputs]
+        self.loop = loop
+        self.pos = 0
+
+    def __call__(self, state):
+        if self.pos >= len(self.inputs):
+            if not self.loop:
+                return self.inputs[-1]
+            self.pos = 0
+        inp = self.inputs[self.pos]
+        self.pos += 1
+        return inp
+
+
+class DodgePolicy:
+    # bot "razoável" para balancear fases: fica embaixo, desvia do meteoro
+    # mais próximo que vai cair em cima da nave e atira quando há um
+    # meteoro alinhado acima
+    def __init__(self, seed=None, lookahead=220, margin=12):
+        self.rng = random.Random(seed)
+        self.lookahead = lookahead
+        self.margin = margin
+        self.y = config.HEIGHT - 60
+
+    def __call__(self, state):
+        p = state.player
+        half = p.width // 2
+        top = p.top - self.lookahead
+        threat = None
+        fire = False
+        for m in state.meteors:
+            if m.bottom < p.top and m.left < p.centerx < m.right:
+                fire = True
+            if top < m.bottom <= p.bottom and m.right > p.left - self.margin and m.left < p.right + self.margin:
+                if threat is None or m.bottom > threat.bottom:
+                    threat = m
+        x = p.centerx
+        if threat is not None:
+            left = threat.left - half - self.margin
+            right = threat.right + half + self.margin
+            # vai para o lado mais perto; se não couber na tela, para o outro
+            if left < half or (right <= config.WIDTH - half and abs(right - x) < abs(x - left)):
+                x = right
+            else:
+                x = left
+        x += self.rng.randint(-2, 2)
+        return TickInput(x, self.y, fire)
+
+
+# parado no meio da tela, atirando sem parar
+IDLE_SCRIPT = [(config.WIDTH // 2, config.HEIGHT - 60, True)]
+
+POLICIES = {
+    "random": lambda seed: RandomPolicy(seed),
+    "idle": lambda seed: ScriptedPolicy(IDLE_SCRIPT),
+    "dodge": lambda seed: DodgePolicy(seed),
+}
+
+
+def with_meteor_count(levels, count):
+    # mesmas fases, mas com `count` meteoros em todas (modo "bullet hell")
+    return [dict(lvl, meteor_count=count) for lvl in levels]
+
+
+def make_simulation(seed=None, vectorized=False, meteors=None, pack=None, **sim_kwargs):
+    # vectorized=True usa o armazenamento em arrays do NumPy (entities.py).
+    # As regras são as mesmas, mas o sorteio é do gerador do NumPy: a
+    # mesma semente dá outra partida (o replay guarda qual das duas rodou)
+    # pack: rules.LevelPack com fases, pontuação de vitória e meteoros de vida
+    if pack is not None:
+        sim_kwargs.setdefault("levels", pack.levels)
+        sim_kwargs.setdefault("win_score", pack.win_score)
+        sim_kwargs.setdefault("life_meteor_count", pack.life_meteor_count)
+    if meteors is not None:
+        sim_kwargs["levels"] = with_meteor_count(sim_kwargs.get("levels") or config.LEVELS, meteors)
+    if vectorized:
+        from space_escape.entities import VectorSimulation
+        return VectorSimulation(seed=seed, **sim_kwargs)
+    return Simulation(seed=seed, **sim_kwargs)
+
+
+def run_game(seed=None, policy=None, max_ticks=None, **sim_kwargs):
+    # joga uma partida inteira (ou até max_ticks) e devolve a simulação
+    sim = make_simulation(seed=seed, **sim_kwargs)
+    if policy is None:
+        policy = RandomPolicy(seed)
+    state = sim.state
+    while not state.done and (max_ticks is None or state.tick < max_ticks):
+        sim.step(policy(state))
+    return sim
+
+
+def run_headless(ticks=10000, seed=None, games=1, policy="random", vectorized=False, meteors=None, pack=None):
+    # joga `games` partidas sem janela e imprime o resumo de cada uma
+    total_ticks = 0
+    total_tests = 0
+    rect_hits = mask_hits = 0
+    start = time.perf_counter()
+    for g in range(games):
+        game_seed = None if seed is None else seed + g
+        sim = run_game(game_seed, POLICIES[policy](game_seed), ticks,
+                       vectorized=vectorized, meteors=meteors, pack=pack)
+        state = sim.state
+        total_ticks += state.tick
+        total_tests += sim.narrowphase_total
+        rect_hits += sim.rect_hits
+        mask_hits += sim.mask_hits
+        print(f"jogo {g}: seed={game_seed} ticks={state.tick} pontos={state.score} vidas={state.lives} "
+              f"nivel={state.level_idx + 1} fim={state.game_over_reason}")
+    elapsed = time.perf_counter() - start
+    if elapsed > 0:
+        print(f"{games} jogos, {total_ticks} ticks em {elapsed:.3f}s "
+              f"({total_ticks / elapsed:.0f} ticks/s, {games / elapsed:.1f} jogos/s, "
+              f"{total_tests / max(total_ticks, 1):.1f} testes de colisão/tick)")
+        confirmed = f"{mask_hits} confirmados pela máscara" if config.PIXEL_COLLISION else "sem máscaras"
+        print(f"colisões: {rect_hits} pares pelo retângulo, {confirmed}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Space Escape — simulação headless")
+    parser.add_argument("--ticks", type=int, default=10000, help="máximo de ticks por partida")
+    parser.add_argument("--seed", type=int, default=None, help="semente da primeira partida")
+    parser.add_argument("--games", type=int, default=1, help="quantidade de partidas")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--vectorized", action="store_true", help="usa as entidades em arrays do NumPy "
+                        "(outro gerador aleatório: a mesma semente dá outra partida)")
+    parser.add_argument("--meteors", type=int, default=None, help="quantidade de meteoros em todas as fases")
+    parser.add_argument("--levels", metavar="ARQUIVO", help="pacote de fases (.json ou .toml, ver rules.py)")
+    args = parser.parse_args(argv)
+    try:
+        pack = load_level_pack(args.levels) if args.levels else None
+    except (OSError, LevelPackError) as e:
+        parser.error(str(e))
+    return run_headless(args.ticks, args.seed, args.games, args.policy, args.vectorized, args.meteors, pack)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
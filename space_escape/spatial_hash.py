@@ -0,0 +1,133 @@
+# ----------------------------------------------------------
+# 🗺️ SPATIAL HASH (broadphase de colisão)
+# ----------------------------------------------------------
+# Grade uniforme de células 64x64. Cada célula guarda os índices das
+# entidades que a tocam e, lado a lado, os Rects delas; para testar
+# um retângulo só olhamos as entidades das células que ele cobre, em
+# vez de testar contra todas. O teste dentro da célula é um
+# Rect.collidelistall (em C) sobre a lista de Rects da célula.
+#
+# Os meteoros de uma fase descem todos a mesma distância por tick,
+# então a grade não precisa ser refeita a cada tick: ela fica num
+# referencial que desce junto com eles (shift() acumula o
+# deslocamento) e só quem reaparece lá em cima muda de célula
+# (move()). Refazer tudo (rebuild()) só quando a lista muda de
+# tamanho (troca de fase). Por isso a grade é um dicionário de
+# células, sem limite de linhas.
+#
+# `tests` conta quantos pares chegaram ao teste de retângulo
+# (narrowphase), para medir o ganho em relação ao todos-contra-todos.
+
+CELL_SHIFT = 6  # células de 64x64 (1 << 6)
+# colunas por linha na chave da célula (row * _ROW + col); basta ser
+# maior que qualquer coluna possível
+_ROW = 1 << 16
+
+
+class SpatialHash:
+    def __init__(self, cell_shift=CELL_SHIFT):
+        self.shift_bits = cell_shift
+        # chave da célula -> índices das entidades e os Rects delas, na mesma ordem
+        self.cells = {}
+        self.cell_rects = {}
+        # índice da entidade -> chaves das células onde ela está
+        self.where = {}
+        # id(Rect) -> índice da entidade (move_rect() sem precisar do índice)
+        self.index = {}
+        # quanto todas as entidades desceram desde o rebuild()
+        self.dy = 0
+        # False até o primeiro rebuild() e quando quem usa a grade avisa
+        # que a lista de entidades mudou (ver Simulation.set_level)
+        self.valid = False
+        self.tests = 0
+
+    def _bounds(self, rect):
+        # (c0, c1, r0, r1) das células cobertas pelo rect, no referencial da grade
+        bits = self.shift_bits
+        x = rect.x
+        y = rect.y - self.dy
+        return x >> bits, (x + rect.w - 1) >> bits, y >> bits, (y + rect.h - 1) >> bits
+
+    def _span(self, rect):
+        c0, c1, r0, r1 = self._bounds(rect)
+        if c0 == c1 and r0 == r1:
+            return (r0 * _ROW + c0,)
+        return tuple(r * _ROW + c for r in range(r0, r1 + 1) for c in range(c0, c1 + 1))
+
+    def clear(self):
+        self.cells.clear()
+        self.cell_rects.clear()
+        self.where.clear()
+        self.index.clear()
+        self.dy = 0
+
+    def insert(self, i, rect):
+        span = self._span(rect)
+        cells, cell_rects = self.cells, self.cell_rects
+        for k in span:
+            cell = cells.get(k)
+            if cell is None:
+                cells[k] = [i]
+                cell_rects[k] = [rect]
+            else:
+                cell.append(i)
+                cell_rects[k].append(rect)
+        self.where[i] = span
+
+    def remove(self, i):
+        cells, cell_rects = self.cells, self.cell_rects
+        for k in self.where.pop(i, ()):
+            cell = cells[k]
+            if len(cell) == 1:
+                del cells[k]
+                del cell_rects[k]
+                continue
+            pos = cell.index(i)
+            del cell[pos]
+            del cell_rects[k][pos]
+
+    def move(self, i, rect):
+        # atualização incremental de uma entidade que mudou de lugar
+        self.remove(i)
+        self.insert(i, rect)
+
+    def move_rect(self, rect):
+        # como move(), para quem só tem o Rect (laços sem enumerate)
+        i = self.index[id(rect)]
+        self.remove(i)
+        self.insert(i, rect)
+
+    def shift(self, dy):
+        # todas as entidades desceram dy pixels: a grade desce junto
+        self.dy += dy
+
+    def rebuild(self, rects):
+        self.clear()
+        insert = self.insert
+        index = self.index
+        for i, rect in enumerate(rects):
+            insert(i, rect)
+            index[id(rect)] = i
+        self.valid = True
+
+    def all_hits(self, rect, rects=None):
+        # índices das entidades que colidem com rect (sem repetição, sem
+        # ordem garantida); `rects` fica por compatibilidade com a lista
+        # de alvos de sweep.sweep_hits, a grade já guarda os Rects
+        c0, c1, r0, r1 = self._bounds(rect)
+        cells, cell_rects = self.cells, self.cell_rects
+        hits = []
+        tests = 0
+        for row in range(r0 * _ROW, r1 * _ROW + 1, _ROW):
+            for k in range(row + c0, row + c1 + 1):
+                cell_r = cell_rects.get(k)
+                if cell_r is not None:
+                    tests += len(cell_r)
+                    cell = cells[k]
+                    for p in rect.collidelistall(cell_r):
+                        hits.append(cell[p])
+        self.tests += tests
+        # uma entidade em várias células pode aparecer mais de uma vez
+        if c0 != c1 or r0 != r1:
+            return set(hits)
+        return hits
@@ -0,0 +1,39 @@
+# ----------------------------------------------------------
+# 📦 ESTADO DA PARTIDA
+# ----------------------------------------------------------
+# Só dados: o que a simulação lê e escreve a cada tick (GameState) e
+# a entrada de um tick (TickInput). As regras ficam em simulation.py
+# e o desenho em render.py.
+
+from collections import namedtuple
+
+import pygame
+
+from space_escape import config
+
+# entrada de um tick: posição do cursor e se o jogador atirou
+TickInput = namedtuple("TickInput", "x y fire")
+
+
+class GameState:
+    def __init__(self):
+        self.tick = 0
+        self.score = 0
+        self.lives = config.START_LIVES
+        self.level_idx = 0
+        self.meteor_speed = 0
+        self.player = pygame.Rect((0, 0), config.PLAYER_SIZE)
+        self.player.center = (config.WIDTH // 2, config.HEIGHT - 60)
+        self.meteors = []
+        self.life_meteors = []
+        self.bullets = []
+        self.anim_index = 0
+        self.anim_timer = 0
+        # o primeiro tiro é liberado logo no tick 0
+        self.last_shot_ms = -config.FIRE_COOLDOWN_MS
+        # razão do fim do jogo: None | 'victory' | 'defeat'
+        self.game_over_reason = None
+
+    @property
+    def done(self):
+        return self.game_over_reason is not None
@@ -0,0 +1,89 @@
+# ----------------------------------------------------------
+# 🎯 COLISÃO CONTÍNUA (swept AABB + tempo de impacto)
+# ----------------------------------------------------------
+# Testar só as posições do fim do tick deixa objetos rápidos
+# "atravessarem" um ao outro: se num tick o projétil e o meteoro se
+# cruzam por inteiro, nas duas posições testadas eles não se tocam.
+#
+# Aqui cada par é testado no movimento do tick inteiro. Num
+# referencial que anda junto com o alvo, quem se mexe percorreu
+# (dx, dy) relativos durante o tick; o tempo de impacto (toi, de 0 =
+# começo do tick a 1 = fim) é o primeiro instante em que os dois
+# retângulos se sobrepõem, com a mesma regra de Rect.colliderect
+# (encostar a borda não conta). Quem já se sobrepunha no começo tem
+# toi 0; quem se sobrepõe no fim do tick sempre é achado, então nada
+# que o teste antigo pegava deixa de ser pego.
+#
+# Em lote: todos os "movers" andaram o mesmo deslocamento relativo
+# (os meteoros de uma fase têm todos a mesma velocidade), então a
+# área varrida de cada um é um único Rect (swept_rect) testado em C
+# contra todos os alvos (ou só os vizinhos pela grade, ver
+# spatial_hash.py); só os candidatos passam pelo cálculo exato de
+# toi. sweep_hits() devolve os pares em ordem de tempo de impacto e
+# first_contacts() resolve quem acerta quem: cada um acerta no máximo
+# uma vez por tick, o que chegou antes tem prioridade.
+
+INF = float("inf")
+
+
+def swept_rect(rect, dx, dy):
+    # área coberta por `rect` (posição no fim do tick) vindo de rect - (dx, dy);
+    # exata para movimento num eixo só, uma caixa envolvente nos outros casos
+    swept = rect.move(-dx, -dy)
+    swept.union_ip(rect)
+    return swept
+
+
+def _axis(a0, aw, b0, bw, v):
+    # intervalo de t em que [a0 + v*t, a0 + v*t + aw) sobrepõe [b0, b0 + bw)
+    if v == 0:
+        return (-INF, INF) if a0 < b0 + bw and a0 + aw > b0 else (INF, -INF)
+    t1 = (b0 - aw - a0) / v
+    t2 = (b0 + bw - a0) / v
+    return (t1, t2) if t1 < t2 else (t2, t1)
+
+
+def time_of_impact(a, dx, dy, b):
+    # `a` terminou o tick em a e andou (dx, dy) em relação a `b` (parado
+    # na posição final); devolve o toi em [0, 1] ou None se não se tocam
+    x_in, x_out = _axis(a.x - dx, a.w, b.x, b.w, dx)
+    y_in, y_out = _axis(a.y - dy, a.h, b.y, b.h, dy)
+    t_in = max(x_in, y_in)
+    t_out = min(x_out, y_out)
+    if t_in >= t_out or t_in >= 1 or t_out <= 0:
+        return None
+    return t_in if t_in > 0 else 0.0
+
+
+def sweep_hits(movers, dx, dy, targets, grid=None):
+    # [(toi, i, j)] de todo mover i que encosta no alvo j durante o tick,
+    # em ordem de tempo de impacto (empates: menor i, depois menor j)
+    pairs = []
+    for i, a in enumerate(movers):
+        swept = swept_rect(a, dx, dy)
+        if grid is not None:
+            found = grid.all_hits(swept, targets)
+        else:
+            found = swept.collidelistall(targets)
+        if not found:
+            continue
+        for j in found:
+            toi = time_of_impact(a, dx, dy, targets[j])
+            if toi is not None:
+                pairs.append((toi, i, j))
+    pairs.sort()
+    return pairs
+
+
+def first_contacts(pairs):
+    # em ordem de toi, cada mover e cada alvo participam de um contato só
+    used_movers = set()
+    used_targets = set()
+    contacts = []
+    for toi, i, j in pairs:
+        if i in used_movers or j in used_targets:
+            continue
+        used_movers.add(i)
+        used_targets.add(j)
+        contacts.append((toi, i, j))
+    return contacts
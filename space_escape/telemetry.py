@@ -0,0 +1,447 @@
+# ----------------------------------------------------------
+# 📡 TELEMETRIA (servidor asyncio + cliente de linha de comando)
+# ----------------------------------------------------------
+# Quem opera as máquinas pode acompanhar a partida de fora: o jogo
+# (--telemetry PORTA) abre um servidor TCP local e manda para cada
+# cliente conectado uma linha de JSON por mensagem (NDJSON):
+#   hello     ao conectar: versão, tela, ticks por segundo, fases
+#   snapshot  estado completo (ao conectar e depois de perder mensagens)
+#   tick      o que mudou no tick: tick, score, lives, level, player,
+#             meteors, life_meteors, bullets ([x, y] de cada um) e events
+#   frame     uma vez por segundo: p50/p95/p99 (ms) de cada fase do frame
+#   end       fim da partida: razão, pontos e tick
+# Aplicar os "tick" em cima do último "snapshot" dá o estado atual.
+#
+# O servidor roda num loop asyncio numa thread própria. O loop do jogo
+# só chama publish_*(): sem cliente conectado isso é uma comparação e
+# volta; com cliente, copia os números do tick para uma fila limitada
+# (deque) e acorda a thread da telemetria, que calcula as diferenças, gera
+# o JSON e distribui. Nada aqui bloqueia o jogo:
+#   - fila do jogo cheia (thread atrasada): o tick mais antigo é
+#     descartado (as diferenças são calculadas depois, então nada
+#     fica inconsistente; só some aquele tick);
+#   - fila de um cliente cheia (cliente lento): a mensagem é descartada
+#     e esse cliente recebe um snapshot no lugar do que perdeu.
+#
+# Cliente (também serve de substituto do jogo para testar):
+#     python -m space_escape.telemetry watch --port 8765
+#     python -m space_escape.telemetry serve --port 8765 --policy dodge
+
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from collections import deque
+
+from space_escape import config, simulation
+from space_escape.entities import positions
+from space_escape.profiler import FrameProfiler, percentile
+
+PROTOCOL_VERSION = 1
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# ticks esperando a thread da telemetria (2 s de jogo)
+QUEUE_SIZE = 2 * config.TICK_RATE
+# linhas esperando cada cliente ler
+CLIENT_QUEUE_SIZE = config.TICK_RATE
+# tempo para mandar o que falta (mensagem "end") ao fechar
+CLOSE_TIMEOUT_S = 1.0
+
+
+def encode(msg):
+    return json.dumps(msg, separators=(",", ":")).encode() + b"\n"
+
+
+class _Client:
+    def __init__(self, writer, queue_size):
+        self.writer = writer
+        self.queue = asyncio.Queue(queue_size)
+        # perdeu mensagens: a próxima coisa a receber é um snapshot
+        self.resync = False
+        self.dropped = 0
+
+
+class TelemetryServer:
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, hello=None,
+                 queue_size=QUEUE_SIZE, client_queue_size=CLIENT_QUEUE_SIZE):
+        self.host = host
+        self.port = port
+        self.hello = dict(hello or {}, type="hello", version=PROTOCOL_VERSION)
+        self.client_queue_size = client_queue_size
+        # lido pelo loop do jogo a cada tick, sem lock (só a thread da telemetria escreve)
+        self.clients = 0
+        # contadores: mensagens publicadas, ticks perdidos na fila do jogo
+        # e mensagens perdidas por clientes lentos
+        self.published = 0
+        self.dropped = 0
+        self.client_drops = 0
+        self.connections = 0
+        self._inbox = deque(maxlen=queue_size)
+        self._wake_pending = False
+        self._clients = set()
+        # último valor mandado de cada campo (base das diferenças)
+        self._last = {}
+        self._tick = None
+        # linha do "end", repetida depois de um snapshot de quem a perdeu
+        self._end = None
+        self._loop = None
+        self._server = None
+        self._ready = threading.Event()
+        self.error = None
+        self._thread = threading.Thread(target=self._run, name="telemetry", daemon=True)
+
+    # ------------------------------------------------------
+    # Lado do jogo (thread principal)
+    # ------------------------------------------------------
+    def start(self):
+        # sobe o servidor; OSError (porta ocupada, ...) sai daqui
+        self._thread.start()
+        self._ready.wait()
+        if self.error is not None:
+            raise self.error
+        return self
+
+    def publish_tick(self, state, events):
+        if not self.clients:
+            return
+        self._post("tick", (state.tick, state.score, state.lives, state.level_idx, state.player.topleft,
+                            positions(state.meteors), positions(state.life_meteors),
+                            positions(state.bullets), events))
+
+    def publish_frame(self, profiler):
+        if not self.clients:
+            return
+        # só copia as amostras; os percentis são calculados na outra thread
+        self._post("frame", (profiler.frames, {phase: list(dq) for phase, dq in profiler.samples.items()}))
+
+    def publish_end(self, state):
+        if not self.clients:
+            return
+        self._post("end", (state.tick, state.score, state.game_over_reason))
+
+    def _post(self, kind, data):
+        inbox = self._inbox
+        if len(inbox) == inbox.maxlen:
+            self.dropped += 1
+        inbox.append((kind, data))
+        self.published += 1
+        if not self._wake_pending:
+            self._wake_pending = True
+            self._loop.call_soon_threadsafe(self._drain)
+
+    def close(self):
+        # manda o que falta (até CLOSE_TIMEOUT_S) e encerra a thread
+        if self._loop is None or not self._thread.is_alive():
+            return
+        future = asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop)
+        try:
+            future.result(CLOSE_TIMEOUT_S + 1)
+        except Exception:
+            pass
+        self.clients = 0
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(CLOSE_TIMEOUT_S + 1)
+
+    def summary_line(self):
+        return (f"Telemetria: {self.connections} conexões, {self.published} mensagens, "
+                f"{self.dropped} ticks descartados na fila, {self.client_drops} descartados por clientes lentos")
+
+    # ------------------------------------------------------
+    # Lado da telemetria (thread com o loop asyncio)
+    # ------------------------------------------------------
+    def _run(self):
+        loop = self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            self._server = loop.run_until_complete(asyncio.start_server(self._handle, self.host, self.port))
+        except OSError as e:
+            self.error = e
+            self._ready.set()
+            loop.close()
+            return
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            self.clients = 0
+            self._server.close()
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.close()
+
+    def _drain(self):
+        # o flag volta antes de esvaziar: um tick que chegar agora agenda
+        # outro _drain, nunca fica parado na fila
+        self._wake_pending = False
+        inbox = self._inbox
+        while inbox:
+            kind, data = inbox.popleft()
+            if kind == "tick":
+                msg = self._tick_message(*data)
+            elif kind == "frame":
+                msg = self._frame_message(*data)
+            else:
+                tick, score, reason = data
+                msg = {"type": "end", "tick": tick, "score": score, "reason": reason}
+            line = encode(msg)
+            if kind == "end":
+                self._end = line
+            self._broadcast(line)
+
+    def _tick_message(self, tick, score, lives, level, player, meteors, life_meteors, bullets, events):
+        current = {"score": score, "lives": lives, "level": level, "player": player,
+                   "meteors": meteors, "life_meteors": life_meteors, "bullets": bullets}
+        last = self._last
+        msg = {"type": "tick", "tick": tick}
+        for key, value in current.items():
+            if last.get(key) != value:
+                msg[key] = last[key] = value
+        if events:
+            msg["events"] = events
+        self._tick = tick
+        return msg
+
+    def _frame_message(self, frames, samples):
+        ms = {}
+        for phase, values in samples.items():
+            values.sort()
+            ms[phase] = [round(percentile(values, p) / 1e6, 3) for p in (50, 95, 99)]
+        return {"type": "frame", "frames": frames, "ms": ms}
+
+    def _snapshot(self):
+        return encode(dict(self._last, type="snapshot", tick=self._tick))
+
+    def _broadcast(self, line):
+        for client in self._clients:
+            if client.resync:
+                # já vai receber um snapshot: esta mensagem não precisa ir
+                client.dropped += 1
+                self.client_drops += 1
+                continue
+            try:
+                client.queue.put_nowait(line)
+            except asyncio.QueueFull:
+                # cliente lento: descarta e manda um snapshot quando ele alcançar
+                client.dropped += 1
+                self.client_drops += 1
+                client.resync = True
+
+    async def _handle(self, reader, writer):
+        client = _Client(writer, self.client_queue_size)
+        client.queue.put_nowait(encode(self.hello))
+        if self._last:
+            client.queue.put_nowait(self._snapshot())
+        self._clients.add(client)
+        self.clients = len(self._clients)
+        self.connections += 1
+        loop = asyncio.get_running_loop()
+        sender = loop.create_task(self._send(client, writer))
+        closed = loop.create_task(self._wait_closed(reader))
+        try:
+            await asyncio.wait((sender, closed), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            self._clients.discard(client)
+            self.clients = len(self._clients)
+            sender.cancel()
+            closed.cancel()
+            # espera as duas terminarem e lê o erro de cada uma (conexão
+            # caída etc.), senão o asyncio reclama de exceção nunca lida
+            await asyncio.gather(sender, closed, return_exceptions=True)
+            writer.close()
+
+    async def _wait_closed(self, reader):
+        # o cliente não precisa mandar nada; o que mandar é ignorado
+        try:
+            while await reader.read(4096):
+                pass
+        except ConnectionError:
+            pass
+
+    async def _send(self, client, writer):
+        queue = client.queue
+        try:
+            while True:
+                line = await queue.get()
+                if client.resync:
+                    # o que estava na fila é mais velho que o snapshot
+                    while not queue.empty():
+                        queue.get_nowait()
+                    line = self._snapshot()
+                    if self._end is not None:
+                        line += self._end
+                    client.resync = False
+                writer.write(line)
+                await writer.drain()
+        except ConnectionError:
+            pass
+
+    async def _shutdown(self):
+        self._drain()
+        deadline = time.monotonic() + CLOSE_TIMEOUT_S
+        while any(not c.queue.empty() for c in self._clients) and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        self._server.close()
+        # fecha as conexões: cada _handle termina sozinho
+        for client in self._clients:
+            client.writer.close()
+        while self._clients and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+
+
+def start_server(port, host=DEFAULT_HOST, levels=config.LEVELS):
+    # servidor com o "hello" do jogo; None (e o motivo impresso) se não subir
+    hello = {"width": config.WIDTH, "height": config.HEIGHT, "tick_rate": config.TICK_RATE,
+             "levels": [lvl["name"] for lvl in levels]}
+    try:
+        server = TelemetryServer(host, port, hello).start()
+    except OSError as e:
+        print(f"Telemetria desligada: não abriu {host}:{port} ({e})")
+        return None
+    print(f"Telemetria em {host}:{server.port} (NDJSON)")
+    return server
+
+
+# ----------------------------------------------------------
+# Cliente
+# ----------------------------------------------------------
+class TelemetryMirror:
+    # reconstrói o estado do jogo a partir das mensagens
+    def __init__(self):
+        self.hello = None
+        self.state = {}
+        self.tick = None
+        self.frame = None
+        self.end = None
+        self.snapshots = 0
+        # ticks que não chegaram (descartados em alguma fila)
+        self.missed_ticks = 0
+        self.messages = 0
+
+    def apply(self, msg):
+        self.messages += 1
+        kind = msg.get("type")
+        if kind == "hello":
+            self.hello = msg
+        elif kind == "snapshot":
+            self.snapshots += 1
+            self.state = {k: v for k, v in msg.items() if k not in ("type", "tick")}
+            self.tick = msg["tick"]
+        elif kind == "tick":
+            if self.tick is not None and msg["tick"] > self.tick + 1:
+                self.missed_ticks += msg["tick"] - self.tick - 1
+            self.tick = msg["tick"]
+            for k, v in msg.items():
+                if k not in ("type", "tick", "events"):
+                    self.state[k] = v
+        elif kind == "frame":
+            self.frame = msg
+        elif kind == "end":
+            self.end = msg
+
+    def summary(self):
+        s = self.state
+        line = (f"tick {self.tick}: pontos={s.get('score')} vidas={s.get('lives')} "
+                f"nivel={None if s.get('level') is None else s['level'] + 1} "
+                f"meteoros={len(s.get('meteors', ()))} projéteis={len(s.get('bullets', ()))}")
+        if self.frame and "total" in self.frame["ms"]:
+            p50, p95, p99 = self.frame["ms"]["total"]
+            line += f" frame p50/p95/p99={p50}/{p95}/{p99} ms"
+        return line
+
+
+async def watch(host=DEFAULT_HOST, port=DEFAULT_PORT, raw=False, limit=None, out=sys.stdout):
+    # conecta e acompanha até o fim da partida, `limit` mensagens ou a conexão cair
+    reader, writer = await asyncio.open_connection(host, port)
+    mirror = TelemetryMirror()
+    last_print = 0.0
+    try:
+        while limit is None or mirror.messages < limit:
+            line = await reader.readline()
+            if not line:
+                break
+            msg = json.loads(line)
+            mirror.apply(msg)
+            if raw:
+                out.write(line.decode())
+            elif msg["type"] == "end" or time.monotonic() - last_print >= 1.0:
+                last_print = time.monotonic()
+                print(mirror.summary(), file=out)
+            if mirror.end:
+                break
+    finally:
+        writer.close()
+    if mirror.end and not raw:
+        print(f"fim: {mirror.end['reason']} com {mirror.end['score']} pontos no tick {mirror.end['tick']}", file=out)
+    return mirror
+
+
+def serve(port=DEFAULT_PORT, host=DEFAULT_HOST, seed=None, policy="dodge", ticks=None, realtime=True):
+    # substituto do jogo: partida headless publicando como o jogo com
+    # janela (mesmas mensagens), para testar clientes sem abrir janela
+    sim = simulation.make_simulation(seed=seed)
+    server = start_server(port, host, sim.levels)
+    if server is None:
+        return 1
+    profiler = FrameProfiler()
+    sim.profiler = profiler
+    play = simulation.POLICIES[policy](seed)
+    state = sim.state
+    tick_s = 1 / config.TICK_RATE
+    next_tick = time.perf_counter()
+    try:
+        while not state.done and (ticks is None or state.tick < ticks):
+            profiler.begin_frame()
+            events = sim.step(play(state))
+            server.publish_tick(state, events)
+            profiler.end_frame()
+            if profiler.frames % config.TICK_RATE == 0:
+                server.publish_frame(profiler)
+            if realtime:
+                next_tick += tick_s
+                delay = next_tick - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+        server.publish_end(state)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+    print(server.summary_line())
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Space Escape — telemetria (NDJSON por TCP)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    w = sub.add_parser("watch", help="conecta num jogo (ou no serve) e mostra o estado")
+    w.add_argument("--host", default=DEFAULT_HOST)
+    w.add_argument("--port", type=int, default=DEFAULT_PORT)
+    w.add_argument("--raw", action="store_true", help="imprime as linhas JSON como chegam")
+    w.add_argument("--count", type=int, default=None, help="sai depois de tantas mensagens")
+    s = sub.add_parser("serve", help="partida headless publicando telemetria (substitui o jogo em testes)")
+    s.add_argument("--host", default=DEFAULT_HOST)
+    s.add_argument("--port", type=int, default=DEFAULT_PORT)
+    s.add_argument("--seed", type=int, default=None)
+    s.add_argument("--policy", choices=sorted(simulation.POLICIES), default="dodge")
+    s.add_argument("--ticks", type=int, default=None, help="máximo de ticks da partida")
+    s.add_argument("--fast", action="store_true", help="não espera o tempo real entre ticks")
+    args = parser.parse_args(argv)
+    if args.command == "serve":
+        return serve(args.port, args.host, args.seed, args.policy, args.ticks, realtime=not args.fast)
+    try:
+        asyncio.run(watch(args.host, args.port, args.raw, args.count))
+    except OSError as e:
+        print(f"não conectou em {args.host}:{args.port}: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,74 @@
+# ----------------------------------------------------------
+# 🔤 CACHE DE TEXTOS RENDERIZADOS
+# ----------------------------------------------------------
+# font.render() rasteriza o texto toda vez que é chamado. Os textos
+# do jogo (HUD, títulos, menus, high scores) mudam poucas vezes por
+# minuto, então guardamos a superfície pronta, indexada por
+# (fonte, texto, cor, antialias), num cache LRU de tamanho limitado.
+#
+# HudLabel vai um passo além: lembra o último texto mostrado e só
+# consulta o cache quando o valor muda, então um frame em que
+# pontos/vidas/nível não mudaram não faz nenhuma rasterização.
+
+from collections import OrderedDict
+from functools import lru_cache
+
+import pygame
+
+MAX_CACHED_TEXTS = 256
+
+
+@lru_cache(maxsize=None)
+def get_font(size, name=None):
+    # uma única instância por tamanho (a chave do cache usa a fonte);
+    # o módulo de fontes só é iniciado quando a primeira fonte é pedida
+    if not pygame.font.get_init():
+        pygame.font.init()
+    return pygame.font.Font(name, size)
+
+
+class TextCache:
+    def __init__(self, max_entries=MAX_CACHED_TEXTS):
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, color, antialias)
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surf
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self.surfaces[key] = surf
+        if len(self.surfaces) > self.max_entries:
+            # descarta o usado há mais tempo
+            self.surfaces.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+class HudLabel:
+    def __init__(self, cache, font, color, antialias=True):
+        self.cache = cache
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.text = None
+        self.surface = None
+        # True quando o texto mudou desde o último frame
+        self.dirty = False
+
+    def update(self, text):
+        if text == self.text:
+            self.dirty = False
+            return self.surface
+        self.text = text
+        self.surface = self.cache.render(self.font, text, self.color, self.antialias)
+        self.dirty = True
+        return self.surface
@@ -0,0 +1,45 @@
+# ----------------------------------------------------------
+# ⏲️ PASSO FIXO DE SIMULAÇÃO
+# ----------------------------------------------------------
+# O tempo real de cada frame entra num acumulador e a simulação anda
+# em ticks fixos de TICK_MS enquanto houver tempo acumulado. Assim a
+# velocidade do jogo é a mesma desenhando a 30, 60 ou 144 FPS:
+#
+#     for _ in range(timestep.advance(clock.tick(fps))):
+#         sim.step(...)
+#     view.draw(state, timestep.alpha)
+#
+# `alpha` (0..1) é quanto do próximo tick já passou; quem desenha usa
+# isso para interpolar as posições entre o tick anterior e o atual.
+#
+# Se um frame demorar demais (máquina lenta, janela arrastada), no
+# máximo `max_catchup` ticks são simulados de uma vez e o resto do
+# atraso é descartado; sem esse limite cada frame lento geraria mais
+# ticks, deixando o frame seguinte ainda mais lento ("espiral da morte").
+
+from space_escape import config
+from space_escape.simulation import TICK_MS
+
+
+class FixedTimestep:
+    def __init__(self, tick_ms=TICK_MS, max_catchup=config.MAX_CATCHUP_TICKS):
+        self.tick_ms = tick_ms
+        self.max_catchup = max_catchup
+        self.accumulator = 0.0
+        # ticks que deixaram de ser simulados por causa do limite
+        self.dropped_ticks = 0
+
+    def advance(self, elapsed_ms):
+        # soma o tempo do frame e devolve quantos ticks rodar agora
+        self.accumulator += elapsed_ms
+        ticks = int(self.accumulator // self.tick_ms)
+        if ticks > self.max_catchup:
+            self.dropped_ticks += ticks - self.max_catchup
+            ticks = self.max_catchup
+            self.accumulator = ticks * self.tick_ms + self.accumulator % self.tick_ms
+        self.accumulator -= ticks * self.tick_ms
+        return ticks
+
+    @property
+    def alpha(self):
+        return min(self.accumulator / self.tick_ms, 1.0)
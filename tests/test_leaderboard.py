@@ -0,0 +1,104 @@
+# Leaderboard em SQLite: importação única do highscores.txt, consultas
+# pelos índices e gravação concorrente de duas instâncias em WAL
+import random
+import threading
+
+from space_escape.leaderboard import IMPORTED_PLAYER, Leaderboard
+
+
+def open_board(tmp_path, **kwargs):
+    kwargs.setdefault("import_from", None)
+    return Leaderboard(str(tmp_path / "leaderboard.db"), **kwargs)
+
+
+def query_plan(board, sql, params):
+    return " ".join(row[-1] for row in board.conn.execute("EXPLAIN QUERY PLAN " + sql, params))
+
+
+def test_highscores_txt_imported_once(tmp_path):
+    txt = tmp_path / "highscores.txt"
+    txt.write_text("81\n80\n\nlixo\n62\n")
+    board = open_board(tmp_path, import_from=str(txt))
+    assert board.top_scores(10) == [81, 80, 62]
+    assert {run.player for run in board.top(10)} == {IMPORTED_PLAYER}
+    (key, value), = board.conn.execute("SELECT key, value FROM meta").fetchall()
+    assert key.endswith("highscores.txt") and value == "3"
+    board.close()
+
+    # segunda abertura (mesmo com o arquivo mudado) não importa de novo
+    txt.write_text("81\n80\n62\n99\n")
+    board = open_board(tmp_path, import_from=str(txt))
+    assert board.count() == 3
+    assert board.import_highscores_txt(str(txt)) == 0
+    assert board.count() == 3
+    board.close()
+
+
+def test_top_and_player_queries(tmp_path):
+    board = open_board(tmp_path)
+    rng = random.Random(12)
+    runs = []
+    for k in range(300):
+        player = rng.choice(["ana", "bia", "caio", "davi"])
+        # pontuações repetidas: o desempate é pela data
+        score = rng.randint(0, 60)
+        board.record_run(score, level=score // 10, player=player, created_at=1000.0 + k)
+        runs.append((score, 1000.0 + k, player))
+
+    def expected(rows, n):
+        return [(s, t, p) for s, t, p in sorted(rows, key=lambda r: (-r[0], r[1]))[:n]]
+
+    for n in (1, 5, 50):
+        assert [(r.score, r.created_at, r.player) for r in board.top(n)] == expected(runs, n)
+        for player in ("ana", "davi"):
+            mine = [r for r in runs if r[2] == player]
+            assert [(r.score, r.created_at, r.player) for r in board.player_top(player, n)] == expected(mine, n)
+    assert board.player_best("bia").score == max(s for s, _, p in runs if p == "bia")
+    assert board.player_best("ninguém") is None
+    assert board.count() == 300
+
+    # as duas consultas saem dos índices, sem ordenar a tabela inteira
+    plan = query_plan(board, "SELECT * FROM runs ORDER BY score DESC, created_at LIMIT ?", (5,))
+    assert "runs_by_score" in plan and "TEMP B-TREE" not in plan
+    plan = query_plan(board, "SELECT * FROM runs WHERE player = ? ORDER BY score DESC, created_at LIMIT ?",
+                      ("ana", 5))
+    assert "runs_by_player" in plan and "TEMP B-TREE" not in plan
+    board.close()
+
+
+def test_two_instances_write_under_wal(tmp_path):
+    first = open_board(tmp_path)
+    # aberto antes: o construtor também grava (cria as tabelas)
+    reader = open_board(tmp_path)
+    assert first.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    done = threading.Event()
+
+    def record(player, scores):
+        # cada instância com a sua conexão, aberta na própria thread
+        board = open_board(tmp_path, timeout=10.0)
+        for score in scores:
+            board.record_run(score, player=player)
+        board.close()
+        done.set()
+
+    # a primeira segura o lock de escrita (BEGIN IMMEDIATE); a segunda espera
+    with first._write() as conn:
+        conn.execute("INSERT INTO runs (player, score, created_at) VALUES ('primeira', 10, 1.0)")
+        writer = threading.Thread(target=record, args=("segunda", [20]))
+        writer.start()
+        assert not done.wait(0.2)
+        # leitor não bloqueia: outra conexão lê o banco sem a linha ainda não confirmada
+        assert reader.count() == 0
+    writer.join(10)
+    assert done.is_set()
+    assert sorted(r.player for r in reader.top(10)) == ["primeira", "segunda"]
+
+    # muitas gravações intercaladas de duas instâncias: nenhuma se perde
+    threads = [threading.Thread(target=record, args=(name, range(50))) for name in ("a", "b")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(30)
+    assert first.count() == reader.count() == 102
+    first.close()
+    reader.close()
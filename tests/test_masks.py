@@ -0,0 +1,61 @@
+# Colisão por pixel: retângulos sobrepostos só sobre pixels
+# transparentes não contam; sobre pixels visíveis, contam
+import pytest
+
+from space_escape import config, simulation
+from space_escape.masks import collision_masks
+
+SIMULATIONS = [False, pytest.param(True, id="vectorized")]
+
+
+def transparent_corner(masks):
+    # deslocamento do meteoro em relação à nave em que os retângulos se
+    # sobrepõem bastante, mas nenhum frame do meteoro encosta na nave
+    player, (pox, poy) = masks.player.frames[0]
+    pw, ph = config.PLAYER_SIZE
+    mw, mh = config.METEOR_SIZE
+    for d in range(min(mw, mh) - 1, 0, -1):
+        for dx, dy in ((d - mw, d - mh), (pw - d, d - mh), (d - mw, ph - d), (pw - d, ph - d)):
+            if not any(player.overlap(mask, (dx + ox - pox, dy + oy - poy))
+                       for mask, (ox, oy) in masks.meteor.frames):
+                return dx, dy, d
+    pytest.skip("os sprites não têm canto transparente")
+
+
+def still_simulation(vectorized, pixel_collision):
+    if vectorized:
+        pytest.importorskip("numpy")
+    levels = [{"name": "parado", "meteor_count": 1, "meteor_speed": 0, "threshold": 0}]
+    return simulation.make_simulation(seed=1, vectorized=vectorized, levels=levels, life_meteor_count=0,
+                                      win_score=10 ** 6, pixel_collision=pixel_collision)
+
+
+def touch(vectorized, pixel_collision, dx, dy):
+    sim = still_simulation(vectorized, pixel_collision)
+    player = sim.state.player
+    meteors = sim.state.meteors
+    if isinstance(meteors, list):
+        meteors[0].topleft = (player.x + dx, player.y + dy)
+    else:
+        meteors.x[0], meteors.y[0] = player.x + dx, player.y + dy
+    lives = sim.state.lives
+    events = sim.step(simulation.TickInput(player.centerx, player.centery, False))
+    return lives - sim.state.lives, events
+
+
+@pytest.mark.parametrize("vectorized", SIMULATIONS)
+def test_overlap_on_transparent_pixels_is_rejected(vectorized):
+    dx, dy, depth = transparent_corner(collision_masks())
+    assert depth >= 3
+    # só o retângulo: bateu
+    assert touch(vectorized, False, dx, dy) == (1, ["hit"])
+    # com máscara: os pixels sobrepostos são transparentes, não bateu
+    assert touch(vectorized, True, dx, dy) == (0, [])
+
+
+@pytest.mark.parametrize("vectorized", SIMULATIONS)
+def test_overlap_on_visible_pixels_is_a_hit(vectorized):
+    pw, ph = config.PLAYER_SIZE
+    mw, mh = config.METEOR_SIZE
+    # meteoro no meio da nave
+    assert touch(vectorized, True, (pw - mw) // 2, (ph - mh) // 2) == (1, ["hit"])
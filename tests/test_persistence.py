@@ -0,0 +1,111 @@
+# SaveManager: escrita atômica, snapshots agrupados entre gravações e
+# flush na troca de nível e no close()
+import json
+import os
+import time
+
+import pytest
+
+from space_escape import persistence
+from space_escape.persistence import SaveManager, load_game, write_atomic
+
+# intervalo longo: nada é gravado sozinho durante o teste, só por flush/close
+NEVER = 60.0
+
+
+def snapshot(score, level=0):
+    return dict(score=score, lives=3, level=level, player_x=400, player_y=540)
+
+
+def leftovers(folder):
+    return [name for name in os.listdir(folder) if name.startswith(".save-")]
+
+
+def test_write_atomic_replaces_and_syncs(tmp_path, monkeypatch):
+    path = str(tmp_path / "save.json")
+    synced = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(persistence.os, "fsync", lambda fd: (synced.append(fd), real_fsync(fd)))
+    write_atomic(path, {"score": 1})
+    write_atomic(path, {"score": 2})
+    assert load_game(path) == {"score": 2}
+    assert len(synced) == 2
+    assert leftovers(tmp_path) == []
+
+
+@pytest.mark.parametrize("failure", ["dump", "replace"])
+def test_write_atomic_failure_keeps_old_save(tmp_path, monkeypatch, failure):
+    path = str(tmp_path / "save.json")
+    write_atomic(path, {"score": 1})
+    data = {"score": 2}
+    if failure == "dump":
+        # falha no meio do json.dump: o temporário já tem parte dos dados
+        data["player_x"] = object()
+        error = TypeError
+    else:
+        def broken_replace(src, dst):
+            raise OSError("disco cheio")
+        monkeypatch.setattr(persistence.os, "replace", broken_replace)
+        error = OSError
+    with pytest.raises(error):
+        write_atomic(path, data)
+    assert load_game(path) == {"score": 1}
+    assert leftovers(tmp_path) == []
+
+
+def test_updates_between_writes_are_coalesced(tmp_path):
+    path = str(tmp_path / "save.json")
+    saver = SaveManager(path, interval=NEVER)
+    try:
+        for score in range(5):
+            saver.update(**snapshot(score))
+        saver.flush(wait=True)
+        assert load_game(path) == snapshot(4)
+        assert (saver.saves_written, saver.saves_skipped) == (1, 4)
+
+        # igual ao último gravado: descartado sem tocar no arquivo
+        mtime = os.stat(path).st_mtime_ns
+        saver.update(**snapshot(4))
+        saver.flush(wait=True)
+        assert (saver.saves_written, saver.saves_skipped) == (1, 5)
+        assert os.stat(path).st_mtime_ns == mtime
+    finally:
+        saver.close()
+    assert leftovers(tmp_path) == []
+
+
+def test_level_change_flush_writes_without_waiting_interval(tmp_path):
+    path = str(tmp_path / "save.json")
+    saver = SaveManager(path, interval=NEVER)
+    try:
+        saver.update(**snapshot(10))
+        assert not os.path.exists(path)
+        # como o game.py no evento "level": update + flush sem esperar
+        saver.update(**snapshot(15, level=1))
+        saver.flush()
+        deadline = time.monotonic() + 5
+        while saver.saves_written == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert load_game(path) == snapshot(15, level=1)
+    finally:
+        saver.close()
+
+
+def test_close_writes_pending_snapshot(tmp_path):
+    path = str(tmp_path / "save.json")
+    saver = SaveManager(path, interval=NEVER)
+    saver.update(**snapshot(7))
+    saver.close()
+    assert not saver._thread.is_alive()
+    with open(path) as f:
+        assert json.load(f) == snapshot(7)
+    assert saver.saves_written == 1
+
+
+def test_no_path_writes_nothing(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    saver = SaveManager(None, interval=NEVER)
+    saver.update(**snapshot(3))
+    saver.close()
+    assert os.listdir(tmp_path) == []
+    assert (saver.saves_written, saver.saves_skipped) == (0, 0)
@@ -0,0 +1,93 @@
+# Gravação e replay: codec de varint, ida e volta do .serp e replay
+# rodando de outra pasta
+import os
+import subprocess
+import sys
+
+import pytest
+
+from space_escape import simulation
+from space_escape.replay import (InputRecorder, Replay, ReplayError, _read_varint, _unzigzag,
+                                 _write_varint, _zigzag, verify)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize("n", [0, 1, -1, 2, -2, 63, -64, 64, 127, -128, 800, -800, 2 ** 31 - 1, -2 ** 31])
+def test_zigzag_varint_round_trip(n):
+    z = _zigzag(n)
+    assert z >= 0
+    assert _unzigzag(z) == n
+    out = bytearray()
+    _write_varint(out, z)
+    assert _read_varint(bytes(out) + b"\xff", 0) == (z, len(out))
+
+
+def test_zigzag_small_values_stay_small():
+    # deltas pequenos (para os dois lados) cabem num byte só
+    assert [_zigzag(n) for n in (0, -1, 1, -2, 2)] == [0, 1, 2, 3, 4]
+    for n in range(-64, 64):
+        out = bytearray()
+        _write_varint(out, _zigzag(n))
+        assert len(out) == 1
+
+
+def test_truncated_varint_raises():
+    with pytest.raises(ReplayError):
+        _read_varint(b"\x80\x80", 0)
+
+
+def snapshot(state):
+    return (state.tick, state.score, state.lives, state.level_idx, state.player.topleft,
+            [tuple(r.topleft) for r in state.meteors], [tuple(r.topleft) for r in state.life_meteors],
+            [tuple(r.topleft) for r in state.bullets])
+
+
+def record_game(seed, max_ticks=2000):
+    sim = simulation.make_simulation(seed=seed)
+    policy = simulation.RandomPolicy(seed)
+    recorder = InputRecorder(seed, pixel_collision=sim.masks is not None, sprites=sim.sprites)
+    state = sim.state
+    inputs = []
+    states = []
+    while not state.done and state.tick < max_ticks:
+        inp = policy(state)
+        recorder.record(inp)
+        sim.step(inp)
+        inputs.append(inp)
+        states.append(snapshot(state))
+    recorder.finish(state)
+    return recorder, inputs, states
+
+
+@pytest.mark.parametrize("seed", [1, 7])
+def test_record_encode_decode_reproduces_every_tick(seed):
+    recorder, inputs, states = record_game(seed)
+    replay = Replay(recorder.to_bytes())
+    assert replay.seed == seed
+    assert replay.expected() == recorder.result
+    assert list(replay.inputs()) == inputs
+
+    sim = replay.make_simulation()
+    for inp, expected in zip(replay.inputs(), states):
+        sim.step(inp)
+        assert snapshot(sim.state) == expected
+    assert sim.state.tick == len(states)
+
+    ok, got = verify(replay)
+    assert ok, got
+
+
+def test_replay_verifies_from_another_working_directory(tmp_path):
+    # as máscaras de colisão saem das imagens do projeto: rodar de outra
+    # pasta não pode mudar o resultado da partida
+    recorder, _, _ = record_game(3)
+    path = tmp_path / "partida.serp"
+    recorder.save(str(path))
+    elsewhere = tmp_path / "outra_pasta"
+    elsewhere.mkdir()
+    env = dict(os.environ, PYTHONPATH=ROOT, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    proc = subprocess.run([sys.executable, "-m", "space_escape.replay", str(path)],
+                          cwd=elsewhere, env=env, capture_output=True, text=True, timeout=120)
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+    assert ": ok " in proc.stdout
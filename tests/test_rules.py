@@ -0,0 +1,82 @@
+# Rules (bisect nos thresholds) contra a varredura linear do jogo
+# original, andando a pontuação de vários jeitos pelos pacotes de fases
+import os
+import random
+
+import pytest
+
+from space_escape import simulation
+from space_escape.rules import Rules, load_level_pack
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKS = ["fases/classico.json", "fases/maratona.toml"]
+
+
+def linear_level(levels, score, current):
+    # o maior nível cujo threshold <= score (como o laço do spaceScape.py)
+    level = current
+    for idx in range(len(levels)):
+        if score >= levels[idx]["threshold"]:
+            level = idx
+    return level
+
+
+def walks(pack):
+    thresholds = sorted({lvl["threshold"] for lvl in pack.levels} | {pack.win_score})
+    top = thresholds[-1] + 10
+    yield [1] * top
+    yield [2] * (top // 2)
+    # pulos que atravessam vários thresholds de uma vez
+    yield [t - 1 for t in thresholds[1:]] + [top]
+    yield [thresholds[1] - 1, 1, top]
+    yield [top]
+    rng = random.Random(len(pack.levels))
+    for _ in range(50):
+        yield [rng.choice((1, 1, 1, 2, 3, 7, 15, 40)) for _ in range(40)]
+
+
+@pytest.mark.parametrize("path", PACKS)
+def test_rules_match_linear_scan(path):
+    pack = load_level_pack(os.path.join(ROOT, path))
+    rules = Rules(pack.levels, pack.win_score)
+    for steps in walks(pack):
+        score = 0
+        level = expected_level = 0
+        for points in steps:
+            score += points
+            level, won = rules.on_score(score, level)
+            expected_level = linear_level(pack.levels, score, expected_level)
+            assert level == expected_level, (path, score)
+            assert won == (score >= pack.win_score), (path, score)
+
+
+@pytest.mark.parametrize("path", PACKS)
+def test_every_score_matches_linear_scan(path):
+    pack = load_level_pack(os.path.join(ROOT, path))
+    rules = Rules(pack.levels, pack.win_score)
+    for current in range(len(pack.levels)):
+        for score in range(-5, pack.win_score + 20):
+            assert rules.level_for(score, current) == linear_level(pack.levels, score, current)
+
+
+def test_unsorted_and_repeated_thresholds():
+    levels = [{"threshold": 20}, {"threshold": 0}, {"threshold": 10}, {"threshold": 10}, {"threshold": 5}]
+    rules = Rules(levels, 100)
+    for current in range(len(levels)):
+        for score in range(-3, 30):
+            assert rules.level_for(score, current) == linear_level(levels, score, current)
+
+
+@pytest.mark.parametrize("path", PACKS)
+def test_simulation_jumps_levels_and_wins(path):
+    pack = load_level_pack(os.path.join(ROOT, path))
+    sim = simulation.make_simulation(seed=1, pack=pack)
+    events = []
+    # um pulo só da fase 0 até a última
+    sim.add_score(pack.levels[-1]["threshold"], events)
+    assert sim.state.level_idx == len(pack.levels) - 1
+    assert events == ["level"]
+    assert sim.state.meteor_speed == pack.levels[-1]["meteor_speed"]
+    sim.add_score(pack.win_score, events)
+    assert sim.state.game_over_reason == "victory"
+    assert events == ["level", "victory"]
@@ -0,0 +1,74 @@
+# A grade (spatial_hash.py) acha os mesmos pares que o teste de todos
+# contra todos, com menos testes de retângulo
+import random
+
+import pygame
+import pytest
+
+from space_escape import simulation
+from space_escape.spatial_hash import SpatialHash
+from space_escape.sweep import sweep_hits
+
+
+def random_rects(rng, count, size, top=-200):
+    return [pygame.Rect(rng.randint(-20, 780), rng.randint(top, 600), *size) for _ in range(count)]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_grid_finds_same_pairs_as_brute_force(seed):
+    rng = random.Random(seed)
+    targets = random_rects(rng, 400, (40, 40))
+    movers = random_rects(rng, 200, (6, 12), top=0)
+    grid = SpatialHash()
+    grid.rebuild(targets)
+    for _ in range(20):
+        # os alvos descem juntos e alguns reaparecem lá em cima
+        speed = rng.randint(1, 30)
+        grid.shift(speed)
+        for t in targets:
+            t.y += speed
+            if t.y > 600:
+                t.topleft = (rng.randint(0, 760), rng.randint(-200, -40))
+                grid.move_rect(t)
+        dy = -rng.randint(1, 60)
+        grid.tests = 0
+        assert sweep_hits(movers, 0, dy, targets, grid) == sweep_hits(movers, 0, dy, targets)
+        assert grid.tests < len(movers) * len(targets)
+
+
+def test_move_keeps_cells_consistent():
+    grid = SpatialHash()
+    rects = [pygame.Rect(0, 0, 40, 40), pygame.Rect(30, 30, 40, 40)]
+    grid.rebuild(rects)
+    probe = pygame.Rect(35, 35, 2, 2)
+    assert sorted(grid.all_hits(probe)) == [0, 1]
+    rects[0].topleft = (500, 500)
+    grid.move(0, rects[0])
+    assert list(grid.all_hits(probe)) == [1]
+    assert list(grid.all_hits(pygame.Rect(510, 510, 2, 2))) == [0]
+
+
+def snapshot(state):
+    return (state.tick, state.score, state.lives, state.level_idx, list(map(tuple, state.meteors)),
+            list(map(tuple, state.life_meteors)), list(map(tuple, state.bullets)))
+
+
+def test_simulation_same_game_with_and_without_grid():
+    games = []
+    for grid_min in (0, 10 ** 9):
+        sim = simulation.make_simulation(seed=4, meteors=300, win_score=10 ** 6, life_meteor_count=300,
+                                         grid_min_meteors=grid_min, fire_cooldown_ms=0)
+        sim.state.lives = 10 ** 6
+        policy = simulation.RandomPolicy(4)
+        rng = random.Random(4)
+        states = []
+        for _ in range(300):
+            for _ in range(3):
+                sim.spawn_bullet(rng.randint(0, 790), rng.randint(100, 590))
+            sim.step(policy(sim.state))
+            states.append(snapshot(sim.state))
+        games.append((states, sim.narrowphase_total, sim.meteor_grid.valid))
+    (with_grid, grid_tests, used), (brute, brute_tests, unused) = games
+    assert used and not unused
+    assert with_grid == brute
+    assert grid_tests < brute_tests / 10
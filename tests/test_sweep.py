@@ -0,0 +1,123 @@
+# Colisão contínua: ordem por tempo de impacto, nada atravessa nada em
+# alta velocidade e o toi em lote do NumPy bate com o escalar
+import random
+
+import pygame
+import pytest
+
+from space_escape import config, simulation
+from space_escape.sweep import first_contacts, sweep_hits, time_of_impact
+
+SIMULATIONS = [False, pytest.param(True, id="vectorized")]
+
+
+def test_time_of_impact():
+    target = pygame.Rect(0, 0, 40, 40)
+    # veio de baixo (y 100) subindo 100: encosta quando o topo passa de 40
+    assert time_of_impact(pygame.Rect(10, 0, 6, 12), 0, -100, target) == pytest.approx(0.6)
+    # já sobreposto no começo do tick
+    assert time_of_impact(pygame.Rect(10, 10, 6, 12), 0, 0, target) == 0.0
+    # encostar a borda não conta (como Rect.colliderect)
+    assert time_of_impact(pygame.Rect(40, 0, 6, 12), 0, 0, target) is None
+    assert time_of_impact(pygame.Rect(10, 68, 6, 12), 0, 10, pygame.Rect(0, 80, 40, 40)) is None
+    # atravessou por inteiro durante o tick (topo de 100 a 40: 60 de 200)
+    assert time_of_impact(pygame.Rect(10, -100, 6, 12), 0, -200, target) == pytest.approx(60 / 200)
+
+
+def test_sweep_hits_in_time_of_impact_order():
+    targets = [pygame.Rect(0, 0, 40, 40), pygame.Rect(100, 0, 40, 40)]
+    # fim do tick: o mais distante primeiro na lista, para a ordem não ser a dos índices
+    movers = [pygame.Rect(10, 20, 6, 12), pygame.Rect(110, -20, 6, 12), pygame.Rect(10, 0, 6, 12)]
+    pairs = sweep_hits(movers, 0, -100, targets)
+    assert [(i, j) for _, i, j in pairs] == [(1, 1), (2, 0), (0, 0)]
+    assert [toi for toi, _, _ in pairs] == sorted(toi for toi, _, _ in pairs)
+    # cada alvo vai para quem chegou primeiro
+    assert [(i, j) for _, i, j in first_contacts(pairs)] == [(1, 1), (2, 0)]
+
+
+def test_sweep_hits_ties_by_index():
+    targets = [pygame.Rect(0, 0, 40, 40), pygame.Rect(0, 0, 40, 40)]
+    movers = [pygame.Rect(10, 10, 6, 12), pygame.Rect(20, 10, 6, 12)]
+    pairs = sweep_hits(movers, 0, 0, targets)
+    assert [(i, j) for _, i, j in pairs] == [(0, 0), (0, 1), (1, 0), (1, 1)]
+    assert [(i, j) for _, i, j in first_contacts(pairs)] == [(0, 0), (1, 1)]
+
+
+def fast_simulation(vectorized, meteor_speed, pixel_collision=False):
+    if vectorized:
+        pytest.importorskip("numpy")
+    levels = [{"name": "rápido", "meteor_count": 1, "meteor_speed": meteor_speed, "threshold": 0}]
+    return simulation.make_simulation(seed=1, vectorized=vectorized, levels=levels, life_meteor_count=0,
+                                      win_score=10 ** 6, pixel_collision=pixel_collision)
+
+
+def place(group, i, x, y):
+    if isinstance(group, list):
+        group[i].topleft = (x, y)
+    else:
+        group.x[i], group.y[i] = x, y
+
+
+@pytest.mark.parametrize("pixel_collision", [False, True])
+@pytest.mark.parametrize("vectorized", SIMULATIONS)
+def test_fast_meteor_does_not_tunnel_through_bullet(vectorized, pixel_collision):
+    sim = fast_simulation(vectorized, 60, pixel_collision)
+    state = sim.state
+    # meteoro 100..140 desce 60, projétil 150..162 sobe 12: no fim do
+    # tick o projétil (138..150) está inteiro acima do meteoro (160..200)
+    place(state.meteors, 0, 100, 100)
+    sim.spawn_bullet(117, 150)
+    events = sim.step(simulation.TickInput(700, 550, False))
+    assert events.count("kill") == 1
+    assert len(state.bullets) == 0
+
+
+@pytest.mark.parametrize("pixel_collision", [False, True])
+@pytest.mark.parametrize("vectorized", SIMULATIONS)
+def test_fast_meteor_does_not_tunnel_through_ship(vectorized, pixel_collision):
+    sim = fast_simulation(vectorized, 250, pixel_collision)
+    state = sim.state
+    sim.step(simulation.TickInput(400, 300, False))
+    lives = state.lives
+    # nave 270..330; meteoro 120..160 desce 250 e termina em 370..410
+    place(state.meteors, 0, 380, 120)
+    events = sim.step(simulation.TickInput(400, 300, False))
+    assert "hit" in events
+    assert state.lives == lives - 1
+
+
+@pytest.mark.parametrize("vectorized", SIMULATIONS)
+def test_first_bullet_to_arrive_gets_the_meteor(vectorized):
+    sim = fast_simulation(vectorized, 120)
+    state = sim.state
+    place(state.meteors, 0, 100, 100)
+    # o projétil de índice 0 chega depois: o de índice 1 leva o meteoro
+    sim.spawn_bullet(110, 230)
+    sim.spawn_bullet(110, 200)
+    events = sim.step(simulation.TickInput(700, 550, False))
+    assert events.count("kill") == 1
+    assert [tuple(b.topleft) for b in state.bullets] == [(110, 230 - config.BULLET_SPEED)]
+
+
+def test_vectorized_toi_matches_scalar():
+    np = pytest.importorskip("numpy")
+    from space_escape.entities import _toi
+
+    rng = random.Random(7)
+    for _ in range(200):
+        dx = rng.choice((0, rng.randint(-150, 150)))
+        dy = rng.choice((0, rng.randint(-150, 150)))
+        a = [pygame.Rect(rng.randint(0, 300), rng.randint(0, 300), rng.randint(1, 80), rng.randint(1, 80))
+             for _ in range(20)]
+        b = [pygame.Rect(rng.randint(0, 300), rng.randint(0, 300), rng.randint(1, 80), rng.randint(1, 80))
+             for _ in range(20)]
+        cols = [np.array([getattr(r, k) for r in a])[:, None] for k in "xywh"]
+        rows = [np.array([getattr(r, k) for r in b])[None, :] for k in "xywh"]
+        got = _toi(*cols, *rows, dx, dy)
+        for i, ra in enumerate(a):
+            for j, rb in enumerate(b):
+                toi = time_of_impact(ra, dx, dy, rb)
+                if toi is None:
+                    assert got[i, j] == np.inf, (ra, rb, dx, dy)
+                else:
+                    assert got[i, j] == pytest.approx(toi, abs=1e-12), (ra, rb, dx, dy)
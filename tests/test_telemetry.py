@@ -0,0 +1,119 @@
+# Integração do servidor de telemetria com o cliente do próprio módulo
+import asyncio
+import io
+import json
+import socket
+import threading
+import time
+
+from space_escape import simulation
+from space_escape.entities import positions
+from space_escape.telemetry import TelemetryMirror, TelemetryServer, watch
+
+
+def endless_simulation(seed, meteors=None):
+    # partida que não termina sozinha: quem decide o fim é o teste
+    sim = simulation.make_simulation(seed=seed, meteors=meteors, win_score=10 ** 9)
+    sim.state.lives = 10 ** 6
+    return sim, simulation.RandomPolicy(seed)
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "tempo esgotado"
+        time.sleep(0.005)
+
+
+def expected_state(state):
+    return {"score": state.score, "lives": state.lives, "level": state.level_idx,
+            "player": list(state.player.topleft),
+            "meteors": [list(p) for p in positions(state.meteors)],
+            "life_meteors": [list(p) for p in positions(state.life_meteors)],
+            "bullets": [list(p) for p in positions(state.bullets)]}
+
+
+def test_hello_deltas_and_end():
+    server = TelemetryServer(port=0, hello={"levels": ["Nível 1"]}).start()
+    out = io.StringIO()
+    result = {}
+    client = threading.Thread(target=lambda: result.update(mirror=asyncio.run(
+        watch(port=server.port, raw=True, out=out))))
+    client.start()
+    try:
+        wait_for(lambda: server.clients == 1)
+        sim, policy = endless_simulation(3)
+        state = sim.state
+        for _ in range(300):
+            server.publish_tick(state, sim.step(policy(state)))
+            time.sleep(0.0005)
+        server.publish_end(state)
+        client.join(10)
+        assert not client.is_alive()
+    finally:
+        server.close()
+
+    messages = [json.loads(line) for line in out.getvalue().splitlines()]
+    hello = messages[0]
+    assert hello["type"] == "hello" and hello["version"] == 1 and hello["levels"] == ["Nível 1"]
+    ticks = [m for m in messages if m["type"] == "tick"]
+    # o primeiro tick traz todos os campos; depois só o que mudou
+    assert set(expected_state(state)) <= set(ticks[0])
+    assert any("lives" not in m for m in ticks[1:])
+    assert any("score" not in m for m in ticks[1:])
+    assert [m["tick"] for m in ticks] == sorted(m["tick"] for m in ticks)
+
+    mirror = result["mirror"]
+    assert mirror.state == expected_state(state)
+    assert mirror.tick == state.tick
+    assert mirror.end == {"type": "end", "tick": state.tick, "score": state.score, "reason": None}
+    assert messages[-1]["type"] == "end"
+
+
+def test_slow_client_is_dropped_and_resynced():
+    server = TelemetryServer(port=0, client_queue_size=4).start()
+    sock = socket.socket()
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    sock.connect(("127.0.0.1", server.port))
+    try:
+        wait_for(lambda: server.clients == 1)
+        # o cliente não lê nada até o servidor começar a descartar
+        sim, policy = endless_simulation(5, meteors=300)
+        state = sim.state
+        for _ in range(20000):
+            server.publish_tick(state, sim.step(policy(state)))
+            time.sleep(0.0005)
+            if server.client_drops:
+                break
+        assert server.client_drops > 0
+        for _ in range(50):
+            server.publish_tick(state, sim.step(policy(state)))
+        server.publish_end(state)
+
+        mirror = TelemetryMirror()
+        with sock.makefile("rb") as stream:
+            for line in stream:
+                mirror.apply(json.loads(line))
+                if mirror.end:
+                    break
+    finally:
+        sock.close()
+        server.close()
+
+    assert mirror.hello["type"] == "hello"
+    assert mirror.snapshots >= 1
+    # mesmo perdendo mensagens, o estado final bate com a simulação
+    assert mirror.state == expected_state(state)
+    assert mirror.end["tick"] == state.tick
+
+
+def test_disconnect_is_noticed():
+    server = TelemetryServer(port=0).start()
+    try:
+        sock = socket.create_connection(("127.0.0.1", server.port))
+        wait_for(lambda: server.clients == 1)
+        sock.close()
+        wait_for(lambda: server.clients == 0)
+        assert server.connections == 1
+    finally:
+        server.close()
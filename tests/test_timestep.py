@@ -0,0 +1,59 @@
+# FixedTimestep: limite de ticks num frame longo, alpha de
+# interpolação e a mesma quantidade de ticks a qualquer FPS
+import random
+
+import pytest
+
+from space_escape.simulation import TICK_MS
+from space_escape.timestep import FixedTimestep
+
+
+def run(frames, **kwargs):
+    timestep = FixedTimestep(**kwargs)
+    return [timestep.advance(ms) for ms in frames], timestep
+
+
+def test_long_frame_is_capped():
+    timestep = FixedTimestep(tick_ms=10, max_catchup=5)
+    # 12 ticks de atraso: roda 5, descarta 7 e guarda só a fração
+    assert timestep.advance(123) == 5
+    assert timestep.dropped_ticks == 7
+    assert timestep.accumulator == pytest.approx(3)
+    # o frame seguinte não herda o atraso descartado
+    assert timestep.advance(10) == 1
+    assert timestep.dropped_ticks == 7
+    # exatamente no limite não descarta nada
+    assert timestep.advance(47) == 5
+    assert timestep.dropped_ticks == 7
+
+
+def test_alpha_is_fraction_of_next_tick():
+    timestep = FixedTimestep(tick_ms=10, max_catchup=5)
+    assert timestep.alpha == 0.0
+    assert [timestep.advance(4) for _ in range(3)] == [0, 0, 1]
+    assert timestep.alpha == pytest.approx(0.2)
+    timestep.advance(5)
+    assert timestep.alpha == pytest.approx(0.7)
+    timestep.advance(3)
+    assert timestep.alpha == 0.0
+
+
+def test_same_ticks_for_any_frame_rate():
+    # ~2 s a ~30, 60 e 144 FPS (clock.tick devolve ms inteiros); o total
+    # fica longe da borda de um tick para o arredondamento não contar
+    total_ms = 2008
+    rng = random.Random(4)
+    sequences = []
+    for fps in (30, 60, 144):
+        frames = []
+        while sum(frames) < total_ms:
+            frames.append(min(round(1000 / fps + rng.uniform(-2, 2)), total_ms - sum(frames)))
+        sequences.append(frames)
+    counts = set()
+    for frames in sequences:
+        ticks, timestep = run(frames)
+        assert timestep.dropped_ticks == 0
+        counts.add(sum(ticks))
+        # mesma sequência de frames, mesmos ticks em cada frame
+        assert run(frames)[0] == ticks
+    assert counts == {int(total_ms // TICK_MS)}